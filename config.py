@@ -34,10 +34,25 @@ class IronCondorConfig(StrategyConfig):
     short_delta_target: float = 0.12
     wing_width_percent: float = 0.05
     currencies: List[str] = None
+    # Condor grid (empty = single short_delta_target / wing_width_percent / expiry)
+    short_delta_grid: List[float] = None
+    wing_width_grid: List[float] = None
+    rank_by: str = "credit_to_max_loss"
+    # Fetch tickers for strikes within this |delta| of the short target (+ wings)
+    # instead of the one-request book summary chain; 0 = summary chain (default)
+    delta_band: float = 0.0
+    # Currencies scanned in parallel (1 = one after another)
+    scan_max_workers: int = 4
+    # Fill the IV history window from Deribit DVOL candles at startup
+    iv_backfill: bool = True
 
     def __post_init__(self):
         if self.currencies is None:
             self.currencies = ["BTC", "ETH"]
+        if self.short_delta_grid is None:
+            self.short_delta_grid = []
+        if self.wing_width_grid is None:
+            self.wing_width_grid = []
 
 
 @dataclass
@@ -58,6 +73,11 @@ class SmartMoneyConfig(StrategyConfig):
     leverage_max: int = 5
 
 
+def _float_list(value: str) -> List[float]:
+    """Parse a comma separated list of floats ("" -> [])"""
+    return [float(v) for v in value.split(",") if v.strip()]
+
+
 class Config:
     """Global configuration class"""
 
@@ -65,11 +85,29 @@ class Config:
     DERIBIT_API_KEY = os.getenv("DERIBIT_API_KEY", "")
     DERIBIT_API_SECRET = os.getenv("DERIBIT_API_SECRET", "")
     DERIBIT_ENV = os.getenv("DERIBIT_ENV", "test")
+    DERIBIT_HTTP_POOL_SIZE = int(os.getenv("DERIBIT_HTTP_POOL_SIZE", 10))
+    DERIBIT_TRANSPORT = os.getenv("DERIBIT_TRANSPORT", "rest")
+    # Override the API URL, e.g. a replay server from scripts/fake_deribit.py
+    DERIBIT_BASE_URL = os.getenv("DERIBIT_BASE_URL", "")
+
+    # Market data streaming (WebSocket subscriptions with REST fallback)
+    MARKET_DATA_STREAMING = os.getenv("MARKET_DATA_STREAMING", "false").lower() == "true"
+    MARKET_DATA_MAX_AGE = float(os.getenv("MARKET_DATA_MAX_AGE", 5.0))
+
+    # Equity/marks fetched once per bot cycle and shared while younger than this (0 = always live)
+    SNAPSHOT_MAX_AGE_SECONDS = float(os.getenv("SNAPSHOT_MAX_AGE_SECONDS", 10.0))
+
+    # IV history files (one per currency)
+    IV_HISTORY_DIR = os.getenv("IV_HISTORY_DIR", "data")
 
     # Logging
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_FILE = "logs/trading_bot.log"
 
+    # Request metrics (per-endpoint latency/errors), dumped periodically as JSON
+    METRICS_FILE = os.getenv("METRICS_FILE", "logs/metrics.json")
+    METRICS_DUMP_INTERVAL_MINUTES = int(os.getenv("METRICS_DUMP_INTERVAL_MINUTES", 5))
+
     # Schedule
     DAILY_SCAN_TIME = os.getenv("DAILY_SCAN_TIME", "10:00")
     MONITORING_INTERVAL_MINUTES = int(os.getenv("MONITORING_INTERVAL_MINUTES", 5))
@@ -96,7 +134,13 @@ class Config:
                 max_dte=int(os.getenv("MAX_DTE", 10)),
                 min_iv_percentile=float(os.getenv("MIN_IV_PERCENTILE", 30)),
                 short_delta_target=float(os.getenv("SHORT_DELTA_TARGET", 0.12)),
-                wing_width_percent=float(os.getenv("WING_WIDTH_PERCENT", 0.05))
+                wing_width_percent=float(os.getenv("WING_WIDTH_PERCENT", 0.05)),
+                short_delta_grid=_float_list(os.getenv("SHORT_DELTA_GRID", "")),
+                wing_width_grid=_float_list(os.getenv("WING_WIDTH_GRID", "")),
+                rank_by=os.getenv("CONDOR_RANK_BY", "credit_to_max_loss"),
+                delta_band=float(os.getenv("DELTA_BAND", 0)),
+                scan_max_workers=int(os.getenv("SCAN_MAX_WORKERS", 4)),
+                iv_backfill=os.getenv("IV_BACKFILL", "true").lower() == "true"
             ))
 
         # Smart Money
@@ -126,6 +170,10 @@ class Config:
             errors.append("DERIBIT_API_SECRET is required")
         if cls.DERIBIT_ENV not in ["test", "prod"]:
             errors.append("DERIBIT_ENV must be 'test' or 'prod'")
+        if cls.DERIBIT_TRANSPORT not in ["rest", "ws"]:
+            errors.append("DERIBIT_TRANSPORT must be 'rest' or 'ws'")
+        if cls.SNAPSHOT_MAX_AGE_SECONDS < 0:
+            errors.append("SNAPSHOT_MAX_AGE_SECONDS must not be negative")
 
         # Validate strategies
         cls.load_strategies()
@@ -136,6 +184,13 @@ class Config:
             if isinstance(strategy, IronCondorConfig):
                 if strategy.initial_equity <= 0:
                     errors.append("Iron Condor: INITIAL_EQUITY must be positive")
+                if strategy.rank_by not in ["credit_to_max_loss", "credit_per_delta", "expected_value"]:
+                    errors.append("Iron Condor: CONDOR_RANK_BY must be 'credit_to_max_loss', "
+                                  "'credit_per_delta' or 'expected_value'")
+                if strategy.delta_band < 0:
+                    errors.append("Iron Condor: DELTA_BAND must not be negative")
+                if strategy.scan_max_workers < 1:
+                    errors.append("Iron Condor: SCAN_MAX_WORKERS must be at least 1")
             elif isinstance(strategy, SmartMoneyConfig):
                 pass
 
@@ -153,6 +208,9 @@ class Config:
         print("CONFIGURATION")
         print("=" * 60)
         print(f"Environment: {cls.DERIBIT_ENV}")
+        print(f"Transport: {cls.DERIBIT_TRANSPORT}")
+        if cls.DERIBIT_BASE_URL:
+            print(f"Base URL: {cls.DERIBIT_BASE_URL}")
         print(f"Active Strategies: {len(cls.STRATEGIES)}")
         
         for strategy in cls.STRATEGIES:
@@ -160,6 +218,10 @@ class Config:
             if isinstance(strategy, IronCondorConfig):
                 print(f"  Risk per Condor: {strategy.risk_per_condor:.1%}")
                 print(f"  Max Portfolio Risk: {strategy.max_portfolio_risk:.1%}")
+                if strategy.short_delta_grid or strategy.wing_width_grid:
+                    print(f"  Condor Grid: deltas {strategy.short_delta_grid or [strategy.short_delta_target]} "
+                          f"x wings {strategy.wing_width_grid or [strategy.wing_width_percent]} "
+                          f"(rank by {strategy.rank_by})")
             elif isinstance(strategy, SmartMoneyConfig):
                 print(f"  Time Window: {strategy.time_window_start}:00 - {strategy.time_window_end}:00")
                 print(f"  Whale Min Value: ${strategy.whale_min_value:,.0f}")
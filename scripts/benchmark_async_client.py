@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Benchmark sequential DeribitClient vs concurrent AsyncDeribitClient fan-out"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import logging
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.deribit_client import DeribitClient
+from src.core.async_deribit_client import AsyncDeribitClient
+from fake_deribit import FakeDeribitServer
+
+logging.basicConfig(level=logging.WARNING)
+
+CURRENCIES = ["BTC", "ETH"]
+
+
+def instrument_names(per_currency: int):
+    """Synthetic chain: per_currency strikes for each currency"""
+    return [f"{c}-27DEC24-{1000 + i * 100}-{'C' if i % 2 else 'P'}"
+            for c in CURRENCIES for i in range(per_currency)]
+
+
+def bench_sequential(url: str, names) -> float:
+    client = DeribitClient("key", "secret", base_url=url)
+    try:
+        start = time.perf_counter()
+        for currency in CURRENCIES:
+            client.get_index_price(currency)
+        for name in names:
+            client.get_order_book(name)
+        return time.perf_counter() - start
+    finally:
+        client.close()
+
+
+async def bench_concurrent(url: str, names, concurrency: int) -> float:
+    async with AsyncDeribitClient("key", "secret", base_url=url, max_concurrency=concurrency) as client:
+        start = time.perf_counter()
+        await asyncio.gather(
+            client.gather_index_prices(CURRENCIES),
+            client.gather_order_books(names)
+        )
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--strikes", type=int, default=200, help="Order books per currency")
+    parser.add_argument("--latency", type=float, default=0.02, help="Server-side latency (s)")
+    parser.add_argument("--concurrency", type=int, default=20, help="Async semaphore size")
+    args = parser.parse_args()
+
+    names = instrument_names(args.strikes)
+
+    with FakeDeribitServer(latency=args.latency) as server:
+        sequential = bench_sequential(server.url, names)
+        concurrent = asyncio.run(bench_concurrent(server.url, names, args.concurrency))
+
+    total = len(names) + len(CURRENCIES)
+    print("=" * 60)
+    print(f"BTC+ETH SCAN FAN-OUT ({total} requests, {args.latency * 1000:.0f}ms server latency)")
+    print("=" * 60)
+    print(f"Sequential DeribitClient:      {sequential:7.2f}s")
+    print(f"AsyncDeribitClient (x{args.concurrency:<3}):     {concurrent:7.2f}s")
+    print(f"Speedup:                       {sequential / concurrent:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
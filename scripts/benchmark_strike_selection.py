@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark list-based vs vectorized strike selection in IronCondorBuilder"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.options_chain import OptionsChain
+from src.strategies.iron_condor import IronCondorBuilder
+
+SPOT = 50000.0
+
+
+def synthetic_chain(n_strikes: int, seed: int):
+    """n_strikes calls and puts around SPOT with smooth deltas"""
+    rng = random.Random(seed)
+    options = []
+    for i in range(n_strikes):
+        strike = SPOT * 0.5 + i * (SPOT / n_strikes)
+        call_delta = max(0.001, min(0.999, 0.5 - (strike - SPOT) / SPOT * 2 + rng.uniform(-0.01, 0.01)))
+        for option_type, delta in (("call", call_delta), ("put", call_delta - 1.0)):
+            options.append({
+                "instrument_name": f"BTC-BENCH-{strike:.0f}-{option_type[0].upper()}",
+                "strike": strike,
+                "option_type": option_type,
+                "mark_price": abs(delta) * 0.1,
+                "greeks": {"delta": delta}
+            })
+    return options
+
+
+def select_with_lists(builder: IronCondorBuilder, options):
+    short_put = builder.find_strike_by_delta(options, -builder.short_delta_target, "put")
+    short_call = builder.find_strike_by_delta(options, builder.short_delta_target, "call")
+    long_put = builder.find_protective_strike(options, short_put["strike"], "put", SPOT)
+    long_call = builder.find_protective_strike(options, short_call["strike"], "call", SPOT)
+    return [short_put, short_call, long_put, long_call]
+
+
+def select_with_arrays(builder: IronCondorBuilder, chain: OptionsChain):
+    short_put = chain.option(builder.select_short_strike(chain, -builder.short_delta_target, "put"))
+    short_call = chain.option(builder.select_short_strike(chain, builder.short_delta_target, "call"))
+    long_put = chain.option(builder.select_wing_strike(chain, short_put["strike"], "put", SPOT))
+    long_call = chain.option(builder.select_wing_strike(chain, short_call["strike"], "call", SPOT))
+    return [short_put, short_call, long_put, long_call]
+
+
+def timed(func, *args, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(*args)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-s", "--strikes", type=int, default=2000, help="Strikes per chain")
+    parser.add_argument("-r", "--repeat", type=int, default=200, help="Selections per run")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    options = synthetic_chain(args.strikes, args.seed)
+    builder = IronCondorBuilder(short_delta_target=0.12, wing_width_percent=0.05)
+
+    chain = OptionsChain.from_dicts(options)
+    names = [o["instrument_name"] for o in select_with_lists(builder, options)]
+    if names != [o["instrument_name"] for o in select_with_arrays(builder, chain)]:
+        raise SystemExit("Vectorized selection differs from the list-based builder")
+
+    lists = timed(select_with_lists, builder, options, repeat=args.repeat)
+    arrays = timed(select_with_arrays, builder, chain, repeat=args.repeat)
+    build = timed(OptionsChain.from_dicts, options, repeat=args.repeat)
+
+    print("=" * 60)
+    print(f"STRIKE SELECTION ({args.strikes} strikes, {len(options)} options, 4 legs)")
+    print("=" * 60)
+    print(f"List-based builder:        {lists * 1000:8.3f} ms")
+    print(f"Vectorized (arrays ready): {arrays * 1000:8.3f} ms  ({lists / arrays:6.1f}x)")
+    print(f"Vectorized incl. OptionsChain build: {(arrays + build) * 1000:8.3f} ms  "
+          f"({lists / (arrays + build):6.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,6 @@
 
 import os
 import sys
-from datetime import datetime
 from dotenv import load_dotenv
 import logging
 
@@ -11,6 +10,8 @@ import logging
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.core.deribit_client import DeribitClient
+from src.core.chain_loader import OptionsChainLoader
+from src.core.instrument_registry import InstrumentRegistry
 from src.strategies.iron_condor import IronCondorBuilder
 from src.utils.volatility import VolatilityAnalyzer
 
@@ -23,7 +24,7 @@ logger = logging.getLogger(__name__)
 
 
 def check_currency(client: DeribitClient, currency: str, builder: IronCondorBuilder,
-                   vol_analyzer: VolatilityAnalyzer):
+                   vol_analyzer: VolatilityAnalyzer, chain_loader: OptionsChainLoader):
     """Check opportunities for a specific currency"""
     logger.info(f"\n{'=' * 60}")
     logger.info(f"CHECKING {currency}")
@@ -38,23 +39,14 @@ def check_currency(client: DeribitClient, currency: str, builder: IronCondorBuil
     logger.info(f"Spot Price: ${spot_price:,.2f}")
 
     # Get instruments
-    instruments = client.get_instruments(currency, kind="option")
-    logger.info(f"Available instruments: {len(instruments)}")
+    registry = chain_loader.registry
+    logger.info(f"Available instruments: {registry.refresh(currency)}")
 
     # Find expirations
-    expirations = {}
-    for inst in instruments:
-        exp_timestamp = inst.get("expiration_timestamp")
-        if exp_timestamp:
-            exp_dt = datetime.fromtimestamp(exp_timestamp / 1000)
-            days = (exp_dt - datetime.now()).days
-            if 7 <= days <= 10:
-                exp_str = exp_dt.strftime("%d%b%y").upper()
-                if exp_str not in expirations:
-                    expirations[exp_str] = days
+    expirations = registry.expiries_in_dte(currency, 7, 10)
 
     logger.info(f"\nSuitable expirations (7-10 DTE):")
-    for exp, days in sorted(expirations.items(), key=lambda x: x[1]):
+    for exp, days in expirations:
         logger.info(f"  {exp}: {days} days")
 
     if not expirations:
@@ -62,31 +54,17 @@ def check_currency(client: DeribitClient, currency: str, builder: IronCondorBuil
         return
 
     # Use closest to 7 DTE
-    best_exp = min(expirations.items(), key=lambda x: abs(x[1] - 7))
+    best_exp = min(expirations, key=lambda x: abs(x[1] - 7))
     expiration = best_exp[0]
     logger.info(f"\nSelected expiration: {expiration} ({best_exp[1]} DTE)")
 
-    # Get options for this expiration
-    options = []
-    for inst in instruments:
-        exp_timestamp = inst.get("expiration_timestamp")
-        if exp_timestamp:
-            exp_dt = datetime.fromtimestamp(exp_timestamp / 1000)
-            exp_str = exp_dt.strftime("%d%b%y").upper()
-
-            if exp_str == expiration:
-                # Get mark price and greeks
-                book = client.get_order_book(inst["instrument_name"])
-                if book:
-                    inst["mark_price"] = book.get("mark_price", 0)
-                    inst["mark_iv"] = book.get("mark_iv", 0)
-                    inst["greeks"] = book.get("greeks", {})
-                    options.append(inst)
+    # Get options for this expiration (one book summary request, estimated deltas)
+    options = chain_loader.get_chain(currency, expiration)
 
     logger.info(f"Options for {expiration}: {len(options)}")
 
     # Calculate ATM IV
-    atm_iv = vol_analyzer.get_atm_iv(options, spot_price)
+    atm_iv = vol_analyzer.get_atm_iv(options, spot_price, currency)
     if atm_iv:
         logger.info(f"\nATM Implied Volatility: {atm_iv:.2%}")
 
@@ -162,11 +140,12 @@ def main():
         wing_width_percent=0.05
     )
     vol_analyzer = VolatilityAnalyzer(lookback_days=30)
+    chain_loader = OptionsChainLoader(client, InstrumentRegistry(client))
 
     # Check each currency
     for currency in ["BTC", "ETH"]:
         try:
-            check_currency(client, currency, builder, vol_analyzer)
+            check_currency(client, currency, builder, vol_analyzer, chain_loader)
         except Exception as e:
             logger.error(f"Error checking {currency}: {e}", exc_info=True)
 
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Deribit REST API, used for offline benchmarks
+
+Two ways to feed it:
+- canned responses (DEFAULT_RESPONSES, overridable per endpoint)
+- a recorded session: ResponseRecorder captures real DeribitClient responses
+  (REST or WebSocket transport) into a gzip JSONL file, and the server replays
+  them over REST with seeded latency, jitter and error injection.
+
+Record a session on testnet (needs credentials in .env):
+    python scripts/fake_deribit.py record recordings/session.jsonl.gz --cycles 3
+
+Serve it back:
+    python scripts/fake_deribit.py replay recordings/session.jsonl.gz --port 8000 --latency 0.02
+    DERIBIT_BASE_URL=http://127.0.0.1:8000/api/v2 python main.py
+"""
+
+import os
+import sys
+import gzip
+import json
+import random
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple, Any
+from urllib.parse import urlparse, parse_qsl
+
+# Params that change on every call and must not affect replay matching
+VOLATILE_PARAMS = {"start_timestamp", "end_timestamp", "timestamp", "nonce", "label"}
+
+# Endpoints never written to a recording (credentials and tokens)
+NOT_RECORDED = {"/public/auth"}
+
+# Deribit's too_many_requests error code, returned by injected 429s
+TOO_MANY_REQUESTS_CODE = 10028
+
+
+def _param_value(value: Any) -> str:
+    """Normalize REST query strings and JSON-RPC values to one representation"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def replay_key(endpoint: str, params: Optional[Dict]) -> Tuple:
+    """Key a request by endpoint and params, ignoring volatile params"""
+    return (endpoint,) + tuple(sorted(
+        (k, _param_value(v)) for k, v in (params or {}).items() if k not in VOLATILE_PARAMS
+    ))
+
+
+class ResponseRecorder:
+    """
+    Write DeribitClient responses to a gzip JSONL file
+
+    Usage:
+        with ResponseRecorder("recordings/session.jsonl.gz") as recorder:
+            client.recorder = recorder
+            ...
+    """
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.path = path
+        self.count = 0
+        self._lock = threading.Lock()
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+
+    def __call__(self, endpoint: str, params: Optional[Dict], response: Dict):
+        if endpoint in NOT_RECORDED:
+            return
+        line = json.dumps({"endpoint": endpoint, "params": params or {}, "response": response})
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line + "\n")
+            self.count += 1
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_recording(path: str) -> List[Dict]:
+    """Read the entries of a recorded session, in recording order"""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class _Replay:
+    """
+    Recorded responses served in recording order per request key
+
+    Repeated requests cycle through the responses recorded for them; requests
+    that were never recorded with these params get the endpoint's responses.
+    """
+
+    def __init__(self, entries: List[Dict]):
+        self._lock = threading.Lock()
+        self._by_key: Dict[Tuple, List[Dict]] = {}
+        self._by_endpoint: Dict[str, List[Dict]] = {}
+        self._served: Dict[Any, int] = {}
+
+        for entry in entries:
+            key = replay_key(entry["endpoint"], entry.get("params"))
+            self._by_key.setdefault(key, []).append(entry["response"])
+            self._by_endpoint.setdefault(entry["endpoint"], []).append(entry["response"])
+
+    def lookup(self, endpoint: str, params: Dict) -> Optional[Dict]:
+        key = replay_key(endpoint, params)
+        responses = self._by_key.get(key)
+        if responses is None:
+            key = endpoint
+            responses = self._by_endpoint.get(endpoint)
+        if not responses:
+            return None
+
+        with self._lock:
+            served = self._served.get(key, 0)
+            self._served[key] = served + 1
+        return responses[served % len(responses)]
+
+
+class _FakeDeribitHandler(BaseHTTPRequestHandler):
+    """Serve canned or replayed JSON-RPC responses over HTTP/1.1 keep-alive"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._respond(dict(parse_qsl(urlparse(self.path).query)))
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        try:
+            params = json.loads(body) if body else {}
+        except ValueError:
+            params = {}
+        self._respond(params if isinstance(params, dict) else {})
+
+    def _respond(self, params: Dict):
+        server = self.server
+        endpoint = urlparse(self.path).path
+        if endpoint.startswith(server.prefix):
+            endpoint = endpoint[len(server.prefix):]
+
+        delay, inject_status = server.draw()
+        if delay:
+            time.sleep(delay)
+
+        if inject_status is not None:
+            error = {"code": TOO_MANY_REQUESTS_CODE, "message": "too_many_requests"} \
+                if inject_status == 429 else {"code": 11094, "message": "internal_server_error"}
+            self._write(inject_status, {"jsonrpc": "2.0", "error": error})
+            return
+
+        payload = server.replay.lookup(endpoint, params) if server.replay else None
+        if payload is None and (endpoint in server.responses or server.replay is None):
+            payload = {"jsonrpc": "2.0", "result": server.responses.get(endpoint, {})}
+
+        if payload is None:
+            self._write(400, {"jsonrpc": "2.0",
+                              "error": {"code": -32601, "message": f"no recorded response for {endpoint}"}})
+        else:
+            self._write(200, payload)
+
+    def _write(self, status: int, payload: Dict):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _FakeDeribitHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency: float, jitter: float, error_rate: float,
+                 error_statuses: Sequence[int], seed: Optional[int]):
+        super().__init__(address, _FakeDeribitHandler)
+        self.prefix = "/api/v2"
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.responses: Dict[str, Dict] = {}
+        self.replay: Optional[_Replay] = None
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+    def draw(self) -> Tuple[float, Optional[int]]:
+        """Per-request delay and injected error status (None = no error), seeded"""
+        with self._rng_lock:
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+            status = None
+            if self.error_rate and self._rng.random() < self.error_rate:
+                status = self._rng.choice(self.error_statuses)
+        return delay, status
+
+
+class FakeDeribitServer:
+    """
+    Minimal Deribit stand-in running in a background thread
+
+    Usage:
+        with FakeDeribitServer(latency=0.002) as server:
+            client = DeribitClient("key", "secret", base_url=server.url)
+
+        with FakeDeribitServer(recording="recordings/session.jsonl.gz",
+                               latency=0.02, jitter=0.01, error_rate=0.01, seed=1) as server:
+            ...
+    """
+
+    DEFAULT_RESPONSES = {
+        "/public/auth": {"access_token": "fake", "refresh_token": "fake", "expires_in": 900},
+        "/public/get_index_price": {"index_price": 50000.0},
+        "/public/get_order_book": {
+            "mark_price": 0.01, "mark_iv": 50.0, "best_bid_price": 0.0095,
+            "best_ask_price": 0.0105, "greeks": {"delta": 0.12}
+        },
+    }
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 responses: Optional[Dict[str, Dict]] = None, recording: Optional[str] = None,
+                 jitter: float = 0.0, error_rate: float = 0.0,
+                 error_statuses: Sequence[int] = (429, 500), seed: Optional[int] = 0):
+        """
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 = pick a free port)
+            latency: Artificial server-side delay per request in seconds
+            responses: Map of endpoint -> JSON-RPC result (merged over defaults)
+            recording: Recorded session to replay (see ResponseRecorder); canned
+                       responses then only answer endpoints missing from it
+            jitter: Extra uniform random delay per request, 0..jitter seconds
+            error_rate: Fraction of requests answered with an injected error
+            error_statuses: HTTP statuses to inject (429 carries Deribit's 10028 code)
+            seed: Seed for jitter and error injection (same seed, same sequence)
+        """
+        self.httpd = _FakeDeribitHTTPServer((host, port), latency, jitter, error_rate,
+                                            error_statuses, seed)
+        self.httpd.responses = dict(self.DEFAULT_RESPONSES)
+        if responses:
+            self.httpd.responses.update(responses)
+        if recording:
+            self.httpd.replay = _Replay(load_recording(recording))
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{self.httpd.prefix}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def record_session(path: str, cycles: int, allow_prod: bool = False) -> int:
+    """
+    Run the bot's scan and management cycles against Deribit, recording responses
+
+    Strategies run for real, so this may place orders: testnet only unless
+    allow_prod is set.
+
+    Returns:
+        Number of recorded responses
+    """
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+    from config import Config
+    from src.trading_bot import TradingBot
+
+    if Config.DERIBIT_ENV != "test" and not allow_prod:
+        raise SystemExit("Refusing to record against prod (strategies may trade), use --allow-prod")
+
+    # Replay serves REST only, and subscriptions would bypass the recorder
+    Config.MARKET_DATA_STREAMING = False
+
+    bot = TradingBot()
+    with ResponseRecorder(path) as recorder:
+        bot.client.recorder = recorder
+        if not bot.authenticate():
+            raise SystemExit("Authentication failed")
+        try:
+            for _ in range(cycles):
+                bot.scan_and_open_positions()
+                bot.manage_open_positions()
+        finally:
+            bot.client.close()
+        return recorder.count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record or replay Deribit API sessions")
+    subparsers = parser.add_subparsers(dest="mode", required=True)
+
+    record = subparsers.add_parser("record", help="Record bot cycles against Deribit")
+    record.add_argument("output", help="Recording file (.jsonl.gz)")
+    record.add_argument("--cycles", type=int, default=1, help="Scan + manage cycles to record")
+    record.add_argument("--allow-prod", action="store_true", help="Allow recording against prod")
+
+    replay = subparsers.add_parser("replay", help="Serve a recording over REST")
+    replay.add_argument("recording", help="Recording file (.jsonl.gz)")
+    replay.add_argument("--host", default="127.0.0.1")
+    replay.add_argument("--port", type=int, default=8000)
+    replay.add_argument("--latency", type=float, default=0.0, help="Base latency (s)")
+    replay.add_argument("--jitter", type=float, default=0.0, help="Max extra random latency (s)")
+    replay.add_argument("--error-rate", type=float, default=0.0, help="Fraction of injected errors")
+    replay.add_argument("--seed", type=int, default=0, help="Seed for jitter/errors")
+
+    args = parser.parse_args()
+
+    if args.mode == "record":
+        count = record_session(args.output, args.cycles, args.allow_prod)
+        print(f"Recorded {count} responses to {args.output}")
+        return
+
+    server = FakeDeribitServer(args.host, args.port, latency=args.latency, recording=args.recording,
+                               jitter=args.jitter, error_rate=args.error_rate, seed=args.seed)
+    print(f"Replaying {args.recording} at {server.url} (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Time TradingBot scan and management cycles against a local Deribit stand-in
+
+Without --recording the server answers with canned responses; with a session
+recorded by `fake_deribit.py record` the bot sees real market data. No network
+access or exchange credentials are needed.
+"""
+
+import os
+import sys
+import time
+import argparse
+import logging
+import statistics
+from typing import List
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from config import Config
+from fake_deribit import FakeDeribitServer
+
+logging.basicConfig(level=logging.WARNING)
+
+
+def summarize(name: str, samples: List[float]):
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(f"{name:<26} mean {statistics.mean(samples) * 1000:8.1f} ms | "
+          f"p50 {statistics.median(samples) * 1000:8.1f} ms | "
+          f"p95 {p95 * 1000:8.1f} ms | max {ordered[-1] * 1000:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--recording", help="Recorded session (.jsonl.gz) to replay")
+    parser.add_argument("-n", "--cycles", type=int, default=20, help="Cycles to time")
+    parser.add_argument("--latency", type=float, default=0.0, help="Server-side latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Max extra random latency (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of injected errors")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for jitter/errors")
+    args = parser.parse_args()
+
+    with FakeDeribitServer(latency=args.latency, recording=args.recording, jitter=args.jitter,
+                           error_rate=args.error_rate, seed=args.seed) as server:
+        # Point the bot at the stand-in; credentials are not checked there
+        Config.DERIBIT_BASE_URL = server.url
+        Config.DERIBIT_API_KEY = Config.DERIBIT_API_KEY or "replay"
+        Config.DERIBIT_API_SECRET = Config.DERIBIT_API_SECRET or "replay"
+        Config.DERIBIT_TRANSPORT = "rest"
+        Config.MARKET_DATA_STREAMING = False
+
+        from src.trading_bot import TradingBot
+
+        bot = TradingBot()
+        if not bot.authenticate():
+            raise SystemExit("Authentication against the stand-in failed")
+
+        scan_times, manage_times = [], []
+        try:
+            for _ in range(args.cycles):
+                start = time.perf_counter()
+                bot.scan_and_open_positions()
+                scan_times.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                bot.manage_open_positions()
+                manage_times.append(time.perf_counter() - start)
+        finally:
+            totals = bot.client.metrics.snapshot()["totals"]
+            bot.client.close()
+
+    print("=" * 60)
+    print(f"BOT CYCLE TIMES ({args.cycles} cycles, "
+          f"{'replay of ' + args.recording if args.recording else 'canned responses'})")
+    print("=" * 60)
+    summarize("scan_and_open_positions", scan_times)
+    summarize("manage_open_positions", manage_times)
+    print(f"Requests: {totals['requests']} | errors {totals['errors']} | "
+          f"retries {totals['retries']} | rate limited {totals['rate_limited']}")
+
+
+if __name__ == "__main__":
+    main()
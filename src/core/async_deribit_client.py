@@ -0,0 +1,463 @@
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple, Iterable
+import logging
+
+import aiohttp
+
+from src.core.deribit_client import DEFAULT_TIMEOUT, ENDPOINT_TIMEOUTS, ohlcv_params, format_ohlcv
+from src.core.rate_limiter import CreditRateLimiter, TOO_MANY_REQUESTS_CODE
+from src.core.metrics import ClientMetrics
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDeribitClient:
+    """
+    Asyncio counterpart of DeribitClient
+
+    Exposes the same public and private methods as coroutines, plus gather_*
+    helpers that fan requests out concurrently under a bounded semaphore.
+
+    Usage:
+        async with AsyncDeribitClient(key, secret) as client:
+            books = await client.gather_order_books(names)
+    """
+
+    def __init__(self, api_key: str, api_secret: str, env: str = "test",
+                 base_url: Optional[str] = None, max_concurrency: int = 10,
+                 timeouts: Optional[Dict[str, Tuple[float, float]]] = None,
+                 rate_limiter: Optional[CreditRateLimiter] = None,
+                 metrics: Optional[ClientMetrics] = None):
+        """
+        Initialize async Deribit client
+
+        Args:
+            api_key: API key
+            api_secret: API secret
+            env: 'test' for testnet, 'prod' for production
+            base_url: Override the API base URL (e.g. a local stand-in server)
+            max_concurrency: Max requests in flight (also the connection pool size)
+            timeouts: Per-endpoint (connect, read) timeout overrides
+            rate_limiter: Credit rate limiter (share one with DeribitClient to
+                          model a single account's credit pools)
+            metrics: Request metrics collector (may be shared with DeribitClient)
+        """
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.env = env
+
+        if base_url:
+            self.base_url = base_url.rstrip("/")
+        elif env == "test":
+            self.base_url = "https://test.deribit.com/api/v2"
+        else:
+            self.base_url = "https://www.deribit.com/api/v2"
+
+        self.access_token = None
+        self.refresh_token = None
+        self.token_expiry = 0
+
+        self.max_concurrency = max_concurrency
+        self.timeouts = dict(ENDPOINT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+        self.rate_limiter = rate_limiter or CreditRateLimiter()
+        self.metrics = metrics or ClientMetrics()
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._auth_lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Create the session lazily so it binds to the running event loop"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, keepalive_timeout=30)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._auth_lock = asyncio.Lock()
+        return self._session
+
+    async def close(self):
+        """Close the HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def authenticate(self) -> bool:
+        """
+        Authenticate with Deribit API
+
+        Returns:
+            bool: True if authentication successful
+        """
+        try:
+            endpoint = "/public/auth"
+            params = {
+                "grant_type": "client_credentials",
+                "client_id": self.api_key,
+                "client_secret": self.api_secret
+            }
+
+            response = await self._request("GET", endpoint, params)
+
+            if response and "result" in response:
+                self.access_token = response["result"]["access_token"]
+                self.refresh_token = response["result"]["refresh_token"]
+                self.token_expiry = time.time() + response["result"]["expires_in"]
+                logger.info("Successfully authenticated with Deribit")
+                return True
+            else:
+                logger.error(f"Authentication failed: {response}")
+                return False
+
+        except Exception as e:
+            logger.error(f"Authentication error: {e}")
+            return False
+
+    async def _check_token(self):
+        """Check if token is valid and refresh if needed (one refresh for all waiters)"""
+        self._ensure_session()
+        async with self._auth_lock:
+            if not self.access_token or time.time() >= self.token_expiry - 60:
+                logger.info("Token expired or missing, re-authenticating...")
+                await self.authenticate()
+
+    @staticmethod
+    def _encode_params(params: Optional[Dict]) -> Dict:
+        """aiohttp query params must be str/int/float"""
+        encoded = {}
+        for key, value in (params or {}).items():
+            if isinstance(value, bool):
+                value = "true" if value else "false"
+            encoded[key] = value
+        return encoded
+
+    async def _request(self, method: str, endpoint: str, params: Dict = None, private: bool = False,
+                       max_retries: int = 3) -> Optional[Dict]:
+        """
+        Make HTTP request to Deribit API with retry logic
+
+        Args:
+            method: HTTP method (GET, POST)
+            endpoint: API endpoint
+            params: Request parameters
+            private: Whether this is a private endpoint requiring auth
+            max_retries: Maximum number of retry attempts
+
+        Returns:
+            API response as dict
+        """
+        session = self._ensure_session()
+
+        if private:
+            await self._check_token()
+
+        url = f"{self.base_url}{endpoint}"
+        headers = {}
+
+        if private and self.access_token:
+            headers["Authorization"] = f"Bearer {self.access_token}"
+
+        connect_timeout, read_timeout = self.timeouts.get(endpoint, DEFAULT_TIMEOUT)
+        timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+
+        for attempt in range(max_retries):
+            if attempt > 0:
+                self.metrics.record_retry(endpoint)
+
+            try:
+                wait = self.rate_limiter.reserve(endpoint)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                async with self._semaphore:
+                    start = time.perf_counter()
+                    if method == "GET":
+                        request = session.get(url, params=self._encode_params(params),
+                                              headers=headers, timeout=timeout)
+                    elif method == "POST":
+                        request = session.post(url, json=params, headers=headers, timeout=timeout)
+                    else:
+                        raise ValueError(f"Unsupported method: {method}")
+
+                    async with request as response:
+                        body = await response.read()
+                        self.metrics.record_request(endpoint, time.perf_counter() - start, response.status,
+                                                    len(body), error=response.status >= 400)
+
+                        if response.status == 429 or (
+                                response.status >= 400 and await self._error_code(response) == TOO_MANY_REQUESTS_CODE):
+                            self.metrics.record_rate_limited(endpoint)
+                            self.rate_limiter.on_rate_limited(endpoint)
+                            if attempt < max_retries - 1:
+                                continue
+                            logger.error(f"Rate limited on {endpoint} after {max_retries} attempts")
+                            return None
+
+                        response.raise_for_status()
+                        self.rate_limiter.on_success(endpoint)
+                        return await response.json()
+
+            except asyncio.TimeoutError as e:
+                self.metrics.record_timeout(endpoint)
+                if attempt < max_retries - 1:
+                    wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
+                    logger.warning(f"Timeout on {endpoint} (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s...")
+                    await asyncio.sleep(wait_time)
+                    continue
+                else:
+                    logger.error(f"Request timeout for {endpoint} after {max_retries} attempts: {e}")
+                    return None
+
+            except aiohttp.ClientError as e:
+                if not isinstance(e, aiohttp.ClientResponseError):
+                    self.metrics.record_failure(endpoint, type(e).__name__)
+                # Don't retry on non-timeout errors (4xx, 5xx, connection refused, etc.)
+                logger.error(f"Request error for {endpoint}: {e}")
+                return None
+
+        return None
+
+    @staticmethod
+    async def _error_code(response: aiohttp.ClientResponse) -> Optional[int]:
+        try:
+            body = await response.json(content_type=None)
+            return body.get("error", {}).get("code")
+        except Exception:
+            return None
+
+    # Concurrent fan-out helpers
+
+    async def gather_order_books(self, instrument_names: Iterable[str], depth: int = 5) -> Dict[str, Optional[Dict]]:
+        """Get order books for many instruments concurrently, keyed by instrument name"""
+        names = list(instrument_names)
+        books = await asyncio.gather(*(self.get_order_book(name, depth) for name in names))
+        return dict(zip(names, books))
+
+    async def gather_index_prices(self, currencies: Iterable[str]) -> Dict[str, Optional[float]]:
+        """Get index prices for many currencies concurrently, keyed by currency"""
+        currencies = list(currencies)
+        prices = await asyncio.gather(*(self.get_index_price(c) for c in currencies))
+        return dict(zip(currencies, prices))
+
+    async def gather_tickers(self, instrument_names: Iterable[str]) -> Dict[str, Optional[Dict]]:
+        """Get tickers for many instruments concurrently, keyed by instrument name"""
+        names = list(instrument_names)
+        tickers = await asyncio.gather(*(self.get_ticker(name) for name in names))
+        return dict(zip(names, tickers))
+
+    # Public endpoints
+
+    async def get_index_price(self, currency: str) -> Optional[float]:
+        """Get current index price for currency (BTC or ETH)"""
+        endpoint = "/public/get_index_price"
+        params = {"index_name": f"{currency.lower()}_usd"}
+        response = await self._request("GET", endpoint, params)
+
+        if response and "result" in response:
+            return response["result"]["index_price"]
+        return None
+
+    async def get_instruments(self, currency: str, kind: str = "option", expired: bool = False) -> List[Dict]:
+        """Get available instruments"""
+        endpoint = "/public/get_instruments"
+        params = {
+            "currency": currency.upper(),
+            "kind": kind,
+            "expired": "true" if expired else "false"
+        }
+        response = await self._request("GET", endpoint, params)
+
+        if response and "result" in response:
+            return response["result"]
+        return []
+
+    async def get_order_book(self, instrument_name: str, depth: int = 5) -> Optional[Dict]:
+        """Get order book for instrument"""
+        endpoint = "/public/get_order_book"
+        params = {
+            "instrument_name": instrument_name,
+            "depth": depth
+        }
+        response = await self._request("GET", endpoint, params)
+
+        if response and "result" in response:
+            return response["result"]
+        return None
+
+    async def get_book_summary_by_currency(self, currency: str, kind: str = "option") -> List[Dict]:
+        """Get book summaries for every instrument of a currency in a single request"""
+        endpoint = "/public/get_book_summary_by_currency"
+        params = {
+            "currency": currency.upper(),
+            "kind": kind
+        }
+        response = await self._request("GET", endpoint, params)
+
+        if response and "result" in response:
+            return response["result"]
+        return []
+
+    async def get_ticker(self, instrument_name: str) -> Optional[Dict]:
+        """Get ticker (last/mark/best prices, greeks for options) for instrument"""
+        endpoint = "/public/ticker"
+        params = {"instrument_name": instrument_name}
+        response = await self._request("GET", endpoint, params)
+
+        if response and "result" in response:
+            return response["result"]
+        return None
+
+    async def get_historical_volatility(self, currency: str) -> Optional[List]:
+        """Get historical volatility data"""
+        endpoint = "/public/get_historical_volatility"
+        params = {"currency": currency.upper()}
+        response = await self._request("GET", endpoint, params)
+
+        if response and "result" in response:
+            return response["result"]
+        return None
+
+    async def get_volatility_index_data(self, currency: str, start_timestamp: int, end_timestamp: int,
+                                        resolution: str = "3600", max_pages: int = 10) -> List[List[float]]:
+        """Get volatility index (DVOL) candles oldest first (see DeribitClient.get_volatility_index_data)"""
+        endpoint = "/public/get_volatility_index_data"
+        candles = {}
+
+        for _ in range(max_pages):
+            params = {
+                "currency": currency.upper(),
+                "start_timestamp": start_timestamp,
+                "end_timestamp": end_timestamp,
+                "resolution": resolution
+            }
+            response = await self._request("GET", endpoint, params)
+            if not response or "result" not in response:
+                break
+
+            result = response["result"]
+            for candle in result.get("data", []):
+                candles[candle[0]] = candle
+
+            continuation = result.get("continuation")
+            if not continuation or continuation <= start_timestamp or continuation >= end_timestamp:
+                break
+            end_timestamp = continuation
+
+        return [candles[ts] for ts in sorted(candles)]
+
+    async def get_ohlcv(self, instrument_name: str, timeframe: str = "15", limit: int = 50,
+                        output: str = "list"):
+        """Get OHLCV data as rows, a structured array or a dict of arrays (see DeribitClient.get_ohlcv)"""
+        endpoint = "/public/get_tradingview_chart_data"
+        params = ohlcv_params(instrument_name, timeframe, limit)
+        response = await self._request("GET", endpoint, params)
+
+        if response and "result" in response:
+            return format_ohlcv(response["result"], output)
+        return format_ohlcv({}, output)
+
+    # Private endpoints
+
+    async def get_account_summary(self, currency: str) -> Optional[Dict]:
+        """Get account summary including balance and equity"""
+        endpoint = "/private/get_account_summary"
+        params = {"currency": currency.upper()}
+        response = await self._request("GET", endpoint, params, private=True)
+
+        if response and "result" in response:
+            return response["result"]
+        return None
+
+    async def get_positions(self, currency: str, kind: str = "option") -> List[Dict]:
+        """Get open positions"""
+        endpoint = "/private/get_positions"
+        params = {
+            "currency": currency.upper(),
+            "kind": kind
+        }
+        response = await self._request("GET", endpoint, params, private=True)
+
+        if response and "result" in response:
+            return response["result"]
+        return []
+
+    async def _place_order(self, endpoint: str, instrument_name: str, amount: float,
+                           price: Optional[float], label: str, post_only: bool) -> Optional[Dict]:
+        params = {
+            "instrument_name": instrument_name,
+            "amount": amount,
+            "type": "limit" if price else "market"
+        }
+
+        if price:
+            params["price"] = price
+        if label:
+            params["label"] = label
+        if post_only:
+            params["post_only"] = True
+
+        response = await self._request("GET", endpoint, params, private=True)
+
+        if response and "result" in response:
+            return response["result"]["order"]
+        return None
+
+    async def buy(self, instrument_name: str, amount: float, price: Optional[float] = None,
+                  label: str = "", post_only: bool = False) -> Optional[Dict]:
+        """Place buy order (market order if price is None)"""
+        return await self._place_order("/private/buy", instrument_name, amount, price, label, post_only)
+
+    async def sell(self, instrument_name: str, amount: float, price: Optional[float] = None,
+                   label: str = "", post_only: bool = False) -> Optional[Dict]:
+        """Place sell order (market order if price is None)"""
+        return await self._place_order("/private/sell", instrument_name, amount, price, label, post_only)
+
+    async def get_order_state(self, order_id: str) -> Optional[Dict]:
+        """Get order state by order ID"""
+        endpoint = "/private/get_order_state"
+        params = {"order_id": order_id}
+        response = await self._request("GET", endpoint, params, private=True)
+
+        if response and "result" in response:
+            return response["result"]
+        return None
+
+    async def close_position(self, instrument_name: str, type_: str = "market") -> Optional[Dict]:
+        """Close position for instrument"""
+        endpoint = "/private/close_position"
+        params = {
+            "instrument_name": instrument_name,
+            "type": type_
+        }
+        response = await self._request("GET", endpoint, params, private=True)
+
+        if response and "result" in response:
+            return response["result"]
+        return None
+
+    async def cancel_all(self) -> bool:
+        """Cancel all open orders"""
+        endpoint = "/private/cancel_all"
+        response = await self._request("GET", endpoint, {}, private=True)
+        return response is not None
+
+    async def get_open_orders(self, currency: str = None, kind: str = "option") -> List[Dict]:
+        """Get all open orders"""
+        endpoint = "/private/get_open_orders_by_currency" if currency else "/private/get_open_orders"
+        params = {}
+        if currency:
+            params["currency"] = currency.upper()
+            params["kind"] = kind
+
+        response = await self._request("GET", endpoint, params, private=True)
+
+        if response and "result" in response:
+            return response["result"]
+        return []
@@ -0,0 +1,252 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+import logging
+
+import numpy as np
+
+from src.core.deribit_client import DeribitClient
+from src.core.instrument_registry import InstrumentRegistry
+from src.core.options_chain import OptionsChain
+from src.utils.pricing import SECONDS_PER_YEAR, black76_greeks, implied_volatility
+
+logger = logging.getLogger(__name__)
+
+
+class OptionsChainLoader:
+    """
+    Load an options chain from a single book summary request
+
+    public/get_book_summary_by_currency returns mark price, mark IV, bid/ask and
+    underlying price for every option of a currency at once. Greeks are computed
+    locally from those values (Black-76, one vectorized call per expiry) so the
+    condor builder can pick strikes; exchange greeks are then fetched only for
+    the legs it actually picks. Chains are returned as OptionsChain, sorted by
+    option type and strike.
+    """
+
+    def __init__(self, client: DeribitClient, registry: Optional[InstrumentRegistry] = None,
+                 max_workers: int = 8):
+        """
+        Initialize chain loader
+
+        Args:
+            client: Deribit API client
+            registry: Instrument registry to look expiries up in (created if not provided)
+            max_workers: Concurrent ticker requests for band chains (1 = sequential)
+        """
+        self.client = client
+        self.registry = registry or InstrumentRegistry(client)
+        self.max_workers = max_workers
+
+    def load_summaries(self, currency: str) -> Dict[str, Dict]:
+        """Get book summaries for all options of a currency, keyed by instrument name"""
+        summaries = self.client.get_book_summary_by_currency(currency, kind="option")
+        return {s["instrument_name"]: s for s in summaries}
+
+    def get_chain(self, currency: str, expiration: str,
+                  instruments: Optional[List[Dict]] = None) -> OptionsChain:
+        """
+        Get the options chain for one expiration with marks and estimated deltas
+
+        Args:
+            currency: BTC or ETH
+            expiration: Expiration in Deribit format (e.g. 27DEC24)
+            instruments: Instrument list (fetched if not provided)
+
+        Returns:
+            OptionsChain with marks, mark IV, best bid/ask, underlying price and
+            greeks (estimated delta, gamma, vega, theta); empty if unavailable
+        """
+        return self.get_chains(currency, [expiration], instruments).get(expiration, OptionsChain.empty())
+
+    def get_chains(self, currency: str, expirations: List[str],
+                   instruments: Optional[List[Dict]] = None) -> Dict[str, OptionsChain]:
+        """
+        Get the chains of several expirations from the same book summary request
+
+        Args:
+            currency: BTC or ETH
+            expirations: Expirations in Deribit format
+            instruments: Instrument list (fetched if not provided)
+
+        Returns:
+            Dict of expiration -> chain (see get_chain); expirations without
+            instruments or marks are left out
+        """
+        self.registry.refresh(currency, instruments)
+        by_expiry = {
+            expiration: self.registry.instruments_for_expiry(currency, expiration)
+            for expiration in expirations
+        }
+        if not any(len(expiry_instruments) for expiry_instruments in by_expiry.values()):
+            return {}
+
+        summaries = self.load_summaries(currency)
+        if not summaries:
+            return {}
+
+        now = time.time()
+        chains = {}
+
+        for expiration, expiry_instruments in by_expiry.items():
+            quoted = [inst for inst in expiry_instruments if inst["instrument_name"] in summaries]
+            if quoted:
+                chain = OptionsChain.from_instruments(quoted)
+                self._apply_summaries(chain, [summaries[inst["instrument_name"]] for inst in quoted])
+                self._estimate_greeks(chain, now)
+                chains[expiration] = chain
+
+        return chains
+
+    def get_band_chain(self, currency: str, expiration: str, spot_price: float, atm_iv: float,
+                       short_deltas: List[float], wing_widths: List[float],
+                       delta_band: float, atm_strikes: int = 1,
+                       forward: Optional[float] = None) -> OptionsChain:
+        """
+        Get only the strikes a condor can use, with exchange greeks
+
+        Deltas of every listed strike are estimated from the expiry's forward
+        and ATM IV (no request); tickers are then fetched concurrently for the
+        strikes whose estimated |delta| is within delta_band of a short delta
+        target, the wing strikes of those shorts and the strikes nearest spot
+        (for the IV check), typically about twenty.
+
+        This costs more requests than get_chain (one book summary for the whole
+        currency), in exchange for exchange greeks instead of estimates when
+        picking the strikes.
+
+        Args:
+            currency: BTC or ETH
+            expiration: Expiration in Deribit format
+            spot_price: Current index price
+            atm_iv: ATM implied volatility as a fraction (e.g. from VolSurface)
+            short_deltas: Short strike |delta| targets
+            wing_widths: Wing widths as a fraction of spot
+            delta_band: Half width of the band around the short delta targets
+            atm_strikes: Strikes per side of spot to include
+            forward: Underlying price of the expiry for the delta estimate (default: spot_price)
+
+        Returns:
+            Chain like get_chain (exchange greeks), empty if the estimate missed:
+            the deltas of the band strikes do not bracket every short delta target
+        """
+        self.registry.refresh(currency)
+        instruments = self.registry.instruments_for_expiry(currency, expiration)
+        if not len(instruments):
+            return OptionsChain.empty()
+
+        strikes = np.array([inst["strike"] for inst in instruments], dtype=np.float64)
+        is_call = np.array([inst["option_type"] == "call" for inst in instruments])
+        years = (instruments[0]["expiration_timestamp"] / 1000 - time.time()) / SECONDS_PER_YEAR
+        estimated = np.abs(black76_greeks(forward or spot_price, strikes, years, atm_iv, is_call)["delta"])
+
+        targets = np.abs(np.asarray(short_deltas, dtype=np.float64))
+        in_band = (estimated >= targets.min() - delta_band) & (estimated <= targets.max() + delta_band)
+        selected = set(np.flatnonzero(in_band))
+
+        distances = np.asarray(wing_widths, dtype=np.float64) * spot_price
+        for is_call_side in (False, True):
+            side = np.flatnonzero(is_call == is_call_side)
+            side = side[np.argsort(strikes[side], kind="stable")]
+            side_strikes = strikes[side]
+
+            # Wings of every band short, picked like IronCondorBuilder.find_protective_strike
+            for row in side[in_band[side]]:
+                if is_call_side:
+                    wing = np.maximum(np.searchsorted(side_strikes, strikes[row], side="right"),
+                                      np.searchsorted(side_strikes, strikes[row] + distances, side="left"))
+                    selected.update(side[wing[wing < len(side)]])
+                else:
+                    wing = np.minimum(np.searchsorted(side_strikes, strikes[row], side="left"),
+                                      np.searchsorted(side_strikes, strikes[row] - distances, side="right")) - 1
+                    selected.update(side[wing[wing >= 0]])
+
+            atm = np.searchsorted(side_strikes, spot_price)
+            selected.update(side[max(0, atm - atm_strikes):atm + atm_strikes])
+
+        rows = sorted(selected)
+        names = [instruments[row]["instrument_name"] for row in rows]
+        workers = min(self.max_workers, len(names))
+        if workers <= 1:
+            fetched = [self.client.get_ticker(name) for name in names]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="band") as executor:
+                fetched = list(executor.map(self.client.get_ticker, names))
+        tickers = [(instruments[row], ticker) for row, ticker in zip(rows, fetched)]
+        chain = OptionsChain.from_instruments(inst for inst, ticker in tickers if ticker)
+        for inst, ticker in tickers:
+            if ticker:
+                chain.update_tick(ticker, inst["instrument_name"])
+
+        # Deltas are monotone in strike and band strikes are contiguous: if their
+        # deltas bracket the targets, the strike nearest each target was fetched
+        band = {instruments[row]["instrument_name"] for row in np.flatnonzero(in_band)}
+        in_chain_band = np.array([name in band for name in chain.names], dtype=bool)
+        for option_type in ("put", "call"):
+            deltas = np.abs(chain.deltas[in_chain_band & (chain.option_types == option_type)])
+            deltas = deltas[np.isfinite(deltas)]
+            if not len(deltas) or deltas.min() > targets.min() or deltas.max() < targets.max():
+                logger.info(f"Delta band missed for {currency} {expiration} {option_type}s "
+                            f"({len(chain)} strikes fetched)")
+                return OptionsChain.empty()
+
+        logger.debug(f"Delta band chain for {currency} {expiration}: "
+                     f"{len(chain)}/{len(instruments)} instruments fetched")
+        return chain
+
+    @staticmethod
+    def _apply_summaries(chain: OptionsChain, summaries: List[Dict]):
+        """Fill a chain's market data columns from book summaries (same row order)"""
+        def column(field):
+            return np.array([np.nan if s.get(field) is None else s[field] for s in summaries], dtype=np.float64)
+
+        chain.marks[:] = np.nan_to_num(column("mark_price"))
+        chain.ivs[:] = column("mark_iv")
+        chain.bids[:] = column("bid_price")
+        chain.asks[:] = column("ask_price")
+        chain.underlying[:] = column("underlying_price")
+
+    @staticmethod
+    def _estimate_greeks(chain: OptionsChain, now: float):
+        """Set Black-76 greeks on a chain (in place)"""
+        years = (chain.expiries / 1000 - now) / SECONDS_PER_YEAR
+        iv = chain.ivs / 100
+        is_call = chain.option_types == "call"
+
+        # No mark IV: imply it from the mark price (quoted in coin)
+        missing = ~(iv > 0)
+        if missing.any():
+            implied = implied_volatility(chain.marks * chain.underlying, chain.underlying,
+                                         chain.strikes, years, is_call)
+            iv = np.where(missing, implied, iv)
+
+        greeks = black76_greeks(chain.underlying, chain.strikes, years, iv, is_call)
+        chain.deltas[:] = greeks["delta"]
+        chain.gammas[:] = greeks["gamma"]
+        chain.vegas[:] = greeks["vega"]
+        chain.thetas[:] = greeks["theta"]
+        chain.greeks_estimated[:] = True
+
+    def confirm_legs(self, condor) -> bool:
+        """
+        Refresh the delta and IV of a condor's legs with exchange greeks
+
+        Args:
+            condor: IronCondor built from an estimated chain (updated in place)
+
+        Returns:
+            True if all four legs were confirmed
+        """
+        confirmed = True
+        for leg in (condor.long_put, condor.short_put, condor.short_call, condor.long_call):
+            book = self.client.get_order_book(leg.instrument_name, depth=1)
+            if not book or "delta" not in book.get("greeks", {}):
+                logger.warning(f"Could not confirm greeks for {leg.instrument_name}")
+                confirmed = False
+                continue
+
+            leg.delta = book["greeks"]["delta"]
+            leg.mark_iv = book.get("mark_iv", leg.mark_iv)
+
+        return confirmed
@@ -0,0 +1,133 @@
+"""
+Per-cycle account and portfolio snapshot
+
+A bot cycle (scan or position management) asks several components for the
+same numbers: RiskManager needs equity several times per decision and
+PositionMonitor values every open condor for TP/SL and for the portfolio
+summary. CycleSnapshotProvider fetches equity, index prices and leg marks
+once at the start of a cycle; components look the snapshot up and only fall
+back to live requests when it is missing or stale. Cycles that do not size
+trades (position management) build it without equity, so they only request
+the marks of open condors.
+
+A snapshot is stale once it is older than its freshness budget or when the
+set of open condors changed since it was built (a new entry or a close
+changes exposure and P&L).
+"""
+
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, FrozenSet, Optional
+import logging
+
+from src.core.position_monitor import PositionMonitor, ValuationSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CycleSnapshot:
+    """Equity, prices and portfolio state fetched once for one bot cycle"""
+    equity: Optional[float]  # Total USD (None if built without equity)
+    equity_by_currency: Optional[Dict[str, float]]
+    index_prices: Dict[str, Optional[float]]
+    valuation: ValuationSnapshot  # Leg marks of the open condors
+    portfolio: Dict  # PositionMonitor.get_portfolio_summary() at build time
+    condor_ids: FrozenSet[str]
+    created_at: float  # Provider clock (monotonic seconds)
+    timestamp: datetime = field(default_factory=datetime.now)
+
+    @property
+    def total_pnl(self) -> float:
+        return self.portfolio["total_pnl"]
+
+    @property
+    def exposure(self) -> float:
+        """Total max loss of the open condors"""
+        return self.portfolio["total_risk"]
+
+
+class CycleSnapshotProvider:
+    """Builds the cycle snapshot and serves it while it is fresh"""
+
+    def __init__(self, client, position_monitor: PositionMonitor, risk_manager,
+                 max_age: float = 10.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize snapshot provider
+
+        Args:
+            client: Deribit API client (index prices for equity conversion)
+            position_monitor: Position monitor (open condors and their valuation)
+            risk_manager: Risk manager (equity per currency)
+            max_age: Freshness budget in seconds (0 = always fetch live)
+            clock: Monotonic clock in seconds (injectable for tests)
+        """
+        self.client = client
+        self.position_monitor = position_monitor
+        self.risk_manager = risk_manager
+        self.max_age = max_age
+        self._clock = clock
+        self._snapshot: Optional[CycleSnapshot] = None
+
+    def build(self, include_equity: bool = True) -> Optional[CycleSnapshot]:
+        """
+        Fetch everything a cycle needs and make it the current snapshot
+
+        Args:
+            include_equity: Also fetch account equity (and the index prices to
+                            convert it); without it only open condors are valued
+
+        Returns:
+            The new snapshot, or None if it could not be built (components
+            then fetch live)
+        """
+        self._snapshot = None
+        try:
+            condor_ids = frozenset(self.position_monitor.open_condors)
+            valuation = self.position_monitor.get_valuation_snapshot()
+
+            index_prices = dict(valuation.index_prices)
+            equity_by_currency = None
+            if include_equity:
+                for currency in self.risk_manager.EQUITY_CURRENCIES:
+                    if currency not in index_prices:
+                        index_prices[currency] = self.client.get_index_price(currency)
+                equity_by_currency = self.risk_manager.fetch_equity(index_prices)
+
+            portfolio = self.position_monitor.get_portfolio_summary(valuation)
+        except Exception as e:
+            logger.error(f"Error building cycle snapshot: {e}")
+            return None
+
+        self._snapshot = CycleSnapshot(
+            equity=sum(equity_by_currency.values()) if equity_by_currency is not None else None,
+            equity_by_currency=equity_by_currency,
+            index_prices=index_prices,
+            valuation=valuation,
+            portfolio=portfolio,
+            condor_ids=condor_ids,
+            created_at=self._clock()
+        )
+        equity = f"${self._snapshot.equity:,.2f}" if include_equity else "not fetched"
+        logger.info(f"Cycle snapshot: equity {equity}, "
+                    f"{len(condor_ids)} condors, {len(valuation.marks)} marks")
+        return self._snapshot
+
+    def current(self) -> Optional[CycleSnapshot]:
+        """The current snapshot if it is within the freshness budget and positions did not change"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+
+        if self._clock() - snapshot.created_at > self.max_age:
+            logger.debug("Cycle snapshot expired")
+            return None
+        if snapshot.condor_ids != frozenset(self.position_monitor.open_condors):
+            logger.debug("Open positions changed since the cycle snapshot")
+            return None
+        return snapshot
+
+    def invalidate(self):
+        """Drop the current snapshot"""
+        self._snapshot = None
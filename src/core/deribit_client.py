@@ -3,17 +3,138 @@ import json
 import time
 import hmac
 import hashlib
-from typing import Dict, List, Optional, Any
+import threading
+from typing import Dict, List, Optional, Any, Tuple, Union, Callable
 from datetime import datetime
 import logging
+import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError
+
+from src.core.deribit_ws import DeribitWebSocketTransport
+from src.core.rate_limiter import CreditRateLimiter, TOO_MANY_REQUESTS_CODE
+from src.core.metadata_cache import MetadataCache
+from src.core.metrics import ClientMetrics
 
 logger = logging.getLogger(__name__)
 
+# Gateway errors retried for public GETs (see DeribitClient._send)
+RETRY_STATUSES = (502, 503, 504)
+
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (3.05, 30)
+
+# Per-endpoint overrides: order placement must fail fast, bulk metadata may be slow
+ENDPOINT_TIMEOUTS = {
+    "/public/get_instruments": (3.05, 20),
+    "/public/get_book_summary_by_currency": (3.05, 20),
+    "/public/get_order_book": (3.05, 5),
+    "/public/get_index_price": (3.05, 5),
+    "/private/buy": (3.05, 10),
+    "/private/sell": (3.05, 10),
+    "/private/get_order_state": (3.05, 5),
+    "/private/close_position": (3.05, 10),
+    "/private/cancel_all": (3.05, 10),
+}
+
+
+def ohlcv_params(instrument_name: str, timeframe: str, limit: int) -> Dict:
+    """Build get_tradingview_chart_data params covering the last `limit` candles"""
+    # Resolution is in minutes (except 1D)
+    if timeframe == "1D":
+        res_minutes = 1440
+    elif timeframe.endswith("m"):
+        res_minutes = int(timeframe[:-1])
+    else:
+        res_minutes = int(timeframe)
+
+    end_ts = int(time.time() * 1000)
+    start_ts = end_ts - (limit * res_minutes * 60 * 1000)
+
+    return {
+        "instrument_name": instrument_name,
+        "start_timestamp": start_ts,
+        "end_timestamp": end_ts,
+        "resolution": timeframe.replace("m", "")  # Deribit uses "15" not "15m"
+    }
+
+
+# Column names of Deribit chart data, in [ts, o, h, l, c, v] row order
+OHLCV_FIELDS = ("timestamp", "open", "high", "low", "close", "volume")
+OHLCV_DTYPE = np.dtype([("timestamp", "i8"), ("open", "f8"), ("high", "f8"),
+                        ("low", "f8"), ("close", "f8"), ("volume", "f8")])
+
+# Deribit's chart data key for each column
+_OHLCV_KEYS = {"timestamp": "ticks", "open": "open", "high": "high",
+               "low": "low", "close": "close", "volume": "volume"}
+
+
+def ohlcv_columns(result: Dict) -> Dict[str, np.ndarray]:
+    """
+    Convert Deribit's columnar chart data into a dict of 1-D arrays
+
+    Each column is converted in one call, without per-row Python objects.
+    pd.DataFrame(columns, copy=False) wraps the arrays without copying them.
+    """
+    return {
+        name: np.asarray(result.get(_OHLCV_KEYS[name], []), dtype=OHLCV_DTYPE[name])
+        for name in OHLCV_FIELDS
+    }
+
+
+def ohlcv_structured(result: Dict) -> np.ndarray:
+    """Convert Deribit's columnar chart data into a structured array (OHLCV_DTYPE)"""
+    columns = ohlcv_columns(result)
+    array = np.empty(len(columns["timestamp"]), dtype=OHLCV_DTYPE)
+    for name in OHLCV_FIELDS:
+        array[name] = columns[name]
+    return array
+
+
+def format_ohlcv(result: Dict, output: str = "list"):
+    """
+    Format chart data as rows ("list"), a structured array ("array")
+    or a dict of arrays ("columns")
+    """
+    if output == "list":
+        return ohlcv_rows(result)
+    if output == "array":
+        return ohlcv_structured(result)
+    if output == "columns":
+        return ohlcv_columns(result)
+    raise ValueError(f"Unsupported OHLCV output: {output}")
+
+
+def ohlcv_rows(result: Dict) -> List[List[float]]:
+    """Convert Deribit's columnar chart data into [[ts, o, h, l, c, v], ...]"""
+    ticks = result.get("ticks", [])
+    opens = result.get("open", [])
+    highs = result.get("high", [])
+    lows = result.get("low", [])
+    closes = result.get("close", [])
+    volumes = result.get("volume", [])
+
+    ohlcv = []
+    for i in range(len(ticks)):
+        ohlcv.append([
+            ticks[i],
+            opens[i],
+            highs[i],
+            lows[i],
+            closes[i],
+            volumes[i]
+        ])
+    return ohlcv
+
 
 class DeribitClient:
     """Client for interacting with Deribit API (REST and WebSocket)"""
 
-    def __init__(self, api_key: str, api_secret: str, env: str = "test"):
+    def __init__(self, api_key: str, api_secret: str, env: str = "test",
+                 base_url: Optional[str] = None, pool_size: int = 10,
+                 timeouts: Optional[Dict[str, Tuple[float, float]]] = None,
+                 transport: str = "rest", rate_limiter: Optional[CreditRateLimiter] = None,
+                 cache_ttls: Optional[Dict[str, float]] = None):
         """
         Initialize Deribit client
 
@@ -21,19 +142,109 @@ class DeribitClient:
             api_key: API key
             api_secret: API secret
             env: 'test' for testnet, 'prod' for production
+            base_url: Override the API base URL (e.g. a local stand-in server)
+            pool_size: Max keep-alive connections held per connection pool
+            timeouts: Per-endpoint (connect, read) timeout overrides
+            transport: 'rest' (HTTP) or 'ws' (JSON-RPC over one WebSocket)
+            rate_limiter: Credit rate limiter (default: Deribit standard limits)
+            cache_ttls: Per-endpoint TTL overrides for cached public metadata
         """
         self.api_key = api_key
         self.api_secret = api_secret
         self.env = env
 
-        if env == "test":
+        if base_url:
+            self.base_url = base_url.rstrip("/")
+        elif env == "test":
             self.base_url = "https://test.deribit.com/api/v2"
         else:
             self.base_url = "https://www.deribit.com/api/v2"
 
-        self.access_token = None
-        self.refresh_token = None
-        self.token_expiry = 0
+        # (access_token, refresh_token, expiry) swapped as one tuple so readers
+        # never see a token from one grant paired with the expiry of another
+        self._token: Tuple[Optional[str], Optional[str], float] = (None, None, 0)
+        self._auth_lock = threading.Lock()
+        self._refresher: Optional[threading.Thread] = None
+        self._refresher_stop = threading.Event()
+
+        self.pool_size = pool_size
+        self.timeouts = dict(ENDPOINT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+        self.session = self._create_session()
+        self.rate_limiter = rate_limiter or CreditRateLimiter()
+        self.metadata_cache = MetadataCache(cache_ttls)
+        self.metrics = ClientMetrics()
+        # Optional callable(endpoint, params, response) receiving every successful
+        # API response, e.g. the session recorder in scripts/fake_deribit.py
+        self.recorder: Optional[Callable[[str, Optional[Dict], Dict], None]] = None
+
+        if transport not in ("rest", "ws"):
+            raise ValueError(f"Unsupported transport: {transport}")
+        self.transport = transport
+        self.ws: Optional[DeribitWebSocketTransport] = None
+        if transport == "ws":
+            self.ws = DeribitWebSocketTransport(self.ws_url)
+            self.ws.on_auth = self._store_token
+            self.ws.metrics = self.metrics
+
+    @property
+    def ws_url(self) -> str:
+        """WebSocket endpoint matching base_url"""
+        scheme, rest = self.base_url.split("://", 1)
+        host, _, path = rest.partition("/")
+        ws_scheme = "wss" if scheme == "https" else "ws"
+        return f"{ws_scheme}://{host}/ws/{path}"
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create a long-lived HTTP session with pooled keep-alive connections
+
+        The adapter does not retry (max_retries=0): _send owns the retry policy so
+        every attempt goes through the rate limiter and shows up in the metrics.
+        """
+        session = requests.Session()
+        session.headers.update({"Connection": "keep-alive"})
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @property
+    def access_token(self) -> Optional[str]:
+        return self._token[0]
+
+    @property
+    def refresh_token(self) -> Optional[str]:
+        return self._token[1]
+
+    @property
+    def token_expiry(self) -> float:
+        return self._token[2]
+
+    def close(self):
+        """Close pooled HTTP connections and the WebSocket, if any"""
+        self.stop_token_refresher()
+        self.session.close()
+        if self.ws is not None:
+            self.ws.stop()
+
+    def cache_stats(self) -> Dict:
+        """Get metadata cache hit/miss counters"""
+        return self.metadata_cache.stats()
+
+    def dump_metrics(self, path: str) -> bool:
+        """Write request metrics, rate limit headroom and cache stats to a JSON file"""
+        return self.metrics.dump(path, extra={
+            "transport": self.transport,
+            "rate_limit_headroom": self.rate_limiter.headroom(),
+            "metadata_cache": self.metadata_cache.stats()
+        })
+
+    def _get_timeout(self, endpoint: str) -> Tuple[float, float]:
+        """Get the (connect, read) timeout for an endpoint"""
+        return self.timeouts.get(endpoint, DEFAULT_TIMEOUT)
 
     def authenticate(self) -> bool:
         """
@@ -53,9 +264,10 @@ class DeribitClient:
             response = self._request("GET", endpoint, params)
 
             if response and "result" in response:
-                self.access_token = response["result"]["access_token"]
-                self.refresh_token = response["result"]["refresh_token"]
-                self.token_expiry = time.time() + response["result"]["expires_in"]
+                self._store_token(response["result"])
+                if self.ws is not None:
+                    # Lets the transport re-authenticate on its own after a reconnect
+                    self.ws.set_credentials(params)
                 logger.info("Successfully authenticated with Deribit")
                 return True
             else:
@@ -66,14 +278,98 @@ class DeribitClient:
             logger.error(f"Authentication error: {e}")
             return False
 
+    def _store_token(self, result: Dict):
+        """Store tokens from a public/auth result"""
+        self._token = (result["access_token"], result["refresh_token"],
+                       time.time() + result["expires_in"])
+
+    def refresh_access_token(self) -> bool:
+        """
+        Renew the access token with the refresh_token grant
+
+        Falls back to a full client_credentials authentication if there is no
+        refresh token or Deribit rejects it.
+
+        Returns:
+            bool: True if a new token was obtained
+        """
+        refresh_token = self.refresh_token
+        if refresh_token:
+            params = {
+                "grant_type": "refresh_token",
+                "refresh_token": refresh_token
+            }
+            response = self._request("GET", "/public/auth", params)
+
+            if response and "result" in response:
+                self._store_token(response["result"])
+                logger.info("Access token refreshed")
+                return True
+
+            logger.warning(f"Token refresh failed ({response}), re-authenticating...")
+
+        return self.authenticate()
+
+    def start_token_refresher(self, margin: float = 120.0, retry_delay: float = 5.0):
+        """
+        Renew the token in a background thread before it expires
+
+        Args:
+            margin: Seconds before expiry at which to refresh
+            retry_delay: Seconds between attempts after a failed refresh
+        """
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+
+        self._refresher_stop.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop, args=(margin, retry_delay),
+            name="deribit-token-refresher", daemon=True
+        )
+        self._refresher.start()
+        logger.info("Background token refresher started")
+
+    def stop_token_refresher(self):
+        """Stop the background token refresher"""
+        self._refresher_stop.set()
+        if self._refresher is not None:
+            self._refresher.join(timeout=5)
+            self._refresher = None
+
+    def _refresh_loop(self, margin: float, retry_delay: float):
+        delay = max(self.token_expiry - margin - time.time(), 0)
+
+        while not self._refresher_stop.wait(delay):
+            with self._auth_lock:
+                refreshed = self.refresh_access_token()
+
+            if refreshed:
+                delay = max(self.token_expiry - margin - time.time(), retry_delay)
+            else:
+                logger.error(f"Background token refresh failed, retrying in {retry_delay:.0f}s")
+                delay = retry_delay
+
     def _check_token(self):
-        """Check if token is valid and refresh if needed"""
-        if not self.access_token or time.time() >= self.token_expiry - 60:
-            logger.info("Token expired or missing, re-authenticating...")
-            self.authenticate()
+        """
+        Check if token is valid and refresh if needed
+
+        With the background refresher running, a token close to expiry is still
+        used as-is: only a missing or already expired token blocks the caller.
+        """
+        refresher_running = self._refresher is not None and self._refresher.is_alive()
+        margin = 0 if refresher_running else 60
+
+        if not self.access_token or time.time() >= self.token_expiry - margin:
+            with self._auth_lock:
+                # Another thread may have renewed the token while we waited
+                if not self.access_token or time.time() >= self.token_expiry - margin:
+                    logger.info("Token expired or missing, re-authenticating...")
+                    self.authenticate()
 
     def _request(self, method: str, endpoint: str, params: Dict = None, private: bool = False,
-                 max_retries: int = 3, timeout: int = 30) -> Optional[Dict]:
+                 max_retries: int = 3,
+                 timeout: Optional[Union[float, Tuple[float, float]]] = None,
+                 use_cache: bool = True) -> Optional[Dict]:
         """
         Make HTTP request to Deribit API with retry logic
 
@@ -83,14 +379,46 @@ class DeribitClient:
             params: Request parameters
             private: Whether this is a private endpoint requiring auth
             max_retries: Maximum number of retry attempts
-            timeout: Request timeout in seconds
+            timeout: Request timeout in seconds (default: per-endpoint timeout)
+            use_cache: Serve cacheable public metadata from cache (False forces a refresh)
 
         Returns:
             API response as dict
         """
+        cacheable = not private and self.metadata_cache.is_cacheable(endpoint)
+        if cacheable:
+            if use_cache:
+                cached = self.metadata_cache.get(endpoint, params)
+                if cached is not None:
+                    return cached
+
+            response = self._send(method, endpoint, params, private, max_retries, timeout)
+            if response and "result" in response:
+                self.metadata_cache.put(endpoint, params, response)
+            return response
+
+        return self._send(method, endpoint, params, private, max_retries, timeout)
+
+    def _send(self, method: str, endpoint: str, params: Optional[Dict], private: bool,
+              max_retries: int, timeout: Optional[Union[float, Tuple[float, float]]]) -> Optional[Dict]:
+        """
+        Send a request over the configured transport (no caching)
+
+        Retries (up to max_retries attempts, exponential backoff):
+        - timeouts and rate limits (too_many_requests), every endpoint
+        - failed connections, every endpoint: the request never reached the exchange
+        - 502/503/504, public GETs only: replaying a private call (e.g. an order) is not safe
+        Any other error is returned as None without retrying.
+        """
         if private:
             self._check_token()
 
+        if timeout is None:
+            timeout = self._get_timeout(endpoint)
+
+        if self.ws is not None:
+            return self._ws_request(endpoint, params, max_retries, timeout)
+
         url = f"{self.base_url}{endpoint}"
         headers = {}
 
@@ -100,19 +428,48 @@ class DeribitClient:
         last_exception = None
 
         for attempt in range(max_retries):
+            if attempt > 0:
+                self.metrics.record_retry(endpoint)
+
             try:
+                self.rate_limiter.acquire(endpoint)
+
+                start = time.perf_counter()
                 if method == "GET":
-                    response = requests.get(url, params=params, headers=headers, timeout=timeout)
+                    response = self.session.get(url, params=params, headers=headers, timeout=timeout)
                 elif method == "POST":
-                    response = requests.post(url, json=params, headers=headers, timeout=timeout)
+                    response = self.session.post(url, json=params, headers=headers, timeout=timeout)
                 else:
                     raise ValueError(f"Unsupported method: {method}")
 
+                self.metrics.record_request(endpoint, time.perf_counter() - start, response.status_code,
+                                            len(response.content), error=response.status_code >= 400)
+
+                if self._is_rate_limited(response):
+                    self.metrics.record_rate_limited(endpoint)
+                    self.rate_limiter.on_rate_limited(endpoint)
+                    if attempt < max_retries - 1:
+                        continue
+                    logger.error(f"Rate limited on {endpoint} after {max_retries} attempts")
+                    return None
+
+                if (response.status_code in RETRY_STATUSES and method == "GET" and not private
+                        and attempt < max_retries - 1):
+                    wait_time = 2 ** attempt
+                    logger.warning(f"HTTP {response.status_code} on {endpoint} "
+                                   f"(attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s...")
+                    time.sleep(wait_time)
+                    continue
+
                 response.raise_for_status()
-                return response.json()
+                self.rate_limiter.on_success(endpoint)
+                data = response.json()
+                self._record(endpoint, params, data)
+                return data
 
             except requests.exceptions.Timeout as e:
                 last_exception = e
+                self.metrics.record_timeout(endpoint)
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
                     logger.warning(f"Timeout on {endpoint} (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s...")
@@ -122,9 +479,115 @@ class DeribitClient:
                     logger.error(f"Request timeout for {endpoint} after {max_retries} attempts: {e}")
                     return None
 
+            except requests.exceptions.ConnectionError as e:
+                last_exception = e
+                self.metrics.record_failure(endpoint, type(e).__name__)
+                if self._never_sent(e) and attempt < max_retries - 1:
+                    wait_time = 2 ** attempt
+                    logger.warning(f"Connection failed for {endpoint} (attempt {attempt + 1}/{max_retries}), "
+                                   f"retrying in {wait_time}s...")
+                    time.sleep(wait_time)
+                    continue
+                logger.error(f"Request error for {endpoint}: {e}")
+                return None
+
             except requests.exceptions.RequestException as e:
                 last_exception = e
-                # Don't retry on non-timeout errors (4xx, 5xx, connection refused, etc.)
+                if getattr(e, "response", None) is None:
+                    # HTTP errors were already recorded with their status code
+                    self.metrics.record_failure(endpoint, type(e).__name__)
+                # Don't retry other errors (4xx, private 5xx, ...)
+                logger.error(f"Request error for {endpoint}: {e}")
+                return None
+
+        return None
+
+    def _record(self, endpoint: str, params: Optional[Dict], response: Dict):
+        """Pass a response to the recorder, if any (recording never breaks a request)"""
+        if self.recorder is None:
+            return
+        try:
+            self.recorder(endpoint, params, response)
+        except Exception as e:
+            logger.warning(f"Recorder failed for {endpoint}: {e}")
+
+    @staticmethod
+    def _never_sent(error: requests.exceptions.ConnectionError) -> bool:
+        """True if the connection could not be established (nothing was sent)"""
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        # NewConnectionError (refused, DNS) is a ConnectTimeoutError subclass
+        return isinstance(reason, ConnectTimeoutError)
+
+    @staticmethod
+    def _is_rate_limited(response: requests.Response) -> bool:
+        """Check for Deribit's too_many_requests error"""
+        if response.status_code == 429:
+            return True
+        if response.status_code < 400:
+            return False
+        try:
+            return response.json().get("error", {}).get("code") == TOO_MANY_REQUESTS_CODE
+        except ValueError:
+            return False
+
+    def _ws_request(self, endpoint: str, params: Optional[Dict], max_retries: int,
+                    timeout: Union[float, Tuple[float, float]]) -> Optional[Dict]:
+        """
+        Make JSON-RPC request over the WebSocket transport
+
+        Mirrors _request: timeouts are retried with exponential backoff, other
+        failures (connection loss, API errors) return None.
+        """
+        method = endpoint.lstrip("/")
+        read_timeout = timeout[1] if isinstance(timeout, tuple) else timeout
+
+        # REST query strings carry booleans as "true"/"false", JSON-RPC wants real booleans
+        ws_params = {
+            k: (v == "true") if v in ("true", "false") else v
+            for k, v in (params or {}).items()
+        }
+
+        for attempt in range(max_retries):
+            if attempt > 0:
+                self.metrics.record_retry(endpoint)
+
+            try:
+                self.rate_limiter.acquire(endpoint)
+
+                start = time.perf_counter()
+                response = self.ws.call(method, ws_params, timeout=read_timeout)
+                error_code = response.get("error", {}).get("code")
+                self.metrics.record_request(endpoint, time.perf_counter() - start,
+                                            error_code if error_code is not None else "ok",
+                                            error=error_code is not None)
+
+                if error_code == TOO_MANY_REQUESTS_CODE:
+                    self.metrics.record_rate_limited(endpoint)
+                    self.rate_limiter.on_rate_limited(endpoint)
+                    if attempt < max_retries - 1:
+                        continue
+                    logger.error(f"Rate limited on {endpoint} after {max_retries} attempts")
+                    return None
+
+                if "error" in response:
+                    logger.error(f"Request error for {endpoint}: {response['error']}")
+                    return None
+                self.rate_limiter.on_success(endpoint)
+                self._record(endpoint, params, response)
+                return response
+
+            except TimeoutError as e:
+                self.metrics.record_timeout(endpoint)
+                if attempt < max_retries - 1:
+                    wait_time = 2 ** attempt
+                    logger.warning(f"Timeout on {endpoint} (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s...")
+                    time.sleep(wait_time)
+                    continue
+                logger.error(f"Request timeout for {endpoint} after {max_retries} attempts: {e}")
+                return None
+
+            except ConnectionError as e:
+                self.metrics.record_failure(endpoint, "connection_lost")
                 logger.error(f"Request error for {endpoint}: {e}")
                 return None
 
@@ -142,14 +605,19 @@ class DeribitClient:
             return response["result"]["index_price"]
         return None
 
-    def get_instruments(self, currency: str, kind: str = "option", expired: bool = False) -> List[Dict]:
+    def get_instruments(self, currency: str, kind: str = "option", expired: bool = False,
+                        force_refresh: bool = False) -> List[Dict]:
         """
         Get available instruments
 
+        Served from the metadata cache until its TTL or the next 08:00 UTC
+        settlement; the returned list is shared and must not be mutated.
+
         Args:
             currency: BTC or ETH
             kind: option, future, spot
             expired: Include expired instruments
+            force_refresh: Bypass the cache and fetch a fresh list
         """
         endpoint = "/public/get_instruments"
         params = {
@@ -157,7 +625,7 @@ class DeribitClient:
             "kind": kind,
             "expired": "true" if expired else "false"
         }
-        response = self._request("GET", endpoint, params)
+        response = self._request("GET", endpoint, params, use_cache=not force_refresh)
 
         if response and "result" in response:
             return response["result"]
@@ -176,6 +644,36 @@ class DeribitClient:
             return response["result"]
         return None
 
+    def get_book_summary_by_currency(self, currency: str, kind: str = "option") -> List[Dict]:
+        """
+        Get book summaries (mark price, mark IV, bid/ask, underlying) for every
+        instrument of a currency in a single request
+
+        Args:
+            currency: BTC or ETH
+            kind: option, future, spot
+        """
+        endpoint = "/public/get_book_summary_by_currency"
+        params = {
+            "currency": currency.upper(),
+            "kind": kind
+        }
+        response = self._request("GET", endpoint, params)
+
+        if response and "result" in response:
+            return response["result"]
+        return []
+
+    def get_ticker(self, instrument_name: str) -> Optional[Dict]:
+        """Get ticker (last/mark/best prices, greeks for options) for instrument"""
+        endpoint = "/public/ticker"
+        params = {"instrument_name": instrument_name}
+        response = self._request("GET", endpoint, params)
+
+        if response and "result" in response:
+            return response["result"]
+        return None
+
     def get_historical_volatility(self, currency: str) -> Optional[List[Dict]]:
         """Get historical volatility data"""
         endpoint = "/public/get_historical_volatility"
@@ -186,7 +684,50 @@ class DeribitClient:
             return response["result"]
         return None
 
-    def get_ohlcv(self, instrument_name: str, timeframe: str = "15", limit: int = 50) -> List[List[float]]:
+    def get_volatility_index_data(self, currency: str, start_timestamp: int, end_timestamp: int,
+                                  resolution: str = "3600", max_pages: int = 10) -> List[List[float]]:
+        """
+        Get volatility index (DVOL) candles, following continuation pages
+
+        Args:
+            currency: BTC or ETH
+            start_timestamp: Start in ms
+            end_timestamp: End in ms
+            resolution: Candle size in seconds (1, 60, 3600, 43200) or 1D
+            max_pages: Maximum requests (each returns up to ~1000 candles)
+
+        Returns:
+            [timestamp, open, high, low, close] rows oldest first (IV in percent),
+            empty on error
+        """
+        endpoint = "/public/get_volatility_index_data"
+        candles = {}
+
+        for _ in range(max_pages):
+            params = {
+                "currency": currency.upper(),
+                "start_timestamp": start_timestamp,
+                "end_timestamp": end_timestamp,
+                "resolution": resolution
+            }
+            response = self._request("GET", endpoint, params)
+            if not response or "result" not in response:
+                break
+
+            result = response["result"]
+            for candle in result.get("data", []):
+                candles[candle[0]] = candle
+
+            # Pages run backwards in time: continuation is the next end timestamp
+            continuation = result.get("continuation")
+            if not continuation or continuation <= start_timestamp or continuation >= end_timestamp:
+                break
+            end_timestamp = continuation
+
+        return [candles[ts] for ts in sorted(candles)]
+
+    def get_ohlcv(self, instrument_name: str, timeframe: str = "15", limit: int = 50,
+                  output: str = "list"):
         """
         Get OHLCV data (TradingView chart data)
         
@@ -194,57 +735,22 @@ class DeribitClient:
             instrument_name: e.g., BTC-PERPETUAL
             timeframe: Resolution in minutes (1, 3, 5, 10, 15, 30, 60, 120, 180, 360, 720, 1D)
             limit: Number of candles to return
+            output: "list" (rows), "array" (structured NumPy array) or
+                    "columns" (dict of NumPy arrays keyed by OHLCV_FIELDS)
             
         Returns:
-            List of [timestamp, open, high, low, close, volume]
+            List of [timestamp, open, high, low, close, volume], or the NumPy
+            equivalent for "array"/"columns" (empty on error)
         """
         endpoint = "/public/get_tradingview_chart_data"
-        
-        # Calculate start/end timestamps
-        # Resolution is in minutes (except 1D)
-        if timeframe == "1D":
-            res_minutes = 1440
-        elif timeframe.endswith("m"):
-             res_minutes = int(timeframe[:-1])
-        else:
-             res_minutes = int(timeframe)
-             
-        end_ts = int(time.time() * 1000)
-        start_ts = end_ts - (limit * res_minutes * 60 * 1000)
-        
-        params = {
-            "instrument_name": instrument_name,
-            "start_timestamp": start_ts,
-            "end_timestamp": end_ts,
-            "resolution": timeframe.replace("m", "") # Deribit uses "15" not "15m"
-        }
-        
+        params = ohlcv_params(instrument_name, timeframe, limit)
+
         response = self._request("GET", endpoint, params)
-        
+
         if response and "result" in response:
-            result = response["result"]
-            # Format: ticks (timestamp), open, high, low, close, volume
-            # We want list of lists: [[ts, o, h, l, c, v], ...]
-            ticks = result.get("ticks", [])
-            opens = result.get("open", [])
-            highs = result.get("high", [])
-            lows = result.get("low", [])
-            closes = result.get("close", [])
-            volumes = result.get("volume", [])
-            
-            ohlcv = []
-            for i in range(len(ticks)):
-                ohlcv.append([
-                    ticks[i],
-                    opens[i],
-                    highs[i],
-                    lows[i],
-                    closes[i],
-                    volumes[i]
-                ])
-            return ohlcv
-            
-        return []
+            return format_ohlcv(response["result"], output)
+
+        return format_ohlcv({}, output)
 
     # Private endpoints
 
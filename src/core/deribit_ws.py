@@ -0,0 +1,288 @@
+import json
+import time
+import itertools
+import threading
+from typing import Dict, List, Optional, Callable, Any, Tuple
+import logging
+
+import websocket
+
+logger = logging.getLogger(__name__)
+
+SubscriptionCallback = Callable[[str, Any], None]
+
+
+class _PendingCall:
+    """A request waiting for its JSON-RPC response"""
+
+    __slots__ = ("method", "event", "response")
+
+    def __init__(self, method: str):
+        self.method = method
+        self.event = threading.Event()
+        self.response: Optional[Dict] = None
+
+
+class DeribitWebSocketTransport:
+    """
+    JSON-RPC transport over a single Deribit WebSocket connection
+
+    Many requests can be in flight at once: each gets a unique id and the reader
+    thread hands every response back to the caller waiting on that id. If the
+    socket drops, in-flight calls fail, the transport reconnects with backoff,
+    re-authenticates with the stored credentials and restores subscriptions
+    before accepting new calls.
+    """
+
+    def __init__(self, url: str, connect_timeout: float = 10.0, heartbeat_interval: int = 30,
+                 max_reconnect_delay: float = 30.0):
+        """
+        Initialize WebSocket transport
+
+        Args:
+            url: WebSocket endpoint (e.g. wss://test.deribit.com/ws/api/v2)
+            connect_timeout: Timeout for opening the socket in seconds
+            heartbeat_interval: Deribit heartbeat interval in seconds (min 10)
+            max_reconnect_delay: Upper bound for reconnect backoff in seconds
+        """
+        self.url = url
+        self.connect_timeout = connect_timeout
+        self.heartbeat_interval = heartbeat_interval
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self._ws = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._start_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, _PendingCall] = {}
+
+        # Socket open (internal session restore may run) vs. ready for callers
+        self._socket_open = threading.Event()
+        self._ready = threading.Event()
+
+        self._credentials: Optional[Dict] = None
+        self._subscriptions: Dict[str, Tuple[SubscriptionCallback, bool]] = {}
+
+        # Called with the auth result whenever the transport re-authenticates
+        self.on_auth: Optional[Callable[[Dict], None]] = None
+        # Optional ClientMetrics receiving response payload sizes
+        self.metrics = None
+
+    @property
+    def connected(self) -> bool:
+        return self._ready.is_set()
+
+    def start(self):
+        """Start the connection thread (idempotent)"""
+        with self._start_lock:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="deribit-ws", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Close the connection and stop reconnecting"""
+        self._running = False
+        self._ready.clear()
+        self._socket_open.clear()
+        ws = self._ws
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception:
+                pass
+        self._fail_pending()
+
+    def set_credentials(self, auth_params: Optional[Dict]):
+        """Store public/auth params used to re-authenticate after a reconnect"""
+        self._credentials = dict(auth_params) if auth_params else None
+
+    def call(self, method: str, params: Dict = None, timeout: float = 10.0) -> Dict:
+        """
+        Send a JSON-RPC request and wait for its response
+
+        Args:
+            method: JSON-RPC method (e.g. public/get_order_book)
+            params: Method parameters
+            timeout: Seconds to wait for the connection and the response
+
+        Returns:
+            Full JSON-RPC response (with "result" or "error")
+
+        Raises:
+            TimeoutError: No response within timeout
+            ConnectionError: Connection lost before a response arrived
+        """
+        self.start()
+        if not self._ready.wait(timeout):
+            raise TimeoutError(f"WebSocket not connected, cannot send {method}")
+        return self._call(method, params, timeout)
+
+    def subscribe(self, channels: List[str], callback: SubscriptionCallback,
+                  private: bool = False, timeout: float = 10.0) -> List[str]:
+        """
+        Subscribe to channels; callback(channel, data) runs on the reader thread
+
+        Returns:
+            List of channels confirmed by Deribit
+        """
+        for channel in channels:
+            self._subscriptions[channel] = (callback, private)
+
+        method = "private/subscribe" if private else "public/subscribe"
+        response = self.call(method, {"channels": channels}, timeout)
+        return response.get("result") or []
+
+    def unsubscribe(self, channels: List[str], timeout: float = 10.0):
+        """Unsubscribe from channels"""
+        public = [c for c in channels if c in self._subscriptions and not self._subscriptions[c][1]]
+        private = [c for c in channels if c in self._subscriptions and self._subscriptions[c][1]]
+        for channel in channels:
+            self._subscriptions.pop(channel, None)
+
+        if public:
+            self.call("public/unsubscribe", {"channels": public}, timeout)
+        if private:
+            self.call("private/unsubscribe", {"channels": private}, timeout)
+
+    def _call(self, method: str, params: Optional[Dict], timeout: float) -> Dict:
+        request_id = next(self._ids)
+        pending = _PendingCall(method)
+        self._pending[request_id] = pending
+
+        try:
+            self._send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}})
+        except Exception as e:
+            self._pending.pop(request_id, None)
+            raise ConnectionError(f"WebSocket send failed for {method}: {e}") from e
+
+        if not pending.event.wait(timeout):
+            self._pending.pop(request_id, None)
+            raise TimeoutError(f"No response to {method} within {timeout}s")
+
+        if pending.response is None:
+            raise ConnectionError(f"WebSocket connection lost during {method}")
+
+        return pending.response
+
+    def _send(self, message: Dict):
+        with self._send_lock:
+            ws = self._ws
+            if ws is None or not self._socket_open.is_set():
+                raise ConnectionError("WebSocket is not connected")
+            ws.send(json.dumps(message))
+
+    def _fail_pending(self):
+        """Wake every waiting caller with an empty response"""
+        pending, self._pending = self._pending, {}
+        for call in pending.values():
+            call.event.set()
+
+    def _run(self):
+        """Connection loop: connect, restore session, read until the socket drops"""
+        delay = 1.0
+
+        while self._running:
+            try:
+                self._ws = websocket.create_connection(self.url, timeout=self.connect_timeout)
+                self._ws.settimeout(None)
+                self._socket_open.set()
+                delay = 1.0
+                logger.info(f"WebSocket connected to {self.url}")
+
+                # Session restore needs responses, so it cannot run on the reader thread
+                threading.Thread(target=self._restore_session, name="deribit-ws-restore",
+                                 daemon=True).start()
+
+                while self._running:
+                    raw = self._ws.recv()
+                    if not raw:
+                        raise ConnectionError("WebSocket closed by server")
+                    self._dispatch(json.loads(raw), len(raw))
+
+            except Exception as e:
+                if self._running:
+                    logger.warning(f"WebSocket connection error: {e}")
+
+            self._socket_open.clear()
+            self._ready.clear()
+            self._fail_pending()
+            ws, self._ws = self._ws, None
+            if ws is not None:
+                try:
+                    ws.close()
+                except Exception:
+                    pass
+
+            if self._running:
+                logger.info(f"Reconnecting WebSocket in {delay:.0f}s...")
+                time.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+
+    def _restore_session(self):
+        """Enable heartbeats, re-authenticate and re-subscribe after (re)connecting"""
+        try:
+            timeout = self.connect_timeout
+            self._call("public/set_heartbeat", {"interval": self.heartbeat_interval}, timeout)
+
+            if self._credentials:
+                response = self._call("public/auth", self._credentials, timeout)
+                if "result" in response:
+                    logger.info("WebSocket session authenticated")
+                    if self.on_auth:
+                        self.on_auth(response["result"])
+                else:
+                    logger.error(f"WebSocket re-authentication failed: {response.get('error')}")
+
+            public = [c for c, (_, private) in self._subscriptions.items() if not private]
+            private = [c for c, (_, private) in self._subscriptions.items() if private]
+            if public:
+                self._call("public/subscribe", {"channels": public}, timeout)
+            if private:
+                self._call("private/subscribe", {"channels": private}, timeout)
+
+            self._ready.set()
+
+        except Exception as e:
+            logger.error(f"Error restoring WebSocket session: {e}")
+            # Force a reconnect rather than serving calls on a half-restored session
+            ws = self._ws
+            if ws is not None:
+                try:
+                    ws.close()
+                except Exception:
+                    pass
+
+    def _dispatch(self, message: Dict, size: int = 0):
+        """Route a message to its waiting caller or subscription callback"""
+        request_id = message.get("id")
+        if request_id is not None:
+            pending = self._pending.pop(request_id, None)
+            if pending is not None:
+                if self.metrics is not None:
+                    self.metrics.record_bytes(f"/{pending.method}", size)
+                pending.response = message
+                pending.event.set()
+            return
+
+        method = message.get("method")
+        params = message.get("params") or {}
+
+        if method == "subscription":
+            channel = params.get("channel")
+            entry = self._subscriptions.get(channel)
+            if entry:
+                try:
+                    entry[0](channel, params.get("data"))
+                except Exception as e:
+                    logger.error(f"Error in subscription callback for {channel}: {e}")
+
+        elif method == "heartbeat" and params.get("type") == "test_request":
+            try:
+                self._send({"jsonrpc": "2.0", "id": next(self._ids), "method": "public/test", "params": {}})
+            except Exception as e:
+                logger.warning(f"Failed to answer heartbeat: {e}")
@@ -0,0 +1,207 @@
+import time
+import threading
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+import logging
+
+import numpy as np
+
+from src.core.deribit_client import DeribitClient
+
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 24 * 3600
+
+
+@lru_cache(maxsize=1024)
+def expiry_label(expiration_timestamp: int) -> str:
+    """Deribit expiry label (e.g. 27DEC24) of an expiration timestamp in ms"""
+    return datetime.fromtimestamp(expiration_timestamp / 1000).strftime("%d%b%y").upper()
+
+
+class _InstrumentTable:
+    """
+    Instruments of one currency as arrays sorted by (expiry, option type, strike)
+
+    Each expiry owns a contiguous row range; within it puts follow calls, so the
+    strikes of one expiry and type are a sorted slice.
+    """
+
+    def __init__(self, instruments: List[Dict]):
+        expiries = np.array([int(i.get("expiration_timestamp") or 0) for i in instruments], dtype=np.int64)
+        strikes = np.array([float(i.get("strike") or 0) for i in instruments], dtype=np.float64)
+        types = np.array([i.get("option_type") or "" for i in instruments], dtype="U4")
+        order = np.lexsort((strikes, types, expiries))
+
+        self.expiries = expiries[order]
+        self.strikes = strikes[order]
+        self.option_types = types[order]
+        self.tick_sizes = np.array([float(instruments[k].get("tick_size") or 0) for k in order],
+                                   dtype=np.float64)
+        self.contract_sizes = np.array([float(instruments[k].get("contract_size") or 0) for k in order],
+                                       dtype=np.float64)
+        self.instruments = [instruments[k] for k in order]
+        self.rows = {inst["instrument_name"]: row for row, inst in enumerate(self.instruments)}
+
+        # Expiry index: unique expiries with the start of their row range and of their puts
+        self.expiry_values, starts = np.unique(self.expiries, return_index=True)
+        self.expiry_starts = np.append(starts, len(self.expiries))
+        self.put_starts = np.array([
+            start + np.searchsorted(self.option_types[start:end], "put")
+            for start, end in zip(self.expiry_starts[:-1], self.expiry_starts[1:])
+        ], dtype=np.int64)
+        self.labels = {expiry_label(int(ts)): int(ts) for ts in self.expiry_values}
+
+    def expiry_rows(self, expiration_timestamp: int, option_type: Optional[str] = None) -> slice:
+        """Row range of an expiry (optionally one option type), empty if unknown"""
+        i = np.searchsorted(self.expiry_values, expiration_timestamp)
+        if i >= len(self.expiry_values) or self.expiry_values[i] != expiration_timestamp:
+            return slice(0, 0)
+
+        start, end = int(self.expiry_starts[i]), int(self.expiry_starts[i + 1])
+        if option_type == "call":
+            return slice(start, int(self.put_starts[i]))
+        if option_type == "put":
+            return slice(int(self.put_starts[i]), end)
+        return slice(start, end)
+
+
+class InstrumentRegistry:
+    """
+    Instrument metadata parsed once into per-currency arrays
+
+    Expiries and per-expiry strikes are kept sorted so DTE ranges and strikes
+    around a price are binary searches instead of walks over every instrument
+    dict. refresh() only re-parses when instruments are listed or delisted,
+    and drops expired instruments without an API call.
+    """
+
+    def __init__(self, client: DeribitClient, kind: str = "option"):
+        """
+        Initialize instrument registry
+
+        Args:
+            client: Deribit API client
+            kind: Instrument kind to track
+        """
+        self.client = client
+        self.kind = kind
+        self._lock = threading.Lock()
+        self._tables: Dict[str, _InstrumentTable] = {}
+        # Last instrument list each table was built from (cached lists come back as the same object)
+        self._sources: Dict[str, List[Dict]] = {}
+
+    def refresh(self, currency: str, instruments: Optional[List[Dict]] = None) -> int:
+        """
+        Update a currency from the exchange (or a given instrument list)
+
+        Args:
+            currency: BTC or ETH
+            instruments: Instrument list (fetched if not provided)
+
+        Returns:
+            Number of live instruments tracked for the currency
+        """
+        if instruments is None:
+            instruments = self.client.get_instruments(currency, kind=self.kind)
+
+        now_ms = int(time.time() * 1000)
+
+        with self._lock:
+            table = self._tables.get(currency)
+
+            if table is not None and (not instruments or instruments is self._sources.get(currency)):
+                if not instruments:
+                    logger.warning(f"No instruments returned for {currency}, keeping the current registry")
+                # Nothing listed or delisted: only drop what has expired since
+                live = [inst for inst in table.instruments if inst["expiration_timestamp"] > now_ms]
+            else:
+                self._sources[currency] = instruments
+                live = [inst for inst in instruments if inst.get("expiration_timestamp")
+                        and inst["expiration_timestamp"] > now_ms]
+
+            if table is not None and len(live) == len(table.instruments) and all(
+                    inst["instrument_name"] in table.rows for inst in live):
+                return len(live)
+
+            self._tables[currency] = _InstrumentTable(live)
+            if table is not None:
+                logger.debug(f"Instrument registry {currency}: {len(table.instruments)} -> {len(live)}")
+            return len(live)
+
+    def _table(self, currency: str) -> Optional[_InstrumentTable]:
+        return self._tables.get(currency)
+
+    def expiries(self, currency: str) -> np.ndarray:
+        """Sorted expiration timestamps (ms) of a currency"""
+        table = self._table(currency)
+        return table.expiry_values if table else np.empty(0, dtype=np.int64)
+
+    def expiries_in_dte(self, currency: str, min_dte: int, max_dte: int,
+                        now: Optional[float] = None) -> List[Tuple[str, int]]:
+        """
+        Expiries whose whole days to expiry fall within [min_dte, max_dte]
+
+        Returns:
+            List of (expiry label, days to expiry), nearest expiry first
+        """
+        table = self._table(currency)
+        if table is None:
+            return []
+
+        now = time.time() if now is None else now
+        values = table.expiry_values
+        lo = np.searchsorted(values, (now + min_dte * SECONDS_PER_DAY) * 1000, side="left")
+        hi = np.searchsorted(values, (now + (max_dte + 1) * SECONDS_PER_DAY) * 1000, side="left")
+
+        return [
+            (expiry_label(int(ts)), int((ts / 1000 - now) // SECONDS_PER_DAY))
+            for ts in values[lo:hi]
+        ]
+
+    def expiry_timestamp(self, currency: str, expiration: str) -> Optional[int]:
+        """Expiration timestamp (ms) of an expiry label, None if not listed"""
+        table = self._table(currency)
+        return table.labels.get(expiration) if table else None
+
+    def strikes(self, currency: str, expiration: str, option_type: Optional[str] = None) -> np.ndarray:
+        """Sorted unique strikes of an expiry (optionally one option type)"""
+        table = self._table(currency)
+        ts = self.expiry_timestamp(currency, expiration)
+        if table is None or ts is None:
+            return np.empty(0, dtype=np.float64)
+
+        strikes = table.strikes[table.expiry_rows(ts, option_type)]
+        return strikes if option_type else np.unique(strikes)
+
+    def strikes_around(self, currency: str, expiration: str, price: float, count: int = 5,
+                       option_type: Optional[str] = None) -> np.ndarray:
+        """Up to `count` strikes below and `count` strikes at or above a price"""
+        strikes = self.strikes(currency, expiration, option_type)
+        i = np.searchsorted(strikes, price)
+        return strikes[max(0, i - count):i + count]
+
+    def instruments_for_expiry(self, currency: str, expiration: str,
+                               option_type: Optional[str] = None) -> List[Dict]:
+        """Instrument dicts of an expiry, sorted by option type then strike (shared: do not mutate)"""
+        table = self._table(currency)
+        ts = self.expiry_timestamp(currency, expiration)
+        if table is None or ts is None:
+            return []
+        return table.instruments[table.expiry_rows(ts, option_type)]
+
+    def get(self, instrument_name: str) -> Optional[Dict]:
+        """Instrument dict by name, from whichever currency lists it"""
+        for table in list(self._tables.values()):
+            row = table.rows.get(instrument_name)
+            if row is not None:
+                return table.instruments[row]
+        return None
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Instrument and expiry counts per currency"""
+        return {
+            currency: {"instruments": len(table.instruments), "expiries": len(table.expiry_values)}
+            for currency, table in sorted(self._tables.items())
+        }
@@ -0,0 +1,210 @@
+import time
+import threading
+from typing import Callable, Dict, List, Optional, Set, Tuple, Any
+import logging
+
+from src.core.deribit_client import DeribitClient
+from src.core.deribit_ws import DeribitWebSocketTransport
+
+logger = logging.getLogger(__name__)
+
+
+class MarketDataHub:
+    """
+    In-memory market data cache fed by Deribit WebSocket subscriptions
+
+    Exposes get_ticker / get_order_book / get_index_price with the same signatures
+    as DeribitClient, so components can read from it instead of the client. Each
+    cached value carries the local time it was received; values older than max_age
+    (or never received) fall back to a REST call and trigger a subscription so the
+    next read is served from memory.
+    """
+
+    def __init__(self, client: DeribitClient, max_age: float = 5.0, interval: str = "100ms",
+                 book_depth: int = 10):
+        """
+        Initialize market data hub
+
+        Args:
+            client: Deribit client used for REST fallbacks (and its WebSocket, if any)
+            max_age: Max age in seconds before a cached value is considered stale
+            interval: Subscription notification interval (raw, 100ms, agg2)
+            book_depth: Levels kept per side from book.* channels
+        """
+        self.client = client
+        self.max_age = max_age
+        self.interval = interval
+        self.book_depth = book_depth
+
+        # Share the client's socket when it already talks WebSocket
+        self.transport = client.ws if client.ws is not None else DeribitWebSocketTransport(client.ws_url)
+
+        self._tickers: Dict[str, Tuple[float, Dict]] = {}
+        self._books: Dict[str, Tuple[float, Dict]] = {}
+        self._index_prices: Dict[str, Tuple[float, float]] = {}
+
+        self._subscribed: Set[str] = set()
+        self._lock = threading.Lock()
+        self._ticker_listeners: List[Callable[[Dict], Any]] = []
+
+        self.stats = {"hits": 0, "misses": 0, "stale": 0}
+
+    def start(self):
+        """Open the WebSocket connection"""
+        self.transport.start()
+
+    def stop(self):
+        """Close the WebSocket connection (only if the hub owns it)"""
+        if self.transport is not self.client.ws:
+            self.transport.stop()
+
+    # Subscriptions
+
+    def track_instruments(self, instrument_names: List[str]):
+        """Subscribe to ticker and book channels for instruments"""
+        channels = []
+        for name in instrument_names:
+            channels.append(f"ticker.{name}.{self.interval}")
+            channels.append(f"book.{name}.none.{self.book_depth}.{self.interval}")
+        self._subscribe_async(channels)
+
+    def track_currencies(self, currencies: List[str]):
+        """Subscribe to index price channels for currencies"""
+        self._subscribe_async([f"deribit_price_index.{c.lower()}_usd" for c in currencies])
+
+    def untrack_instruments(self, instrument_names: List[str]):
+        """Unsubscribe from an instrument's channels and drop its cached data"""
+        channels = []
+        for name in instrument_names:
+            channels.append(f"ticker.{name}.{self.interval}")
+            channels.append(f"book.{name}.none.{self.book_depth}.{self.interval}")
+            self._tickers.pop(name, None)
+            self._books.pop(name, None)
+
+        with self._lock:
+            channels = [c for c in channels if c in self._subscribed]
+            self._subscribed.difference_update(channels)
+
+        if channels:
+            try:
+                self.transport.unsubscribe(channels)
+            except Exception as e:
+                logger.warning(f"Failed to unsubscribe {channels}: {e}")
+
+    def add_ticker_listener(self, callback: Callable[[Dict], Any]):
+        """
+        Call back with every ticker notification (on the WebSocket reader thread)
+
+        E.g. hub.add_ticker_listener(chain.update_tick) keeps an OptionsChain
+        current in place.
+        """
+        self._ticker_listeners.append(callback)
+
+    def remove_ticker_listener(self, callback: Callable[[Dict], Any]):
+        if callback in self._ticker_listeners:
+            self._ticker_listeners.remove(callback)
+
+    def _subscribe_async(self, channels: List[str]):
+        """Subscribe in the background so the caller never waits on the socket"""
+        with self._lock:
+            new = [c for c in channels if c not in self._subscribed]
+            self._subscribed.update(new)
+
+        if new:
+            threading.Thread(target=self._subscribe, args=(new,), daemon=True).start()
+
+    def _subscribe(self, channels: List[str]):
+        try:
+            self.transport.subscribe(channels, self._on_message)
+            logger.info(f"Subscribed to {len(channels)} market data channels")
+        except Exception as e:
+            logger.warning(f"Market data subscription failed: {e}")
+            with self._lock:
+                self._subscribed.difference_update(channels)
+
+    def _on_message(self, channel: str, data: Any):
+        """Store a subscription notification (runs on the WebSocket reader thread)"""
+        now = time.monotonic()
+        kind = channel.split(".", 1)[0]
+
+        if kind == "ticker":
+            self._tickers[data["instrument_name"]] = (now, data)
+            for listener in list(self._ticker_listeners):
+                try:
+                    listener(data)
+                except Exception as e:
+                    logger.warning(f"Ticker listener failed: {e}")
+        elif kind == "book":
+            self._books[data["instrument_name"]] = (now, data)
+        elif kind == "deribit_price_index":
+            self._index_prices[data["index_name"]] = (now, data["price"])
+
+    # Cached reads
+
+    def _fresh(self, entry: Optional[Tuple[float, Any]]) -> bool:
+        return entry is not None and time.monotonic() - entry[0] <= self.max_age
+
+    def _record(self, entry: Optional[Tuple[float, Any]]):
+        if entry is None:
+            self.stats["misses"] += 1
+        elif self._fresh(entry):
+            self.stats["hits"] += 1
+        else:
+            self.stats["stale"] += 1
+
+    def get_age(self, instrument_name: str) -> Optional[float]:
+        """Seconds since the last ticker update for an instrument (None if never received)"""
+        entry = self._tickers.get(instrument_name)
+        return time.monotonic() - entry[0] if entry else None
+
+    def get_index_price(self, currency: str) -> Optional[float]:
+        """Get index price from cache, falling back to REST when stale"""
+        entry = self._index_prices.get(f"{currency.lower()}_usd")
+        self._record(entry)
+        if self._fresh(entry):
+            return entry[1]
+
+        self.track_currencies([currency])
+        return self.client.get_index_price(currency)
+
+    def get_ticker(self, instrument_name: str) -> Optional[Dict]:
+        """Get ticker from cache, falling back to REST when stale"""
+        entry = self._tickers.get(instrument_name)
+        self._record(entry)
+        if self._fresh(entry):
+            return entry[1]
+
+        self.track_instruments([instrument_name])
+        return self.client.get_ticker(instrument_name)
+
+    def get_order_book(self, instrument_name: str, depth: int = 5) -> Optional[Dict]:
+        """
+        Get order book from cache, falling back to REST when stale
+
+        The cached book is the latest ticker (mark price, best bid/ask, greeks, IV)
+        merged with the top `depth` levels of the latest book notification, which
+        matches the fields of a REST order book response.
+        """
+        ticker = self._tickers.get(instrument_name)
+        book = self._books.get(instrument_name)
+
+        if self._fresh(ticker) and self._fresh(book):
+            self.stats["hits"] += 1
+            result = dict(ticker[1])
+            result["bids"] = book[1].get("bids", [])[:depth]
+            result["asks"] = book[1].get("asks", [])[:depth]
+            return result
+
+        self.stats["misses" if ticker is None or book is None else "stale"] += 1
+        self.track_instruments([instrument_name])
+        return self.client.get_order_book(instrument_name, depth=depth)
+
+    def get_cache_summary(self) -> Dict:
+        """Get cache size and hit statistics"""
+        return {
+            "tickers": len(self._tickers),
+            "books": len(self._books),
+            "index_prices": len(self._index_prices),
+            "subscriptions": len(self._subscribed),
+            **self.stats
+        }
@@ -0,0 +1,123 @@
+import time
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple, Callable, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Public metadata endpoints that may be cached, with their TTL in seconds
+METADATA_TTLS = {
+    "/public/get_instruments": 300,
+    "/public/get_instrument": 300,
+    "/public/get_currencies": 3600,
+    "/public/get_contract_size": 3600,
+    "/public/get_historical_volatility": 900,
+}
+
+# Endpoints whose data changes when expiries settle
+SETTLEMENT_SENSITIVE = {
+    "/public/get_instruments",
+    "/public/get_instrument",
+}
+
+# Deribit options and futures settle daily at 08:00 UTC
+SETTLEMENT_HOUR_UTC = 8
+
+
+def next_settlement(now: float) -> float:
+    """Timestamp of the next 08:00 UTC settlement after `now`"""
+    now_dt = datetime.fromtimestamp(now, tz=timezone.utc)
+    settlement = now_dt.replace(hour=SETTLEMENT_HOUR_UTC, minute=0, second=0, microsecond=0)
+    if settlement <= now_dt:
+        settlement += timedelta(days=1)
+    return settlement.timestamp()
+
+
+class MetadataCache:
+    """
+    TTL cache for public metadata responses
+
+    Entries expire after their endpoint's TTL, and settlement-sensitive entries
+    (instrument lists) also expire at the next 08:00 UTC settlement, when expiries
+    disappear. Cached responses are shared: callers must not mutate them.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None,
+                 clock: Callable[[], float] = time.time):
+        """
+        Initialize metadata cache
+
+        Args:
+            ttls: Per-endpoint TTL overrides in seconds (0 disables caching)
+            clock: Wall clock returning epoch seconds (injectable for tests)
+        """
+        self.ttls = dict(METADATA_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+
+    def is_cacheable(self, endpoint: str) -> bool:
+        return self.ttls.get(endpoint, 0) > 0
+
+    @staticmethod
+    def _key(endpoint: str, params: Optional[Dict]) -> Tuple:
+        return (endpoint,) + tuple(sorted((params or {}).items()))
+
+    def get(self, endpoint: str, params: Optional[Dict]) -> Optional[Any]:
+        """Get a cached response, or None on a miss or expired entry"""
+        key = self._key(endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() < entry[0]:
+                self._hits[endpoint] = self._hits.get(endpoint, 0) + 1
+                return entry[1]
+
+            if entry is not None:
+                del self._entries[key]
+            self._misses[endpoint] = self._misses.get(endpoint, 0) + 1
+            return None
+
+    def put(self, endpoint: str, params: Optional[Dict], response: Any):
+        """Store a response until its TTL (or the next settlement) expires"""
+        now = self._clock()
+        expires_at = now + self.ttls[endpoint]
+        if endpoint in SETTLEMENT_SENSITIVE:
+            expires_at = min(expires_at, next_settlement(now))
+
+        with self._lock:
+            self._entries[self._key(endpoint, params)] = (expires_at, response)
+
+    def invalidate(self, endpoint: Optional[str] = None):
+        """Drop cached entries for one endpoint (or all endpoints)"""
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+            else:
+                self._entries = {k: v for k, v in self._entries.items() if k[0] != endpoint}
+
+    def stats(self) -> Dict:
+        """
+        Get hit/miss counters
+
+        Returns:
+            Dict with totals, hit rate and per-endpoint counters
+        """
+        with self._lock:
+            hits = sum(self._hits.values())
+            misses = sum(self._misses.values())
+            endpoints = sorted(set(self._hits) | set(self._misses))
+            return {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses) * 100, 1) if hits + misses else 0.0,
+                "entries": len(self._entries),
+                "by_endpoint": {
+                    e: {"hits": self._hits.get(e, 0), "misses": self._misses.get(e, 0)}
+                    for e in endpoints
+                }
+            }
@@ -0,0 +1,226 @@
+import os
+import json
+import time
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class EndpointStats:
+    """Counters and latency histogram for one endpoint"""
+
+    __slots__ = ("requests", "errors", "retries", "timeouts", "rate_limited",
+                 "status", "buckets", "latency_sum", "latency_min", "latency_max",
+                 "bytes_total", "bytes_max")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.timeouts = 0
+        self.rate_limited = 0
+        self.status: Dict[str, int] = {}
+        self.buckets: List[int] = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.latency_sum = 0.0
+        self.latency_min: Optional[float] = None
+        self.latency_max: Optional[float] = None
+        self.bytes_total = 0
+        self.bytes_max = 0
+
+    def observe_latency(self, latency_ms: float):
+        index = len(LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if latency_ms <= bound:
+                index = i
+                break
+        self.buckets[index] += 1
+        self.latency_sum += latency_ms
+        self.latency_min = latency_ms if self.latency_min is None else min(self.latency_min, latency_ms)
+        self.latency_max = latency_ms if self.latency_max is None else max(self.latency_max, latency_ms)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Latency percentile estimate (upper bound of the bucket holding it), in ms"""
+        observed = sum(self.buckets)
+        if not observed:
+            return None
+
+        rank = pct / 100 * observed
+        cumulative = 0
+        for i, count in enumerate(self.buckets):
+            cumulative += count
+            if cumulative >= rank:
+                return float(LATENCY_BUCKETS_MS[i]) if i < len(LATENCY_BUCKETS_MS) else self.latency_max
+        return self.latency_max
+
+    def to_dict(self) -> Dict[str, Any]:
+        observed = sum(self.buckets)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+            "rate_limited": self.rate_limited,
+            "status": dict(self.status),
+            "latency_ms": {
+                "avg": round(self.latency_sum / observed, 2) if observed else None,
+                "min": round(self.latency_min, 2) if self.latency_min is not None else None,
+                "max": round(self.latency_max, 2) if self.latency_max is not None else None,
+                "p50": self.percentile(50),
+                "p95": self.percentile(95),
+                "p99": self.percentile(99),
+                "histogram": {
+                    **{f"<={b}": n for b, n in zip(LATENCY_BUCKETS_MS, self.buckets)},
+                    f">{LATENCY_BUCKETS_MS[-1]}": self.buckets[-1]
+                }
+            },
+            "bytes": {
+                "total": self.bytes_total,
+                "avg": round(self.bytes_total / self.requests) if self.requests else 0,
+                "max": self.bytes_max
+            }
+        }
+
+
+class ClientMetrics:
+    """
+    Per-endpoint request instrumentation shared by all transports
+
+    Every attempt is recorded with its latency and outcome (HTTP status, or the
+    JSON-RPC error code over WebSocket). Queryable in process via snapshot() and
+    written to a JSON file by dump().
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointStats] = {}
+        self.started_at = time.time()
+
+    def _stats(self, endpoint: str) -> EndpointStats:
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = EndpointStats()
+        return stats
+
+    def record_request(self, endpoint: str, latency: float, status: Any, size: int = 0,
+                       error: bool = False):
+        """
+        Record one completed request attempt
+
+        Args:
+            endpoint: API endpoint
+            latency: Round-trip time in seconds
+            status: HTTP status code or JSON-RPC outcome ("ok" / error code)
+            size: Response payload size in bytes
+            error: Whether the attempt failed
+        """
+        with self._lock:
+            stats = self._stats(endpoint)
+            stats.requests += 1
+            stats.observe_latency(latency * 1000)
+            key = str(status)
+            stats.status[key] = stats.status.get(key, 0) + 1
+            if error:
+                stats.errors += 1
+            if size:
+                stats.bytes_total += size
+                stats.bytes_max = max(stats.bytes_max, size)
+
+    def record_bytes(self, endpoint: str, size: int):
+        """Record a payload size measured separately from the request (WebSocket)"""
+        with self._lock:
+            stats = self._stats(endpoint)
+            stats.bytes_total += size
+            stats.bytes_max = max(stats.bytes_max, size)
+
+    def record_timeout(self, endpoint: str):
+        with self._lock:
+            stats = self._stats(endpoint)
+            stats.requests += 1
+            stats.timeouts += 1
+            stats.errors += 1
+
+    def record_failure(self, endpoint: str, reason: str):
+        """Record an attempt that failed without a response (connection error, ...)"""
+        with self._lock:
+            stats = self._stats(endpoint)
+            stats.requests += 1
+            stats.errors += 1
+            stats.status[reason] = stats.status.get(reason, 0) + 1
+
+    def record_retry(self, endpoint: str):
+        with self._lock:
+            self._stats(endpoint).retries += 1
+
+    def record_rate_limited(self, endpoint: str):
+        with self._lock:
+            self._stats(endpoint).rate_limited += 1
+
+    def get_endpoint(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """Get stats for one endpoint"""
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            return stats.to_dict() if stats else None
+
+    def latency_percentile(self, endpoint: str, pct: float) -> Optional[float]:
+        """Estimated latency percentile for an endpoint in ms"""
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            return stats.percentile(pct) if stats else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get stats for all endpoints plus totals"""
+        with self._lock:
+            endpoints = {name: stats.to_dict() for name, stats in sorted(self._endpoints.items())}
+
+        return {
+            "since": datetime.fromtimestamp(self.started_at).isoformat(),
+            "totals": {
+                "requests": sum(e["requests"] for e in endpoints.values()),
+                "errors": sum(e["errors"] for e in endpoints.values()),
+                "retries": sum(e["retries"] for e in endpoints.values()),
+                "timeouts": sum(e["timeouts"] for e in endpoints.values()),
+                "rate_limited": sum(e["rate_limited"] for e in endpoints.values()),
+                "bytes": sum(e["bytes"]["total"] for e in endpoints.values()),
+            },
+            "endpoints": endpoints
+        }
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+            self.started_at = time.time()
+
+    def dump(self, path: str, extra: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Write a snapshot to a JSON file (atomically replaced)
+
+        Args:
+            path: Output file path
+            extra: Additional sections to include (e.g. rate limit headroom)
+
+        Returns:
+            True if written successfully
+        """
+        data = {"timestamp": datetime.now().isoformat(), **self.snapshot()}
+        if extra:
+            data.update(extra)
+
+        try:
+            directory = os.path.dirname(path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, indent=2, default=str)
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to dump metrics to {path}: {e}")
+            return False
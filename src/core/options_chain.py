@@ -0,0 +1,206 @@
+"""
+Columnar options chain
+
+One NumPy array per field instead of one dict per option. Chains built by
+OptionsChainLoader are sorted by expiry, option type and strike, so views by
+expiry and type are slices that share memory with the parent chain: a tick
+applied through any view is visible everywhere.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+# Column name -> dtype (market data columns are NaN until known, marks 0 like Deribit)
+COLUMNS = {
+    "names": object,
+    "strikes": np.float64,
+    "option_types": "U4",
+    "expiries": np.int64,
+    "marks": np.float64,
+    "ivs": np.float64,
+    "bids": np.float64,
+    "asks": np.float64,
+    "underlying": np.float64,
+    "deltas": np.float64,
+    "gammas": np.float64,
+    "vegas": np.float64,
+    "thetas": np.float64,
+    "greeks_estimated": bool,
+}
+
+GREEKS = ("delta", "gamma", "vega", "theta")
+
+# Ticker / order book field -> column
+_TICK_FIELDS = (
+    ("mark_price", "marks"),
+    ("mark_iv", "ivs"),
+    ("best_bid_price", "bids"),
+    ("best_ask_price", "asks"),
+    ("underlying_price", "underlying"),
+)
+
+
+def _float(value) -> float:
+    return np.nan if value is None else float(value)
+
+
+class OptionsChain:
+    """
+    Options chain backed by NumPy arrays
+
+    Attributes are the COLUMNS arrays (strikes, option_types, expiries, marks,
+    ivs, bids, asks, underlying, deltas, gammas, vegas, thetas, ...). Marks and
+    bid/ask are in coin, ivs in percent (like Deribit's mark_iv) and greeks
+    follow Deribit's conventions.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        for name in COLUMNS:
+            setattr(self, name, columns[name])
+        self._index: Optional[Dict[str, int]] = None
+        self._by_strike: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        order = np.lexsort((self.strikes, self.option_types, self.expiries))
+        self._sorted = bool((order == np.arange(len(order))).all())
+
+    @classmethod
+    def empty(cls) -> "OptionsChain":
+        return cls.from_instruments([])
+
+    @classmethod
+    def from_instruments(cls, instruments: Iterable[Dict]) -> "OptionsChain":
+        """Chain of instrument dicts (get_instruments) without market data (unnamed dicts allowed)"""
+        instruments = list(instruments)
+        n = len(instruments)
+        columns = {name: np.full(n, np.nan) for name in COLUMNS}
+        columns["names"] = np.empty(n, dtype=object)
+        columns["names"][:] = [inst.get("instrument_name", "") for inst in instruments]
+        columns["strikes"] = np.array([inst.get("strike") or 0 for inst in instruments], dtype=np.float64)
+        columns["option_types"] = np.array([inst.get("option_type") or "" for inst in instruments], dtype="U4")
+        columns["expiries"] = np.array([inst.get("expiration_timestamp") or 0 for inst in instruments],
+                                       dtype=np.int64)
+        columns["marks"] = np.zeros(n)
+        columns["greeks_estimated"] = np.zeros(n, dtype=bool)
+        return cls(columns)
+
+    @classmethod
+    def from_dicts(cls, options: List[Dict]) -> "OptionsChain":
+        """Chain of option dicts (instrument fields plus marks and greeks), rows in list order"""
+        chain = cls.from_instruments(options)
+        for row, option in enumerate(options):
+            chain._set_row(row, option)
+            chain.greeks_estimated[row] = bool(option.get("greeks_estimated", False))
+        return chain
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def index(self) -> Dict[str, int]:
+        """Instrument name -> row"""
+        if self._index is None:
+            self._index = {name: row for row, name in enumerate(self.names)}
+        return self._index
+
+    def row(self, instrument_name: str) -> Optional[int]:
+        return self.index.get(instrument_name)
+
+    def option(self, row: int) -> Dict:
+        """One row as an option dict (the shape the loader used to return)"""
+        greeks = {}
+        for greek in GREEKS:
+            value = getattr(self, greek + "s")[row]
+            if np.isfinite(value):
+                greeks[greek] = float(value)
+
+        def optional(value):
+            return float(value) if np.isfinite(value) else None
+
+        return {
+            "instrument_name": self.names[row],
+            "strike": float(self.strikes[row]),
+            "option_type": str(self.option_types[row]),
+            "expiration_timestamp": int(self.expiries[row]),
+            "mark_price": float(self.marks[row]),
+            "mark_iv": float(self.ivs[row]) if np.isfinite(self.ivs[row]) else 0,
+            "best_bid_price": optional(self.bids[row]),
+            "best_ask_price": optional(self.asks[row]),
+            "underlying_price": optional(self.underlying[row]),
+            "greeks": greeks,
+            "greeks_estimated": bool(self.greeks_estimated[row]),
+        }
+
+    def to_dicts(self) -> List[Dict]:
+        return [self.option(row) for row in range(len(self))]
+
+    # Views
+
+    def _take(self, index: Union[slice, np.ndarray]) -> "OptionsChain":
+        return OptionsChain({name: getattr(self, name)[index] for name in COLUMNS})
+
+    def view(self, expiration_timestamp: Optional[int] = None,
+             option_type: Optional[str] = None) -> "OptionsChain":
+        """
+        Rows of one expiry and/or option type
+
+        On a sorted chain the rows are contiguous and the view shares memory
+        with this chain; otherwise it is a copy.
+        """
+        single_expiry = len(self) == 0 or self.expiries[0] == self.expiries[-1]
+        if self._sorted and (expiration_timestamp is not None or option_type is None or single_expiry):
+            lo, hi = 0, len(self)
+            if expiration_timestamp is not None:
+                lo = int(np.searchsorted(self.expiries, expiration_timestamp, side="left"))
+                hi = int(np.searchsorted(self.expiries, expiration_timestamp, side="right"))
+            if option_type is not None:
+                types = self.option_types[lo:hi]
+                lo, hi = (lo + int(np.searchsorted(types, option_type, side="left")),
+                          lo + int(np.searchsorted(types, option_type, side="right")))
+            return self._take(slice(lo, hi))
+
+        mask = np.ones(len(self), dtype=bool)
+        if expiration_timestamp is not None:
+            mask &= self.expiries == expiration_timestamp
+        if option_type is not None:
+            mask &= self.option_types == option_type
+        return self._take(np.flatnonzero(mask))
+
+    def by_strike(self, option_type: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Rows of one option type sorted by strike (stable) and their strikes"""
+        if option_type not in self._by_strike:
+            rows = np.flatnonzero(self.option_types == option_type)
+            rows = rows[np.argsort(self.strikes[rows], kind="stable")]
+            self._by_strike[option_type] = (rows, self.strikes[rows])
+        return self._by_strike[option_type]
+
+    @property
+    def expiration_timestamps(self) -> np.ndarray:
+        return np.unique(self.expiries)
+
+    # Updates
+
+    def _set_row(self, row: int, data: Dict):
+        for field, column in _TICK_FIELDS:
+            if field in data:
+                getattr(self, column)[row] = _float(data[field])
+        if "mark_price" in data:
+            self.marks[row] = data["mark_price"] or 0
+        if "greeks" in data:
+            greeks = data["greeks"] or {}
+            for greek in GREEKS:
+                getattr(self, greek + "s")[row] = _float(greeks.get(greek))
+
+    def update_tick(self, ticker: Dict, instrument_name: Optional[str] = None) -> bool:
+        """
+        Apply a ticker or order book (REST or subscription notification) in place
+
+        Returns:
+            False if the instrument is not in this chain
+        """
+        row = self.row(instrument_name or ticker.get("instrument_name"))
+        if row is None:
+            return False
+
+        self._set_row(row, ticker)
+        self.greeks_estimated[row] = False
+        return True
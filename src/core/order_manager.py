@@ -11,7 +11,7 @@ class OrderManager:
     """Manage order execution for Iron Condor structures"""
 
     def __init__(self, client: DeribitClient, max_retries: int = 3, retry_delay: float = 1.0,
-                 use_aggressive_limits: bool = True, slippage_pct: float = 0.10):
+                 use_aggressive_limits: bool = True, slippage_pct: float = 0.10, market_data=None):
         """
         Initialize order manager
 
@@ -21,8 +21,10 @@ class OrderManager:
             retry_delay: Delay between retries in seconds
             use_aggressive_limits: Use aggressive limit orders for better fills
             slippage_pct: Slippage percentage for aggressive limits (e.g., 0.10 = 10%)
+            market_data: Optional MarketDataHub for cached order books (default: client)
         """
         self.client = client
+        self.market_data = market_data or client
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.use_aggressive_limits = use_aggressive_limits
@@ -65,9 +67,6 @@ class OrderManager:
                     self._rollback_orders(opened_orders, condor.size)
                     return False
 
-                # Small delay between legs
-                time.sleep(0.5)
-
             logger.info(f"Successfully opened Iron Condor: {condor.id}")
             return True
 
@@ -107,8 +106,6 @@ class OrderManager:
                 logger.error(f"  ✗ Failed to close {leg.option_type} @ {leg.strike}")
                 all_closed = False
 
-            time.sleep(0.5)
-
         if all_closed:
             logger.info(f"Successfully closed Iron Condor: {condor.id}")
         else:
@@ -152,7 +149,7 @@ class OrderManager:
         """
         try:
             # Get order book
-            book = self.client.get_order_book(instrument_name, depth=5)
+            book = self.market_data.get_order_book(instrument_name, depth=5)
 
             if not book:
                 logger.warning(f"No order book for {instrument_name}, using mark price")
@@ -257,6 +254,11 @@ class OrderManager:
                     order_state = order.get('order_state', 'unknown')
                     logger.info(f"Order placed: {order_id}, state: {order_state}")
 
+                    # Aggressive limits usually fill on placement, no need to poll
+                    if order_state == 'filled':
+                        logger.info(f"Order {order_id} FILLED on placement")
+                        return True
+
                     # Verify order was filled
                     if self._verify_order_filled(order_id, leg.instrument_name):
                         logger.info(f"Order {order_id} FILLED successfully")
@@ -282,7 +284,7 @@ class OrderManager:
         return False
 
     def _verify_order_filled(self, order_id: str, instrument_name: str,
-                            max_wait: int = 5) -> bool:
+                            max_wait: float = 5, poll_interval: float = 0.25) -> bool:
         """
         Verify that an order was filled
 
@@ -290,11 +292,14 @@ class OrderManager:
             order_id: Order ID to check
             instrument_name: Instrument name for logging
             max_wait: Maximum seconds to wait for fill
+            poll_interval: Seconds between order state checks
 
         Returns:
             True if order is filled
         """
-        for i in range(max_wait):
+        deadline = time.monotonic() + max_wait
+
+        while True:
             try:
                 order_state = self.client.get_order_state(order_id)
 
@@ -310,13 +315,15 @@ class OrderManager:
                         logger.error(f"Order {order_id} was {state}")
                         return False
 
-                # Wait before checking again
-                if i < max_wait - 1:
-                    time.sleep(1)
-
             except Exception as e:
                 logger.error(f"Error checking order state: {e}")
 
+            if time.monotonic() >= deadline:
+                break
+
+            # Short poll, the client's rate limiter spaces requests out if credits run low
+            time.sleep(poll_interval)
+
         logger.error(f"Order {order_id} for {instrument_name} not filled after {max_wait}s")
         return False
 
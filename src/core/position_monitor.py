@@ -1,49 +1,143 @@
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 import logging
+
+import numpy as np
+
 from src.core.deribit_client import DeribitClient
 from src.strategies.iron_condor import IronCondor
 from src.core.order_manager import OrderManager
+from src.core.metadata_cache import SETTLEMENT_HOUR_UTC
+from src.utils.pricing import SECONDS_PER_YEAR, black76_greeks
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ValuationSnapshot:
+    """Index prices and leg marks fetched once for a set of condors"""
+    index_prices: Dict[str, Optional[float]] = field(default_factory=dict)
+    # Mark price per instrument; missing = no order book, None = book without a mark
+    marks: Dict[str, Optional[float]] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+
 class PositionMonitor:
     """Monitor open Iron Condor positions and manage TP/SL"""
 
-    def __init__(self, client: DeribitClient, order_manager: OrderManager):
+    def __init__(self, client: DeribitClient, order_manager: OrderManager, market_data=None,
+                 max_workers: int = 8):
         """
         Initialize position monitor
 
         Args:
             client: Deribit API client
             order_manager: Order manager for closing positions
+            market_data: Optional MarketDataHub for cached marks (default: client)
+            max_workers: Concurrent requests when valuing positions (1 = sequential)
         """
         self.client = client
         self.order_manager = order_manager
+        self.market_data = market_data or client
+        self.max_workers = max_workers
         self.open_condors: Dict[str, IronCondor] = {}
+        # Optional CycleSnapshotProvider: marks are read from the cycle snapshot while fresh
+        self.cycle_snapshots = None
+
+    def _leg_instruments(self, condor: IronCondor) -> List[str]:
+        return [leg.instrument_name for leg in
+                (condor.long_put, condor.short_put, condor.short_call, condor.long_call)]
 
     def add_condor(self, condor: IronCondor):
         """Add a new Iron Condor to monitor"""
         self.open_condors[condor.id] = condor
+        if self.market_data is not self.client:
+            self.market_data.track_instruments(self._leg_instruments(condor))
+            self.market_data.track_currencies([condor.currency])
         logger.info(f"Added condor {condor.id} to monitoring")
 
     def remove_condor(self, condor_id: str):
         """Remove an Iron Condor from monitoring"""
         if condor_id in self.open_condors:
-            del self.open_condors[condor_id]
+            condor = self.open_condors.pop(condor_id)
+            if self.market_data is not self.client:
+                still_open = {name for c in self.open_condors.values() for name in self._leg_instruments(c)}
+                self.market_data.untrack_instruments(
+                    [name for name in self._leg_instruments(condor) if name not in still_open]
+                )
             logger.info(f"Removed condor {condor_id} from monitoring")
 
-    def get_condor_pnl(self, condor: IronCondor) -> Optional[float]:
+    def _fetch_book(self, instrument_name: str) -> Tuple[str, Optional[Dict]]:
+        try:
+            return instrument_name, self.market_data.get_order_book(instrument_name, depth=1)
+        except Exception as e:
+            logger.error(f"Error fetching order book for {instrument_name}: {e}")
+            return instrument_name, None
+
+    def _fetch_index_price(self, currency: str) -> Tuple[str, Optional[float]]:
+        try:
+            return currency, self.market_data.get_index_price(currency)
+        except Exception as e:
+            logger.error(f"Error fetching index price for {currency}: {e}")
+            return currency, None
+
+    def get_valuation_snapshot(self, condors: Optional[Iterable[IronCondor]] = None) -> ValuationSnapshot:
+        """
+        Fetch every index price and leg mark needed to value a set of condors
+
+        Each unique currency and instrument is requested once, concurrently
+        (up to max_workers), so the request count scales with unique
+        instruments rather than with condors.
+
+        Args:
+            condors: Condors to value (default: all open condors)
+
+        Returns:
+            ValuationSnapshot (instruments without an order book are left out)
+        """
+        condors = list(self.open_condors.values() if condors is None else condors)
+        currencies = list(dict.fromkeys(condor.currency for condor in condors))
+        instruments = list(dict.fromkeys(name for condor in condors for name in self._leg_instruments(condor)))
+        snapshot = ValuationSnapshot()
+
+        def fetch(function, keys):
+            workers = min(self.max_workers, len(keys))
+            if workers <= 1:
+                return [function(key) for key in keys]
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="valuation") as executor:
+                return list(executor.map(function, keys))
+
+        snapshot.index_prices.update(fetch(self._fetch_index_price, currencies))
+        for name, book in fetch(self._fetch_book, instruments):
+            if book:
+                snapshot.marks[name] = book.get("mark_price")
+            else:
+                logger.warning(f"Could not get order book for {name}")
+
+        return snapshot
+
+    def _cycle_valuation(self) -> Optional[ValuationSnapshot]:
+        """Valuation of the current cycle snapshot, None if there is none or it is stale"""
+        snapshot = self.cycle_snapshots.current() if self.cycle_snapshots is not None else None
+        return snapshot.valuation if snapshot is not None else None
+
+    def get_condor_pnl(self, condor: IronCondor, snapshot: Optional[ValuationSnapshot] = None) -> Optional[float]:
         """
         Calculate current P&L for an Iron Condor
 
         Args:
             condor: IronCondor to calculate P&L for
+            snapshot: Prices fetched for this cycle (fetched for this condor if not provided)
 
         Returns:
             Current P&L in USD or None if error
         """
+        if snapshot is None:
+            snapshot = self.get_valuation_snapshot([condor])
+
         try:
             total_current_value = 0.0
 
@@ -55,20 +149,19 @@ class PositionMonitor:
                 (condor.long_call, "buy")
             ]
 
-            spot_price = self.client.get_index_price(condor.currency)
+            spot_price = snapshot.index_prices.get(condor.currency)
             if not spot_price:
                 logger.error(f"Could not get spot price for {condor.currency}")
                 return None
 
             for leg, direction in legs:
-                # Get current order book to get mark price
-                book = self.client.get_order_book(leg.instrument_name, depth=1)
-
-                if not book:
-                    logger.warning(f"Could not get order book for {leg.instrument_name}")
+                # Legs without an order book are skipped
+                if leg.instrument_name not in snapshot.marks:
                     continue
 
-                current_mark = book.get("mark_price", leg.mark_price)
+                current_mark = snapshot.marks[leg.instrument_name]
+                if current_mark is None:
+                    current_mark = leg.mark_price
 
                 # Calculate value change
                 if direction == "buy":
@@ -89,13 +182,61 @@ class PositionMonitor:
             logger.error(f"Error calculating P&L for {condor.id}: {e}")
             return None
 
-    def check_exit_conditions(self, condor: IronCondor, hours_before_expiry: int = 24) -> Tuple[bool, str]:
+    def get_condor_greeks(self, condor: IronCondor, spot_price: Optional[float] = None) -> Optional[Dict[str, float]]:
+        """
+        Position greeks of a condor computed locally (Black-76, no order book requests)
+
+        Uses each leg's last known mark IV and the index price as the forward.
+
+        Args:
+            condor: IronCondor to value
+            spot_price: Current index price (fetched if not provided)
+
+        Returns:
+            Dict with delta, gamma, vega (USD per vol point) and theta (USD per day),
+            or None if the index price is unavailable
+        """
+        if spot_price is None:
+            spot_price = self.market_data.get_index_price(condor.currency)
+        if not spot_price:
+            return None
+
+        try:
+            expiry = datetime.strptime(condor.expiration_date, "%d%b%y").replace(
+                hour=SETTLEMENT_HOUR_UTC, tzinfo=timezone.utc
+            )
+        except ValueError as e:
+            logger.error(f"Error parsing expiration date: {e}")
+            return None
+
+        legs = [(condor.long_put, 1.0), (condor.short_put, -1.0),
+                (condor.short_call, -1.0), (condor.long_call, 1.0)]
+        years = (expiry.timestamp() - time.time()) / SECONDS_PER_YEAR
+
+        greeks = black76_greeks(
+            spot_price,
+            np.array([leg.strike for leg, _ in legs], dtype=np.float64),
+            years,
+            np.array([(leg.mark_iv or 0) / 100 for leg, _ in legs], dtype=np.float64),
+            np.array([leg.option_type == "call" for leg, _ in legs])
+        )
+        signs = np.array([sign for _, sign in legs]) * condor.size
+
+        # Delta/gamma are per unit of underlying; vega/theta are already in USD
+        return {
+            name: round(float(np.nansum(greeks[name] * signs)), 6)
+            for name in ("delta", "gamma", "vega", "theta")
+        }
+
+    def check_exit_conditions(self, condor: IronCondor, hours_before_expiry: int = 24,
+                              snapshot: Optional[ValuationSnapshot] = None) -> Tuple[bool, str]:
         """
         Check if any exit conditions are met for a condor
 
         Args:
             condor: IronCondor to check
             hours_before_expiry: Hours before expiry to force close
+            snapshot: Prices fetched for this cycle (fetched for this condor if not provided)
 
         Returns:
             Tuple of (should_exit, reason)
@@ -111,7 +252,7 @@ class PositionMonitor:
             logger.error(f"Error parsing expiration date: {e}")
 
         # Check P&L
-        pnl = self.get_condor_pnl(condor)
+        pnl = self.get_condor_pnl(condor, snapshot)
 
         if pnl is None:
             logger.warning(f"Could not calculate P&L for {condor.id}")
@@ -148,29 +289,31 @@ class PositionMonitor:
 
         condors_to_close = []
 
+        # Value every open condor from one batch of requests (or the cycle snapshot)
+        snapshot = self._cycle_valuation() or self.get_valuation_snapshot()
+
         # Check each condor
         for condor_id, condor in self.open_condors.items():
             try:
                 should_exit, reason = self.check_exit_conditions(
-                    condor, close_before_expiry_hours
+                    condor, close_before_expiry_hours, snapshot
                 )
 
                 if should_exit:
-                    pnl = self.get_condor_pnl(condor)
+                    pnl = self.get_condor_pnl(condor, snapshot)
                     logger.info(f"Exit condition met for {condor_id}: {reason}, P&L: ${pnl:.2f}")
-                    condors_to_close.append((condor, reason))
+                    condors_to_close.append((condor, reason, pnl))
 
             except Exception as e:
                 logger.error(f"Error monitoring condor {condor_id}: {e}")
                 stats["errors"] += 1
 
         # Close condors that need to be closed
-        for condor, reason in condors_to_close:
+        for condor, reason, pnl in condors_to_close:
             try:
                 success = self.order_manager.close_iron_condor(condor, reason)
 
                 if success:
-                    pnl = self.get_condor_pnl(condor)
                     condor.realized_pnl = pnl
                     condor.close_time = datetime.now()
                     condor.close_reason = reason
@@ -200,10 +343,14 @@ class PositionMonitor:
 
         return stats
 
-    def get_portfolio_summary(self) -> Dict:
+    def get_portfolio_summary(self, snapshot: Optional[ValuationSnapshot] = None) -> Dict:
         """
         Get summary of all open positions
 
+        Args:
+            snapshot: Prices fetched for this cycle (default: the cycle snapshot if
+                      fresh, else fetched for all open condors)
+
         Returns:
             Dict with portfolio statistics
         """
@@ -212,11 +359,21 @@ class PositionMonitor:
             "total_pnl": 0.0,
             "total_risk": 0.0,
             "by_currency": {},
+            # USD greeks add up across currencies; delta is per currency (in coin)
+            "greeks": {"vega": 0.0, "theta": 0.0},
             "condors": []
         }
+        if snapshot is None:
+            snapshot = self._cycle_valuation() or self.get_valuation_snapshot()
 
         for condor in self.open_condors.values():
-            pnl = self.get_condor_pnl(condor)
+            pnl = self.get_condor_pnl(condor, snapshot)
+
+            spot_price = snapshot.index_prices.get(condor.currency)
+            greeks = self.get_condor_greeks(condor, spot_price) if spot_price else None
+            if greeks:
+                summary["greeks"]["vega"] += greeks["vega"]
+                summary["greeks"]["theta"] += greeks["theta"]
 
             if pnl:
                 summary["total_pnl"] += pnl
@@ -228,10 +385,12 @@ class PositionMonitor:
                 summary["by_currency"][condor.currency] = {
                     "count": 0,
                     "pnl": 0.0,
-                    "risk": 0.0
+                    "risk": 0.0,
+                    "delta": 0.0
                 }
 
             summary["by_currency"][condor.currency]["count"] += 1
+            summary["by_currency"][condor.currency]["delta"] += greeks["delta"] if greeks else 0
             summary["by_currency"][condor.currency]["pnl"] += pnl if pnl else 0
             summary["by_currency"][condor.currency]["risk"] += condor.max_loss
 
@@ -245,7 +404,8 @@ class PositionMonitor:
                 "max_loss": condor.max_loss,
                 "credit": condor.credit_received,
                 "tp_target": condor.take_profit_target,
-                "sl_target": condor.stop_loss_target
+                "sl_target": condor.stop_loss_target,
+                "greeks": greeks
             })
 
         return summary
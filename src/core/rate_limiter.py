@@ -0,0 +1,180 @@
+import time
+import threading
+from typing import Dict, Callable
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Deribit error code for an exhausted credit pool
+TOO_MANY_REQUESTS_CODE = 10028
+
+# Endpoints charged against the matching engine pool, everything else is non-matching
+MATCHING_ENGINE_ENDPOINTS = {
+    "/private/buy",
+    "/private/sell",
+    "/private/edit",
+    "/private/edit_by_label",
+    "/private/cancel",
+    "/private/cancel_all",
+    "/private/cancel_all_by_currency",
+    "/private/cancel_all_by_instrument",
+    "/private/cancel_by_label",
+    "/private/close_position",
+}
+
+
+class TokenBucket:
+    """
+    Credit bucket refilled at a constant rate
+
+    Reservations may drive the balance negative: the caller then waits until the
+    deficit is refilled, so concurrent callers queue up instead of racing.
+    """
+
+    def __init__(self, max_credits: float, refill_per_second: float,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_credits = max_credits
+        self.refill_per_second = refill_per_second
+        self.credits = max_credits
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self):
+        now = self._clock()
+        self.credits = min(self.max_credits, self.credits + (now - self._updated) * self.refill_per_second)
+        self._updated = now
+
+    def reserve(self, cost: float) -> float:
+        """Take `cost` credits and return the seconds to wait before using them"""
+        self._refill()
+        self.credits -= cost
+        if self.credits >= 0:
+            return 0.0
+        return -self.credits / self.refill_per_second
+
+    def available(self) -> float:
+        """Current credit balance (negative while callers are queued)"""
+        self._refill()
+        return self.credits
+
+    def drain(self):
+        """Empty the bucket (the exchange says we are out of credits)"""
+        self._refill()
+        self.credits = min(self.credits, 0.0)
+
+
+class CreditRateLimiter:
+    """
+    Client-side model of Deribit's credit-based rate limits
+
+    Keeps one token bucket for matching engine requests (orders, cancels) and one
+    for everything else. Requests only wait when their pool is out of credits,
+    and a too_many_requests error drains the pool and adds an exponential backoff.
+    Defaults match Deribit's standard limits: non-matching 20 req/s with bursts
+    of 100, matching engine 5 req/s with bursts of 20.
+    """
+
+    def __init__(self, non_matching_max: float = 50000, non_matching_refill: float = 10000,
+                 matching_max: float = 10000, matching_refill: float = 2500,
+                 cost: float = 500, max_backoff: float = 8.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize rate limiter
+
+        Args:
+            non_matching_max: Max credits in the non-matching pool
+            non_matching_refill: Non-matching credits refilled per second
+            matching_max: Max credits in the matching engine pool
+            matching_refill: Matching engine credits refilled per second
+            cost: Credits charged per request
+            max_backoff: Upper bound for backoff after too_many_requests (seconds)
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.cost = cost
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self.pools = {
+            "non_matching": TokenBucket(non_matching_max, non_matching_refill, clock),
+            "matching": TokenBucket(matching_max, matching_refill, clock),
+        }
+
+        self._blocked_until = {name: 0.0 for name in self.pools}
+        self._consecutive_limits = {name: 0 for name in self.pools}
+
+        self.stats = {"requests": 0, "delayed": 0, "total_wait": 0.0, "rate_limited": 0}
+
+    @staticmethod
+    def pool_for(endpoint: str) -> str:
+        """Name of the credit pool an endpoint is charged against"""
+        return "matching" if endpoint in MATCHING_ENGINE_ENDPOINTS else "non_matching"
+
+    def reserve(self, endpoint: str) -> float:
+        """
+        Reserve credits for a request without blocking
+
+        Returns:
+            Seconds the caller must wait before sending
+        """
+        pool = self.pool_for(endpoint)
+        with self._lock:
+            wait = self.pools[pool].reserve(self.cost)
+            wait = max(wait, self._blocked_until[pool] - self._clock())
+
+            self.stats["requests"] += 1
+            if wait > 0:
+                self.stats["delayed"] += 1
+                self.stats["total_wait"] += wait
+            return max(wait, 0.0)
+
+    def acquire(self, endpoint: str):
+        """Block until a request to endpoint may be sent"""
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            logger.debug(f"Rate limiter delaying {endpoint} by {wait:.3f}s")
+            time.sleep(wait)
+
+    def on_rate_limited(self, endpoint: str) -> float:
+        """
+        Record a too_many_requests error for endpoint's pool
+
+        Returns:
+            Backoff in seconds now applied to the pool
+        """
+        pool = self.pool_for(endpoint)
+        with self._lock:
+            self._consecutive_limits[pool] += 1
+            backoff = min(0.25 * 2 ** (self._consecutive_limits[pool] - 1), self.max_backoff)
+            self.pools[pool].drain()
+            self._blocked_until[pool] = max(self._blocked_until[pool], self._clock() + backoff)
+            self.stats["rate_limited"] += 1
+
+        logger.warning(f"Rate limited on {endpoint} ({pool} pool), backing off {backoff:.2f}s")
+        return backoff
+
+    def on_success(self, endpoint: str):
+        """Reset the backoff of endpoint's pool after a successful request"""
+        pool = self.pool_for(endpoint)
+        if self._consecutive_limits[pool]:
+            with self._lock:
+                self._consecutive_limits[pool] = 0
+
+    def headroom(self) -> Dict[str, Dict[str, float]]:
+        """
+        Current credit headroom per pool
+
+        Returns:
+            Dict pool -> {credits, max_credits, requests (burst left), pct}
+        """
+        with self._lock:
+            result = {}
+            for name, bucket in self.pools.items():
+                credits = bucket.available()
+                result[name] = {
+                    "credits": round(credits, 1),
+                    "max_credits": bucket.max_credits,
+                    "requests": max(int(credits // self.cost), 0),
+                    "pct": round(max(credits, 0.0) / bucket.max_credits * 100, 1),
+                }
+            return result
@@ -1,4 +1,4 @@
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 import logging
 from src.core.deribit_client import DeribitClient
 from src.core.position_monitor import PositionMonitor
@@ -9,6 +9,9 @@ logger = logging.getLogger(__name__)
 class RiskManager:
     """Manage risk and position sizing with compounding"""
 
+    # Account currencies summed into total equity
+    EQUITY_CURRENCIES = ("BTC", "ETH")
+
     def __init__(
         self,
         client: DeribitClient,
@@ -32,13 +35,19 @@ class RiskManager:
         self.initial_equity = initial_equity
         self.risk_per_condor = risk_per_condor
         self.max_portfolio_risk = max_portfolio_risk
+        # Optional CycleSnapshotProvider: equity is read from the cycle snapshot while fresh
+        self.cycle_snapshots = None
+
+    def _cycle_snapshot(self):
+        return self.cycle_snapshots.current() if self.cycle_snapshots is not None else None
 
-    def get_current_equity(self, currency: str = "BTC") -> Optional[float]:
+    def get_current_equity(self, currency: str = "BTC", spot_price: Optional[float] = None) -> Optional[float]:
         """
         Get current account equity from Deribit
 
         Args:
             currency: Currency to check (BTC or ETH)
+            spot_price: Index price for the USD conversion (fetched if not provided)
 
         Returns:
             Current equity in USD
@@ -51,7 +60,8 @@ class RiskManager:
                 equity_in_currency = account.get("equity", 0)
 
                 # Convert to USD
-                spot_price = self.client.get_index_price(currency)
+                if not spot_price:
+                    spot_price = self.client.get_index_price(currency)
                 if spot_price:
                     equity_usd = equity_in_currency * spot_price
                     logger.info(f"Current equity for {currency}: ${equity_usd:,.2f}")
@@ -64,18 +74,40 @@ class RiskManager:
             logger.error(f"Error getting equity: {e}")
             return self.initial_equity
 
+    def fetch_equity(self, index_prices: Optional[Dict[str, Optional[float]]] = None) -> Dict[str, float]:
+        """
+        Fetch equity of every account currency from Deribit
+
+        Args:
+            index_prices: Already fetched index prices per currency (others are fetched)
+
+        Returns:
+            Equity in USD per currency
+        """
+        index_prices = index_prices or {}
+        return {
+            currency: self.get_current_equity(currency, index_prices.get(currency)) or 0
+            for currency in self.EQUITY_CURRENCIES
+        }
+
     def get_total_equity(self) -> float:
         """
         Get total equity across all currencies (BTC + ETH)
 
+        Uses the cycle snapshot while it is fresh (and holds equity), otherwise
+        fetches from Deribit.
+
         Returns:
             Total equity in USD
         """
-        btc_equity = self.get_current_equity("BTC") or 0
-        eth_equity = self.get_current_equity("ETH") or 0
-        total = btc_equity + eth_equity
+        snapshot = self._cycle_snapshot()
+        if snapshot is not None and snapshot.equity is not None:
+            return snapshot.equity
+
+        equity = self.fetch_equity()
+        total = sum(equity.values())
 
-        logger.info(f"Total equity: ${total:,.2f} (BTC: ${btc_equity:,.2f}, ETH: ${eth_equity:,.2f})")
+        logger.info(f"Total equity: ${total:,.2f} (BTC: ${equity['BTC']:,.2f}, ETH: ${equity['ETH']:,.2f})")
         return total
 
     def calculate_position_size(self, equity: Optional[float] = None) -> float:
@@ -162,7 +194,8 @@ class RiskManager:
         max_risk = equity * self.max_portfolio_risk
         risk_per_condor = self.calculate_position_size(equity)
 
-        portfolio = self.position_monitor.get_portfolio_summary()
+        snapshot = self._cycle_snapshot()
+        portfolio = snapshot.portfolio if snapshot is not None else self.position_monitor.get_portfolio_summary()
 
         summary = {
             "equity": equity,
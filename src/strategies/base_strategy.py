@@ -24,6 +24,16 @@ class BaseStrategy(ABC):
         self.order_manager = dependencies.get('order_manager')
         self.position_monitor = dependencies.get('position_monitor')
         self.risk_manager = dependencies.get('risk_manager')
+        # Read-only market data (MarketDataHub cache if streaming, else the client)
+        self.market_data = dependencies.get('market_data') or client
+
+    def prepare(self):
+        """
+        One-off warm-up run at startup, after authentication (e.g. loading history).
+
+        Default: nothing to prepare.
+        """
+        pass
 
     @abstractmethod
     def scan(self) -> List[Dict[str, Any]]:
@@ -0,0 +1,191 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+import logging
+
+import numpy as np
+
+from src.core.options_chain import OptionsChain
+
+logger = logging.getLogger(__name__)
+
+# Ways to rank candidates (higher is better)
+RANK_METRICS = ("credit_to_max_loss", "credit_per_delta", "expected_value")
+
+
+@dataclass
+class CondorCandidate:
+    """One condor of the grid, priced per unit (USD)"""
+    expiration: str
+    dte: int
+    short_delta: float
+    wing_width_percent: float
+    short_put: Dict
+    long_put: Dict
+    short_call: Dict
+    long_call: Dict
+    credit: float
+    max_loss: float
+    score: float
+
+
+class CondorGridEngine:
+    """
+    Evaluate every condor in an expiry x short delta x wing width grid
+
+    Strikes are selected like IronCondorBuilder (nearest |delta| within the
+    tolerance, wings by strike search), for all delta targets and wing widths
+    of an expiry at once as array operations.
+    """
+
+    def __init__(self, short_deltas: Sequence[float], wing_widths: Sequence[float],
+                 rank_by: str = "credit_to_max_loss", delta_tolerance: float = 0.05):
+        """
+        Initialize grid engine
+
+        Args:
+            short_deltas: Short strike |delta| targets (e.g. 0.08, 0.12, 0.16)
+            wing_widths: Wing widths as a fraction of spot (e.g. 0.03, 0.05)
+            rank_by: One of RANK_METRICS
+            delta_tolerance: Max |delta| distance for a short strike
+        """
+        if rank_by not in RANK_METRICS:
+            raise ValueError(f"Unsupported rank metric: {rank_by}")
+
+        self.short_deltas = np.abs(np.asarray(short_deltas, dtype=np.float64))
+        self.wing_widths = np.asarray(wing_widths, dtype=np.float64)
+        self.rank_by = rank_by
+        self.delta_tolerance = delta_tolerance
+
+    def _select_shorts(self, chain: OptionsChain, option_type: str) -> np.ndarray:
+        """Row of the short strike per delta target (-1 if none within tolerance)"""
+        rows = np.flatnonzero(chain.option_types == option_type)
+        if not len(rows):
+            return np.full(len(self.short_deltas), -1)
+
+        diffs = np.abs(np.abs(chain.deltas[rows])[None, :] - self.short_deltas[:, None])
+        diffs = np.where(diffs <= self.delta_tolerance, diffs, np.inf)
+        best = np.argmin(diffs, axis=1)
+        found = np.isfinite(diffs[np.arange(len(best)), best])
+        return np.where(found, rows[best], -1)
+
+    @staticmethod
+    def _select_wings(chain: OptionsChain, option_type: str, short_strikes: np.ndarray,
+                      distances: np.ndarray) -> np.ndarray:
+        """Row of the wing per (short strike, wing distance) pair (-1 if none)"""
+        rows, strikes = chain.by_strike(option_type)
+        shape = (len(short_strikes), len(distances))
+        if not len(strikes):
+            return np.full(shape, -1)
+
+        if option_type == "put":
+            targets = short_strikes[:, None] - distances[None, :]
+            end = np.minimum(np.searchsorted(strikes, short_strikes, side="left")[:, None],
+                             np.searchsorted(strikes, targets, side="right"))
+            valid, pos = end > 0, end - 1
+        else:
+            targets = short_strikes[:, None] + distances[None, :]
+            start = np.maximum(np.searchsorted(strikes, short_strikes, side="right")[:, None],
+                               np.searchsorted(strikes, targets, side="left"))
+            valid, pos = start < len(strikes), start
+
+        pos = np.clip(pos, 0, len(strikes) - 1)
+        # Duplicate strikes: the earliest option in list order, like the builder
+        first = np.searchsorted(strikes, strikes[pos], side="left")
+        return np.where(valid, rows[first], -1)
+
+    def evaluate(self, options: Union[List[Dict], OptionsChain], spot_price: float,
+                 expiration: str, dte: int) -> List[CondorCandidate]:
+        """
+        Price every delta x wing combination of one expiry
+
+        Returns:
+            Valid candidates (positive credit and max loss), unsorted
+        """
+        chain = options if isinstance(options, OptionsChain) else OptionsChain.from_dicts(options)
+        if not len(chain):
+            return []
+
+        short_puts = self._select_shorts(chain, "put")
+        short_calls = self._select_shorts(chain, "call")
+        distances = self.wing_widths * spot_price
+        long_puts = self._select_wings(chain, "put", chain.strikes[short_puts], distances)
+        long_calls = self._select_wings(chain, "call", chain.strikes[short_calls], distances)
+
+        valid = ((short_puts >= 0) & (short_calls >= 0))[:, None] & (long_puts >= 0) & (long_calls >= 0)
+        sp, sc = short_puts[:, None], short_calls[:, None]
+        marks, strikes, deltas = chain.marks, chain.strikes, np.abs(chain.deltas)
+
+        credit = (marks[sp] + marks[sc] - marks[long_puts] - marks[long_calls]) * spot_price
+        width = np.maximum(strikes[sp] - strikes[long_puts], strikes[long_calls] - strikes[sc])
+        max_loss = width - credit
+        valid &= (credit > 0) & (max_loss > 0)
+        # Legs need a delta to become an IronCondor
+        valid &= np.isfinite(chain.deltas[long_puts]) & np.isfinite(chain.deltas[long_calls])
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if self.rank_by == "credit_to_max_loss":
+                score = credit / max_loss
+            elif self.rank_by == "credit_per_delta":
+                # Credit per unit of short-leg delta (directional exposure taken on)
+                score = credit / (deltas[sp] + deltas[sc])
+            else:
+                # Deltas as expiry ITM probabilities: full credit between the shorts,
+                # full loss beyond the wings, about half way in between
+                p_loss = deltas[long_puts] + deltas[long_calls]
+                p_between = (deltas[sp] - deltas[long_puts]) + (deltas[sc] - deltas[long_calls])
+                p_profit = 1.0 - p_loss - p_between
+                score = credit * p_profit - max_loss * p_loss + (credit - max_loss) / 2 * p_between
+        valid &= np.isfinite(score)
+
+        candidates = []
+        seen = set()
+        for i, j in zip(*np.nonzero(valid)):
+            legs = (int(short_puts[i]), int(long_puts[i, j]), int(short_calls[i]), int(long_calls[i, j]))
+            if legs in seen:
+                continue
+            seen.add(legs)
+            candidates.append(CondorCandidate(
+                expiration=expiration,
+                dte=dte,
+                short_delta=float(self.short_deltas[i]),
+                wing_width_percent=float(self.wing_widths[j]),
+                short_put=chain.option(legs[0]),
+                long_put=chain.option(legs[1]),
+                short_call=chain.option(legs[2]),
+                long_call=chain.option(legs[3]),
+                credit=float(credit[i, j]),
+                max_loss=float(max_loss[i, j]),
+                score=float(score[i, j])
+            ))
+        return candidates
+
+    def rank(self, chains: Dict[str, Tuple[int, Union[List[Dict], OptionsChain]]],
+             spot_price: float) -> List[CondorCandidate]:
+        """
+        Evaluate the grid over several expiries
+
+        Args:
+            chains: Dict of expiration -> (days to expiry, chain)
+            spot_price: Current index price
+
+        Returns:
+            Candidates sorted best first
+        """
+        candidates = []
+        for expiration, (dte, options) in chains.items():
+            candidates.extend(self.evaluate(options, spot_price, expiration, dte))
+
+        candidates.sort(key=lambda c: c.score, reverse=True)
+        return candidates
+
+    def best(self, chains: Dict[str, Tuple[int, Union[List[Dict], OptionsChain]]],
+             spot_price: float) -> Optional[CondorCandidate]:
+        """Best candidate of the grid, or None if no combination is valid"""
+        candidates = self.rank(chains, spot_price)
+        if not candidates:
+            return None
+
+        logger.info(f"Condor grid: {len(candidates)} candidates across {len(chains)} expiries, "
+                    f"best {candidates[0].expiration} delta {candidates[0].short_delta:.2f} "
+                    f"wing {candidates[0].wing_width_percent:.1%} ({self.rank_by} {candidates[0].score:.4f})")
+        return candidates[0]
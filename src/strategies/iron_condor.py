@@ -1,14 +1,24 @@
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import logging
-import time
 from dataclasses import dataclass
 
+import numpy as np
+
+from src.core.chain_loader import OptionsChainLoader
+from src.core.instrument_registry import InstrumentRegistry
+from src.core.options_chain import OptionsChain
 from src.strategies.base_strategy import BaseStrategy
+from src.strategies.condor_grid import CondorGridEngine
+from src.utils.iv_backfill import backfill_iv_history
 from src.utils.volatility import VolatilityAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# Max |delta| distance between a short strike and its target (IronCondorBuilder default)
+SHORT_DELTA_TOLERANCE = 0.05
+
 
 @dataclass
 class OptionLeg:
@@ -122,31 +132,88 @@ class IronCondorBuilder:
         candidates.sort(key=lambda x: abs(x["strike"] - target_strike))
         return candidates[0]
 
-    def build_condor(self, currency: str, options_chain: List[Dict],
+    def select_short_strike(self, chain: OptionsChain, target_delta: float, option_type: str,
+                            tolerance: float = 0.05) -> Optional[int]:
+        """Array version of find_strike_by_delta, returns the chain row (or None)"""
+        diffs = np.abs(np.abs(chain.deltas) - abs(target_delta))
+        candidates = np.flatnonzero((chain.option_types == option_type) & (diffs <= tolerance))
+        if not len(candidates):
+            return None
+        # argmin returns the first minimum, i.e. the earliest option in list order
+        return int(candidates[np.argmin(diffs[candidates])])
+
+    def select_wing_strike(self, chain: OptionsChain, short_strike: float, option_type: str,
+                           spot_price: float) -> Optional[int]:
+        """Array version of find_protective_strike, returns the chain row (or None)"""
+        wing_distance = spot_price * self.wing_width_percent
+        rows, strikes = chain.by_strike(option_type)
+
+        if option_type == "put":
+            # Candidates (strike < short and <= target) are a prefix; the nearest is its end
+            target_strike = short_strike - wing_distance
+            end = min(np.searchsorted(strikes, short_strike, side="left"),
+                      np.searchsorted(strikes, target_strike, side="right"))
+            if end == 0:
+                return None
+            start = end - 1
+            nearest = abs(strikes[start] - target_strike)
+            while start > 0 and abs(strikes[start - 1] - target_strike) == nearest:
+                start -= 1
+        else:  # call
+            # Candidates (strike > short and >= target) are a suffix; the nearest is its start
+            target_strike = short_strike + wing_distance
+            start = max(np.searchsorted(strikes, short_strike, side="right"),
+                        np.searchsorted(strikes, target_strike, side="left"))
+            if start == len(strikes):
+                return None
+            end = start + 1
+            nearest = abs(strikes[start] - target_strike)
+            while end < len(strikes) and abs(strikes[end] - target_strike) == nearest:
+                end += 1
+
+        # Equally near strikes: the list-based builder keeps the earliest in list order
+        return int(rows[start:end].min())
+
+    def build_condor(self, currency: str, options_chain: Union[List[Dict], OptionsChain],
                     spot_price: float, expiration_date: str,
                     risk_per_condor: float, tp_ratio: float = 0.55,
                     sl_mult: float = 1.2) -> Optional[IronCondor]:
         try:
-            short_put_opt = self.find_strike_by_delta(
-                options_chain, -self.short_delta_target, "put"
-            )
-            if not short_put_opt: return None
+            chain = options_chain
+            if not isinstance(chain, OptionsChain):
+                chain = OptionsChain.from_dicts(options_chain)
 
-            short_call_opt = self.find_strike_by_delta(
-                options_chain, self.short_delta_target, "call"
-            )
-            if not short_call_opt: return None
+            short_put_row = self.select_short_strike(chain, -self.short_delta_target, "put")
+            if short_put_row is None: return None
+            short_put_opt = chain.option(short_put_row)
 
-            long_put_opt = self.find_protective_strike(
-                options_chain, short_put_opt["strike"], "put", spot_price
-            )
-            if not long_put_opt: return None
+            short_call_row = self.select_short_strike(chain, self.short_delta_target, "call")
+            if short_call_row is None: return None
+            short_call_opt = chain.option(short_call_row)
 
-            long_call_opt = self.find_protective_strike(
-                options_chain, short_call_opt["strike"], "call", spot_price
-            )
-            if not long_call_opt: return None
+            long_put_row = self.select_wing_strike(chain, short_put_opt["strike"], "put", spot_price)
+            if long_put_row is None: return None
+            long_put_opt = chain.option(long_put_row)
+
+            long_call_row = self.select_wing_strike(chain, short_call_opt["strike"], "call", spot_price)
+            if long_call_row is None: return None
+            long_call_opt = chain.option(long_call_row)
+
+        except Exception as e:
+            logger.error(f"Error building Iron Condor: {e}")
+            return None
+
+        return self.assemble_condor(
+            currency, short_put_opt, long_put_opt, short_call_opt, long_call_opt,
+            spot_price, expiration_date, risk_per_condor, tp_ratio, sl_mult
+        )
 
+    def assemble_condor(self, currency: str, short_put_opt: Dict, long_put_opt: Dict,
+                        short_call_opt: Dict, long_call_opt: Dict, spot_price: float,
+                        expiration_date: str, risk_per_condor: float, tp_ratio: float = 0.55,
+                        sl_mult: float = 1.2) -> Optional[IronCondor]:
+        """Size and price a condor from four already selected options"""
+        try:
             short_put = OptionLeg(
                 instrument_name=short_put_opt["instrument_name"],
                 strike=short_put_opt["strike"],
@@ -241,109 +308,239 @@ class IronCondorStrategy(BaseStrategy):
             short_delta_target=config.short_delta_target,
             wing_width_percent=config.wing_width_percent
         )
-        self.volatility_analyzer = VolatilityAnalyzer(lookback_days=30)
+        # Optional IVHistoryStore: IV history survives restarts if provided
+        self.volatility_analyzer = VolatilityAnalyzer(lookback_days=30, store=dependencies.get('iv_store'))
+        self.instrument_registry = InstrumentRegistry(client)
+        self.chain_loader = OptionsChainLoader(client, self.instrument_registry)
+
+        self.grid_engine = None
+        if config.short_delta_grid or config.wing_width_grid:
+            self.grid_engine = CondorGridEngine(
+                config.short_delta_grid or [config.short_delta_target],
+                config.wing_width_grid or [config.wing_width_percent],
+                rank_by=config.rank_by
+            )
+
+    def prepare(self):
+        """Backfill the IV history window so IV percentiles are valid right after startup"""
+        if not self.config.iv_backfill:
+            return
+        added = backfill_iv_history(self.client, self.volatility_analyzer, list(self.config.currencies))
+        self.logger.info(f"IV history backfill: {added}")
 
     def find_suitable_expiration(self, currency: str) -> Optional[str]:
         try:
-            instruments = self.client.get_instruments(currency, kind="option")
-            expirations = {}
-            for inst in instruments:
-                exp_date = inst.get("expiration_timestamp")
-                if exp_date:
-                    exp_dt = datetime.fromtimestamp(exp_date / 1000)
-                    days = (exp_dt - datetime.now()).days
-
-                    if self.config.min_dte <= days <= self.config.max_dte:
-                        exp_str = exp_dt.strftime("%d%b%y").upper()
-                        if exp_str not in expirations:
-                            expirations[exp_str] = days
+            self.instrument_registry.refresh(currency)
+            expirations = self.instrument_registry.expiries_in_dte(
+                currency, self.config.min_dte, self.config.max_dte
+            )
 
             if not expirations:
                 return None
 
-            best_exp = min(expirations.items(), key=lambda x: abs(x[1] - self.config.min_dte))
+            best_exp = min(expirations, key=lambda x: abs(x[1] - self.config.min_dte))
             return best_exp[0]
         except Exception as e:
             self.logger.error(f"Error finding expiration: {e}")
             return None
 
-    def get_options_chain_with_greeks(self, currency: str, expiration: str) -> List[Dict]:
+    def get_options_chain_with_greeks(self, currency: str, expiration: str,
+                                      spot_price: Optional[float] = None) -> OptionsChain:
+        """
+        Get the chain for an expiration
+
+        By default (or if the band misses) the full chain comes from one book
+        summary request with locally estimated deltas; exchange greeks are then
+        fetched only for the legs of the condor that gets built
+        (see OptionsChainLoader.confirm_legs).
+
+        With a delta band configured (opt-in) and an ATM IV already on the
+        currency's surface, tickers with exchange greeks are fetched instead for
+        the strikes around the short delta target, their wings and the ATM
+        strikes (see OptionsChainLoader.get_band_chain).
+        """
         try:
-            instruments = self.client.get_instruments(currency, kind="option")
-            options = []
-            for inst in instruments:
-                exp_timestamp = inst.get("expiration_timestamp")
-                if exp_timestamp:
-                    exp_dt = datetime.fromtimestamp(exp_timestamp / 1000)
-                    exp_str = exp_dt.strftime("%d%b%y").upper()
-
-                    if exp_str == expiration:
-                        book = self.client.get_order_book(inst["instrument_name"])
-                        if book:
-                            inst["mark_price"] = book.get("mark_price", 0)
-                            inst["mark_iv"] = book.get("mark_iv", 0)
-                            inst["greeks"] = book.get("greeks", {})
-                            options.append(inst)
-                        time.sleep(0.05)
-            return options
+            surface = self.volatility_analyzer.surfaces.get(currency)
+            if self.config.delta_band > 0 and spot_price and surface:
+                expiry_ts = self.instrument_registry.expiry_timestamp(currency, expiration)
+                atm_iv = surface.atm_iv(expiry_ts) if expiry_ts else None
+                if atm_iv:
+                    smile = surface.smile(expiry_ts)
+                    options = self.chain_loader.get_band_chain(
+                        currency, expiration, spot_price, atm_iv,
+                        short_deltas=[self.config.short_delta_target],
+                        wing_widths=[self.config.wing_width_percent],
+                        delta_band=self.config.delta_band,
+                        forward=smile.forward if smile else None
+                    )
+                    if options:
+                        return options
+
+            return self.chain_loader.get_chain(currency, expiration)
         except Exception as e:
             self.logger.error(f"Error getting options chain: {e}")
-            return []
+            return OptionsChain.empty()
 
-    def scan(self) -> List[Dict[str, Any]]:
-        signals = []
-        
-        # Check global risk first
-        can_open, reason = self.risk_manager.can_open_new_position()
-        if not can_open:
-            self.logger.info(f"Cannot open new position: {reason}")
-            return signals
+    def get_grid_chains(self, currency: str) -> Dict[str, Tuple[float, OptionsChain]]:
+        """
+        Get the chains of every expiry in the DTE range for the condor grid
 
-        for currency in self.config.currencies:
-            self.logger.info(f"Scanning {currency}...")
-            
-            spot_price = self.client.get_index_price(currency)
-            if not spot_price: continue
+        All expiries come from one book summary request, so the same chains
+        serve the IV check, the grid search and the leg confirmation.
 
-            expiration = self.find_suitable_expiration(currency)
-            if not expiration: continue
+        Returns:
+            (DTE, chain) per expiration
+        """
+        try:
+            expirations = dict(self.instrument_registry.expiries_in_dte(
+                currency, self.config.min_dte, self.config.max_dte
+            ))
+            chains = self.chain_loader.get_chains(currency, list(expirations))
+            return {exp: (expirations[exp], chain) for exp, chain in chains.items()}
+        except Exception as e:
+            self.logger.error(f"Error getting grid chains: {e}")
+            return {}
 
-            options = self.get_options_chain_with_greeks(currency, expiration)
-            if not options: continue
+    def build_best_condor(self, currency: str, chains: Dict[str, Tuple[float, OptionsChain]],
+                          spot_price: float, risk_amount: float) -> Optional[IronCondor]:
+        """Build the best condor of the delta x wing grid over the chains of get_grid_chains"""
+        try:
+            best = self.grid_engine.best(chains, spot_price)
+        except Exception as e:
+            self.logger.error(f"Error evaluating condor grid: {e}")
+            return None
 
-            atm_iv = self.volatility_analyzer.get_atm_iv(options, spot_price)
-            if not atm_iv: continue
+        if best is None:
+            return None
 
-            self.volatility_analyzer.update_iv_history(currency, atm_iv)
-            
-            should_enter, iv_reason = self.volatility_analyzer.should_enter_position(
-                currency, atm_iv, min_iv_percentile=self.config.min_iv_percentile
+        return self.condor_builder.assemble_condor(
+            currency, best.short_put, best.long_put, best.short_call, best.long_call,
+            spot_price, best.expiration, risk_amount,
+            tp_ratio=self.config.tp_ratio, sl_mult=self.config.sl_mult
+        )
+
+    def _confirm_condor(self, condor: IronCondor, chain: OptionsChain) -> bool:
+        """
+        Check a condor's legs against exchange greeks before it is traded
+
+        Legs picked from locally estimated greeks are refreshed from the exchange
+        (see OptionsChainLoader.confirm_legs); legs of a chain that already
+        carries exchange greeks (a delta band chain) are used as they are. The
+        confirmed short deltas must still be near a short delta target.
+
+        Returns:
+            True if the condor can be traded
+        """
+        legs = (condor.long_put, condor.short_put, condor.short_call, condor.long_call)
+        rows = [chain.row(leg.instrument_name) for leg in legs]
+        estimated = any(row is None or chain.greeks_estimated[row] for row in rows)
+        if estimated and not self.chain_loader.confirm_legs(condor):
+            self.logger.warning(f"Skipping {condor.currency} condor: leg greeks could not be confirmed")
+            return False
+
+        if self.grid_engine:
+            targets, tolerance = self.grid_engine.short_deltas, self.grid_engine.delta_tolerance
+        else:
+            targets, tolerance = [self.config.short_delta_target], SHORT_DELTA_TOLERANCE
+        for leg in (condor.short_put, condor.short_call):
+            if min(abs(abs(leg.delta) - abs(target)) for target in targets) > tolerance:
+                self.logger.warning(f"Skipping {condor.currency} condor: {leg.instrument_name} delta "
+                                    f"{leg.delta:.3f} is off target after confirmation")
+                return False
+
+        return True
+
+    def _scan_currency(self, currency: str) -> Optional[Dict[str, Any]]:
+        """Scan one currency: index price, expiry, chain, IV check and condor"""
+        self.logger.info(f"Scanning {currency}...")
+
+        spot_price = self.client.get_index_price(currency)
+        if not spot_price: return None
+
+        expiration = self.find_suitable_expiration(currency)
+        if not expiration: return None
+
+        if self.grid_engine:
+            grid_chains = self.get_grid_chains(currency)
+            options = grid_chains[expiration][1] if expiration in grid_chains else None
+        else:
+            options = self.get_options_chain_with_greeks(currency, expiration, spot_price)
+        if not options: return None
+
+        atm_iv = self.volatility_analyzer.get_atm_iv(options, spot_price, currency)
+        if not atm_iv: return None
+
+        self.volatility_analyzer.update_iv_history(currency, atm_iv)
+
+        should_enter, iv_reason = self.volatility_analyzer.should_enter_position(
+            currency, atm_iv, min_iv_percentile=self.config.min_iv_percentile
+        )
+        if not should_enter:
+            return None
+
+        self.logger.info(f"Opportunity found for {currency}: {iv_reason}")
+
+        # Calculate size
+        risk_amount = self.risk_manager.calculate_position_size()
+
+        if self.grid_engine:
+            condor = self.build_best_condor(currency, grid_chains, spot_price, risk_amount)
+            if condor:
+                options = grid_chains[condor.expiration_date][1]
+        else:
+            condor = self.condor_builder.build_condor(
+                currency=currency,
+                options_chain=options,
+                spot_price=spot_price,
+                expiration_date=expiration,
+                risk_per_condor=risk_amount,
+                tp_ratio=self.config.tp_ratio,
+                sl_mult=self.config.sl_mult
             )
 
-            if should_enter:
-                self.logger.info(f"Opportunity found for {currency}: {iv_reason}")
-                
-                # Calculate size
-                risk_amount = self.risk_manager.calculate_position_size()
-                
-                condor = self.condor_builder.build_condor(
-                    currency=currency,
-                    options_chain=options,
-                    spot_price=spot_price,
-                    expiration_date=expiration,
-                    risk_per_condor=risk_amount,
-                    tp_ratio=self.config.tp_ratio,
-                    sl_mult=self.config.sl_mult
-                )
-                
-                if condor:
-                    signals.append({
-                        "type": "iron_condor",
-                        "condor": condor,
-                        "currency": currency
-                    })
-        
-        return signals
+        if not condor:
+            return None
+
+        if not self._confirm_condor(condor, options):
+            return None
+
+        return {
+            "type": "iron_condor",
+            "condor": condor,
+            "currency": currency
+        }
+
+    def _scan_currency_safe(self, currency: str) -> Optional[Dict[str, Any]]:
+        try:
+            return self._scan_currency(currency)
+        except Exception as e:
+            self.logger.error(f"Error scanning {currency}: {e}")
+            return None
+
+    def scan(self) -> List[Dict[str, Any]]:
+        """
+        Scan every configured currency
+
+        Currencies are scanned concurrently (up to scan_max_workers threads);
+        their requests share the client's rate limiter, so more currencies
+        add parallel work instead of a longer sequential scan. Signals come
+        back in config.currencies order regardless of completion order.
+        """
+        # Check global risk first
+        can_open, reason = self.risk_manager.can_open_new_position()
+        if not can_open:
+            self.logger.info(f"Cannot open new position: {reason}")
+            return []
+
+        currencies = list(self.config.currencies)
+        workers = min(self.config.scan_max_workers, len(currencies))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan") as executor:
+                results = list(executor.map(self._scan_currency_safe, currencies))
+        else:
+            results = [self._scan_currency_safe(currency) for currency in currencies]
+
+        return [signal for signal in results if signal]
 
     def execute_entry(self, signal: Dict[str, Any]) -> bool:
         condor = signal.get("condor")
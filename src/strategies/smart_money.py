@@ -121,21 +121,36 @@ class SmartMoneyStrategy(BaseStrategy):
         current_hour = now.hour
         return self.config.time_window_start <= current_hour < self.config.time_window_end
 
-    def check_liquidity_sweep(self, ohlcv: List[List[float]]) -> Optional[str]:
+    @staticmethod
+    def _ohlcv_columns(ohlcv) -> Dict[str, np.ndarray]:
+        """
+        Normalize OHLCV rows, a structured array or a dict of arrays to
+        column access by name (high/low/close)
+        """
+        if isinstance(ohlcv, (list, tuple)):
+            rows = np.asarray(ohlcv, dtype=float).reshape(-1, 6)
+            return {"high": rows[:, 2], "low": rows[:, 3], "close": rows[:, 4]}
+        return ohlcv
+
+    def check_liquidity_sweep(self, ohlcv) -> Optional[str]:
         """
         Check for Liquidity Sweep pattern.
+
+        Accepts rows of [ts, o, h, l, c, v] or the columnar output of
+        DeribitClient.get_ohlcv (output="columns" or "array").
         """
-        if len(ohlcv) < self.config.liquidity_lookback_periods + 1:
+        columns = self._ohlcv_columns(ohlcv)
+        highs, lows, closes = columns["high"], columns["low"], columns["close"]
+        periods = self.config.liquidity_lookback_periods
+
+        if len(closes) < periods + 1:
             return None
             
-        current = ohlcv[-1]
-        curr_low, curr_close = current[3], current[4]
-        curr_high = current[2]
-        
-        lookback = ohlcv[-(self.config.liquidity_lookback_periods + 1):-1]
+        curr_low, curr_close = float(lows[-1]), float(closes[-1])
+        curr_high = float(highs[-1])
         
-        lowest_low = min(c[3] for c in lookback)
-        highest_high = max(c[2] for c in lookback)
+        lowest_low = float(lows[-(periods + 1):-1].min())
+        highest_high = float(highs[-(periods + 1):-1].max())
         
         # Bullish Sweep (Long)
         if curr_low < lowest_low and curr_close > lowest_low:
@@ -163,11 +178,13 @@ class SmartMoneyStrategy(BaseStrategy):
         # We use the instrument from config or default to BTC-PERPETUAL for Deribit
         instrument = "BTC-PERPETUAL" 
         
-        ohlcv = self.client.get_ohlcv(instrument, timeframe=self.config.timeframe, limit=50)
-        if not ohlcv:
+        ohlcv = self.client.get_ohlcv(instrument, timeframe=self.config.timeframe, limit=50,
+                                      output="columns")
+        candles = self._ohlcv_columns(ohlcv)
+        if len(candles["close"]) == 0:
             return signals
             
-        sweep_direction = self.check_liquidity_sweep(ohlcv)
+        sweep_direction = self.check_liquidity_sweep(candles)
         
         if not sweep_direction:
             return signals
@@ -196,7 +213,7 @@ class SmartMoneyStrategy(BaseStrategy):
                     "direction": "buy",
                     "instrument": instrument,
                     "reason": f"Bullish Sweep + Absorption ({flow_analysis['reason']})",
-                    "stop_loss_price": ohlcv[-1][3] # Low of the sweep candle
+                    "stop_loss_price": float(candles["low"][-1]) # Low of the sweep candle
                 })
             else:
                 logger.info("No Absorption confirmation for Long.")
@@ -209,7 +226,7 @@ class SmartMoneyStrategy(BaseStrategy):
                     "direction": "sell",
                     "instrument": instrument,
                     "reason": f"Bearish Sweep + Absorption ({flow_analysis['reason']})",
-                    "stop_loss_price": ohlcv[-1][2] # High of the sweep candle
+                    "stop_loss_price": float(candles["high"][-1]) # High of the sweep candle
                 })
             else:
                 logger.info("No Absorption confirmation for Short.")
@@ -230,7 +247,7 @@ class SmartMoneyStrategy(BaseStrategy):
             return False
             
         # 1. Get current price
-        ticker = self.client.get_ticker(instrument)
+        ticker = self.market_data.get_ticker(instrument)
         current_price = ticker.get('last_price') if ticker else None
         
         if not current_price:
@@ -310,7 +327,7 @@ class SmartMoneyStrategy(BaseStrategy):
         instrument = pos['instrument']
         
         # Get current price
-        ticker = self.client.get_ticker(instrument)
+        ticker = self.market_data.get_ticker(instrument)
         current_price = ticker.get('last_price') if ticker else None
         
         if not current_price:
@@ -7,12 +7,15 @@ import logging
 from dotenv import load_dotenv
 
 from config import Config, IronCondorConfig, SmartMoneyConfig
+from src.core.cycle_snapshot import CycleSnapshotProvider
 from src.core.deribit_client import DeribitClient
+from src.core.market_data import MarketDataHub
 from src.core.order_manager import OrderManager
 from src.core.position_monitor import PositionMonitor
 from src.core.risk_manager import RiskManager
 from src.strategies.iron_condor import IronCondorStrategy
 from src.strategies.smart_money import SmartMoneyStrategy
+from src.utils.iv_store import IVHistoryStore
 
 logger = logging.getLogger(__name__)
 
@@ -39,10 +42,18 @@ class TradingBot:
         self.client = DeribitClient(
             Config.DERIBIT_API_KEY, 
             Config.DERIBIT_API_SECRET, 
-            Config.DERIBIT_ENV
+            Config.DERIBIT_ENV,
+            base_url=Config.DERIBIT_BASE_URL or None,
+            pool_size=Config.DERIBIT_HTTP_POOL_SIZE,
+            transport=Config.DERIBIT_TRANSPORT
         )
-        self.order_manager = OrderManager(self.client)
-        self.position_monitor = PositionMonitor(self.client, self.order_manager)
+        self.market_data = None
+        if Config.MARKET_DATA_STREAMING:
+            self.market_data = MarketDataHub(self.client, max_age=Config.MARKET_DATA_MAX_AGE)
+
+        self.order_manager = OrderManager(self.client, market_data=self.market_data)
+        self.position_monitor = PositionMonitor(self.client, self.order_manager,
+                                                market_data=self.market_data)
         
         # Risk Manager needs global risk settings (using defaults or first strategy?)
         # Ideally GlobalConfig should have risk settings. 
@@ -56,12 +67,22 @@ class TradingBot:
             max_portfolio_risk=float(os.getenv("MAX_PORTFOLIO_RISK", 0.03)) # Default
         )
 
+        # Equity, index prices and marks fetched once per cycle and shared by risk and monitoring
+        self.cycle_snapshots = CycleSnapshotProvider(
+            self.client, self.position_monitor, self.risk_manager,
+            max_age=Config.SNAPSHOT_MAX_AGE_SECONDS
+        )
+        self.risk_manager.cycle_snapshots = self.cycle_snapshots
+        self.position_monitor.cycle_snapshots = self.cycle_snapshots
+
         # Initialize strategies
         logger.info("Initializing strategies...")
         dependencies = {
             "order_manager": self.order_manager,
             "position_monitor": self.position_monitor,
-            "risk_manager": self.risk_manager
+            "risk_manager": self.risk_manager,
+            "market_data": self.market_data,
+            "iv_store": IVHistoryStore(Config.IV_HISTORY_DIR)
         }
 
         for strategy_config in Config.STRATEGIES:
@@ -87,6 +108,8 @@ class TradingBot:
         logger.info("=" * 60)
 
         try:
+            self.cycle_snapshots.build()
+
             # Get risk summary
             risk_summary = self.risk_manager.get_risk_summary()
             logger.info(f"Equity: ${risk_summary['equity']:,.2f}")
@@ -129,6 +152,9 @@ class TradingBot:
         logger.info("=" * 60)
 
         try:
+            # Marks of open condors only: the manage loop does not size trades
+            self.cycle_snapshots.build(include_equity=False)
+
             # Get portfolio summary
             portfolio = self.position_monitor.get_portfolio_summary()
             logger.info(f"Open positions: {portfolio.get('total_condors', 0)}") # Update if generic
@@ -199,8 +225,24 @@ class TradingBot:
             logger.error("Authentication failed. Exiting.")
             return
 
+        # Renew the token in the background so order/market data calls never wait on auth
+        self.client.start_token_refresher()
+
+        # Warm up strategies (e.g. IV history backfill) before the first scan
+        for strategy in self.strategies:
+            try:
+                strategy.prepare()
+            except Exception as e:
+                logger.error(f"Error preparing strategy {strategy.name}: {e}")
+
         self.running = True
 
+        if self.market_data:
+            self.market_data.start()
+            self.market_data.track_currencies(
+                sorted({c for s in Config.STRATEGIES if isinstance(s, IronCondorConfig) for c in s.currencies})
+            )
+
         # Schedule daily position opening (e.g., 10:00 AM) - Mostly for Iron Condor
         # schedule.every().day.at(Config.DAILY_SCAN_TIME).do(self.run_daily_routine)
 
@@ -210,9 +252,13 @@ class TradingBot:
         # SLOW LOOP: Scan for new setups every N minutes
         schedule.every(Config.MONITORING_INTERVAL_MINUTES).minutes.do(self.scan_and_open_positions)
 
+        # Request metrics dump
+        schedule.every(Config.METRICS_DUMP_INTERVAL_MINUTES).minutes.do(self.dump_metrics)
+
         logger.info("Bot started. Schedules:")
         logger.info(f"  - Management Loop: Every 30 seconds")
         logger.info(f"  - Strategy Scan: Every {Config.MONITORING_INTERVAL_MINUTES} minutes")
+        logger.info(f"  - Metrics Dump: Every {Config.METRICS_DUMP_INTERVAL_MINUTES} minutes -> {Config.METRICS_FILE}")
 
         # Run initial scan
         logger.info("\nRunning initial scan...")
@@ -228,6 +274,15 @@ class TradingBot:
             logger.info("\nReceived shutdown signal...")
             self.stop()
 
+    def dump_metrics(self):
+        """Write client request metrics to the metrics file"""
+        if self.client.dump_metrics(Config.METRICS_FILE):
+            totals = self.client.metrics.snapshot()["totals"]
+            logger.info(
+                f"Metrics: {totals['requests']} requests, {totals['errors']} errors, "
+                f"{totals['timeouts']} timeouts, {totals['retries']} retries"
+            )
+
     def stop(self):
         """Stop the trading bot"""
         logger.info("=" * 60)
@@ -235,6 +290,10 @@ class TradingBot:
         logger.info("=" * 60)
 
         self.running = False
+        self.dump_metrics()
+        if self.market_data:
+            self.market_data.stop()
+        self.client.close()
         logger.info("Bot stopped.")
 
 
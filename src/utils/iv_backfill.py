@@ -0,0 +1,91 @@
+"""
+IV history backfill from Deribit historical data
+
+On startup the rolling IV window is empty (or stale) until the bot has been
+sampling for the whole lookback. The DVOL index (Deribit's 30-day implied
+volatility index) is fetched in a few paginated bulk requests instead and its
+hourly closes are used as IV samples, so IV rank/percentile are meaningful
+right after boot. If DVOL is unavailable, Deribit's historical (realized)
+volatility series is used as a rougher proxy.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+import logging
+
+from src.utils.volatility import VolatilityAnalyzer
+
+logger = logging.getLogger(__name__)
+
+
+def _dvol_samples(client, currency: str, start: datetime, resolution: str) -> List[Tuple[datetime, float]]:
+    """DVOL candle closes after start, oldest first"""
+    candles = client.get_volatility_index_data(
+        currency,
+        start_timestamp=int(start.timestamp() * 1000),
+        end_timestamp=int(time.time() * 1000),
+        resolution=resolution
+    )
+    return [(datetime.fromtimestamp(c[0] / 1000), float(c[4])) for c in candles if c[4]]
+
+
+def _historical_vol_samples(client, currency: str, start: datetime) -> List[Tuple[datetime, float]]:
+    """Deribit historical volatility points after start, oldest first"""
+    points = client.get_historical_volatility(currency) or []
+    samples = [(datetime.fromtimestamp(ts / 1000), float(value)) for ts, value in points if value]
+    return sorted(s for s in samples if s[0] > start)
+
+
+def backfill_currency(client, analyzer: VolatilityAnalyzer, currency: str, resolution: str = "3600") -> int:
+    """
+    Fill the IV window of one currency up to now
+
+    Only the gap after the newest known sample (or the whole lookback) is
+    requested.
+
+    Returns:
+        Number of samples added
+    """
+    window = analyzer.get_iv_window(currency)
+    start = datetime.now() - timedelta(days=analyzer.lookback_days)
+    newest = window.newest()
+    if newest is not None and newest > start:
+        start = newest
+
+    try:
+        samples = _dvol_samples(client, currency, start, resolution)
+    except Exception as e:
+        logger.warning(f"DVOL backfill failed for {currency}: {e}")
+        samples = []
+    source = "DVOL"
+
+    if not samples:
+        try:
+            samples = _historical_vol_samples(client, currency, start)
+        except Exception as e:
+            logger.error(f"IV backfill failed for {currency}: {e}")
+            return 0
+        source = "historical volatility"
+
+    added = analyzer.add_iv_samples(currency, samples)
+    logger.info(f"Backfilled {added} IV samples for {currency} from {source} "
+                f"({len(analyzer.get_iv_window(currency))} in window)")
+    return added
+
+
+def backfill_iv_history(client, analyzer: VolatilityAnalyzer, currencies: List[str],
+                        resolution: str = "3600") -> Dict[str, int]:
+    """
+    Backfill the IV windows of several currencies in parallel
+
+    Returns:
+        Samples added per currency
+    """
+    if not currencies:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=len(currencies), thread_name_prefix="iv-backfill") as executor:
+        added = executor.map(lambda c: backfill_currency(client, analyzer, c, resolution), currencies)
+        return dict(zip(currencies, added))
@@ -0,0 +1,158 @@
+"""
+Append-only on-disk IV history
+
+One binary file per currency holding fixed 16-byte records (timestamp in ms as
+int64, IV as float64, little endian), in time order. Loading a window is a
+memory-mapped read plus a binary search on the timestamp column; saving a
+sample is a single append.
+"""
+
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+RECORD_DTYPE = np.dtype([("timestamp", "<i8"), ("iv", "<f8")])
+
+
+def _to_ms(timestamp: datetime) -> int:
+    return int(timestamp.timestamp() * 1000)
+
+
+class IVHistoryStore:
+    """Per-currency append-only IV time series under a data directory"""
+
+    def __init__(self, data_dir: str = "data", prefix: str = "iv_history"):
+        """
+        Initialize IV history store
+
+        Args:
+            data_dir: Directory for the history files (created if missing)
+            prefix: File name prefix (files are <prefix>_<CURRENCY>.bin)
+        """
+        self.data_dir = data_dir
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._last_ts: Dict[str, Optional[int]] = {}
+        os.makedirs(self.data_dir, exist_ok=True)
+
+    def path(self, currency: str) -> str:
+        return os.path.join(self.data_dir, f"{self.prefix}_{currency.upper()}.bin")
+
+    def _records(self, currency: str) -> np.ndarray:
+        """All complete records (memory-mapped), dropping a torn trailing write"""
+        path = self.path(currency)
+        if not os.path.exists(path):
+            return np.empty(0, dtype=RECORD_DTYPE)
+
+        size = os.path.getsize(path)
+        partial = size % RECORD_DTYPE.itemsize
+        if partial:
+            logger.warning(f"Truncating {partial} bytes of a partial record in {path}")
+            os.truncate(path, size - partial)
+            size -= partial
+
+        if size == 0:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        return np.memmap(path, dtype=RECORD_DTYPE, mode="r")
+
+    def _last_ms(self, currency: str) -> Optional[int]:
+        """Timestamp (ms) of the newest stored sample (call with the lock held)"""
+        if currency not in self._last_ts:
+            records = self._records(currency)
+            self._last_ts[currency] = int(records["timestamp"][-1]) if len(records) else None
+        return self._last_ts[currency]
+
+    def load(self, currency: str, since: Optional[datetime] = None) -> np.ndarray:
+        """
+        Load the samples of a currency, optionally only those after `since`
+
+        Returns:
+            Structured array with timestamp (ms) and iv fields, oldest first
+        """
+        with self._lock:
+            try:
+                records = self._records(currency)
+            except OSError as e:
+                logger.error(f"Failed to load IV history for {currency}: {e}")
+                return np.empty(0, dtype=RECORD_DTYPE)
+
+            self._last_ts[currency] = int(records["timestamp"][-1]) if len(records) else None
+            start = 0 if since is None else int(np.searchsorted(records["timestamp"], _to_ms(since), side="right"))
+            # Copy so the map is released
+            return np.array(records[start:])
+
+    def last_timestamp(self, currency: str) -> Optional[datetime]:
+        """Time of the newest stored sample, None if there is none"""
+        with self._lock:
+            try:
+                ts = self._last_ms(currency)
+            except OSError as e:
+                logger.error(f"Failed to read IV history for {currency}: {e}")
+                return None
+        return datetime.fromtimestamp(ts / 1000) if ts is not None else None
+
+    def append(self, currency: str, iv: float, timestamp: datetime) -> bool:
+        """
+        Persist one sample
+
+        Samples not newer than the last stored one are skipped so the file
+        stays sorted by time.
+
+        Returns:
+            True if the sample was written
+        """
+        ts = _to_ms(timestamp)
+        record = np.array([(ts, iv)], dtype=RECORD_DTYPE)
+
+        with self._lock:
+            try:
+                last = self._last_ms(currency)
+                if last is not None and ts <= last:
+                    return False
+
+                with open(self.path(currency), "ab") as f:
+                    f.write(record.tobytes())
+            except OSError as e:
+                logger.error(f"Failed to append IV sample for {currency}: {e}")
+                return False
+
+            self._last_ts[currency] = ts
+            return True
+
+    def extend(self, currency: str, samples: Iterable[Tuple[datetime, float]]) -> int:
+        """
+        Persist many samples (oldest first) with a single write
+
+        Samples not newer than the last stored one are skipped.
+
+        Returns:
+            Number of samples written
+        """
+        records = np.array([(_to_ms(ts), iv) for ts, iv in samples], dtype=RECORD_DTYPE)
+
+        with self._lock:
+            try:
+                last = self._last_ms(currency)
+                if last is not None:
+                    records = records[records["timestamp"] > last]
+                if len(records) > 1:
+                    # Keep the file sorted even if the input is not strictly increasing
+                    newest = np.maximum.accumulate(records["timestamp"])
+                    records = records[np.concatenate(([True], records["timestamp"][1:] > newest[:-1]))]
+                if not len(records):
+                    return 0
+
+                with open(self.path(currency), "ab") as f:
+                    f.write(records.tobytes())
+            except OSError as e:
+                logger.error(f"Failed to append IV samples for {currency}: {e}")
+                return 0
+
+            self._last_ts[currency] = int(records["timestamp"][-1])
+            return len(records)
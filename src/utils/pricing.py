@@ -0,0 +1,160 @@
+"""
+Vectorized Black-76 pricing, greeks and implied volatility
+
+Deribit options are European options on the futures price, so Black-76 on the
+underlying (forward) price reported with each option applies directly. All
+functions take scalars or NumPy arrays and broadcast; prices are in USD, and
+is_call selects calls and puts element-wise.
+
+Greek conventions follow Deribit: vega per 1 vol point, theta per calendar day.
+"""
+
+from typing import Dict, Union
+
+import numpy as np
+from scipy.special import ndtr
+
+ArrayLike = Union[float, np.ndarray]
+
+SECONDS_PER_YEAR = 365 * 24 * 3600
+DAYS_PER_YEAR = 365.0
+
+_SQRT_2PI = np.sqrt(2.0 * np.pi)
+
+# Implied volatility search bracket (as a fraction)
+IV_MIN = 1e-4
+IV_MAX = 10.0
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / _SQRT_2PI
+
+
+def _d1_d2(forward, strike, years, iv):
+    sqrt_t = np.sqrt(years)
+    vol_t = iv * sqrt_t
+    d1 = (np.log(forward / strike) + 0.5 * iv * iv * years) / vol_t
+    return d1, d1 - vol_t, sqrt_t
+
+
+def _inputs(forward, strike, years, iv, is_call):
+    forward, strike, years, iv = (np.asarray(x, dtype=np.float64) for x in (forward, strike, years, iv))
+    is_call = np.asarray(is_call, dtype=bool)
+    # Unusable inputs (expired, no vol, missing prices) give NaN instead of warnings
+    usable = (forward > 0) & (strike > 0) & (years > 0) & (iv > 0)
+    years = np.where(usable, years, np.nan)
+    iv = np.where(usable, iv, np.nan)
+    return forward, strike, years, iv, is_call
+
+
+def black76_price(forward: ArrayLike, strike: ArrayLike, years: ArrayLike, iv: ArrayLike,
+                  is_call: ArrayLike, rate: float = 0.0) -> np.ndarray:
+    """
+    Black-76 option price
+
+    Args:
+        forward: Underlying (forward/futures) price
+        strike: Strike price
+        years: Time to expiry in years
+        iv: Implied volatility as a fraction (0.55 = 55%)
+        is_call: True for calls, False for puts
+        rate: Discount rate (Deribit options settle in coin, 0 is the usual choice)
+
+    Returns:
+        Price in the underlying's quote currency (USD), NaN for unusable inputs
+    """
+    forward, strike, years, iv, is_call = _inputs(forward, strike, years, iv, is_call)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1, d2, _ = _d1_d2(forward, strike, years, iv)
+        call = forward * ndtr(d1) - strike * ndtr(d2)
+        put = strike * ndtr(-d2) - forward * ndtr(-d1)
+        return np.exp(-rate * years) * np.where(is_call, call, put)
+
+
+def black76_greeks(forward: ArrayLike, strike: ArrayLike, years: ArrayLike, iv: ArrayLike,
+                   is_call: ArrayLike) -> Dict[str, np.ndarray]:
+    """
+    Black-76 price and greeks for a whole chain in one call
+
+    Args:
+        forward: Underlying (forward/futures) price
+        strike: Strike price
+        years: Time to expiry in years
+        iv: Implied volatility as a fraction
+        is_call: True for calls, False for puts
+
+    Returns:
+        Dict of arrays: price, delta, gamma, vega (per vol point) and theta (per day)
+    """
+    forward, strike, years, iv, is_call = _inputs(forward, strike, years, iv, is_call)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1, d2, sqrt_t = _d1_d2(forward, strike, years, iv)
+        nd1, pdf = ndtr(d1), _norm_pdf(d1)
+
+        call = forward * nd1 - strike * ndtr(d2)
+        put = strike * ndtr(-d2) - forward * ndtr(-d1)
+
+        return {
+            "price": np.where(is_call, call, put),
+            "delta": np.where(is_call, nd1, nd1 - 1.0),
+            "gamma": pdf / (forward * iv * sqrt_t),
+            "vega": forward * pdf * sqrt_t / 100.0,
+            "theta": -forward * pdf * iv / (2.0 * sqrt_t) / DAYS_PER_YEAR,
+        }
+
+
+def implied_volatility(price: ArrayLike, forward: ArrayLike, strike: ArrayLike, years: ArrayLike,
+                       is_call: ArrayLike, tol: float = 1e-8, max_iter: int = 100) -> np.ndarray:
+    """
+    Implied volatility from option prices, solved for all options at once
+
+    Newton steps on vega, falling back to bisection of the bracketing interval
+    whenever a step would leave it (deep OTM options, tiny vega).
+
+    Args:
+        price: Option price in USD (Deribit mark_price x underlying price)
+        forward: Underlying (forward/futures) price
+        strike: Strike price
+        years: Time to expiry in years
+        is_call: True for calls, False for puts
+        tol: Price tolerance in USD
+        max_iter: Maximum iterations
+
+    Returns:
+        Implied volatility as a fraction, NaN where the price is outside the
+        no-arbitrage bounds or inputs are unusable
+    """
+    price, forward, strike, years = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (price, forward, strike, years))
+    )
+    is_call = np.broadcast_to(np.asarray(is_call, dtype=bool), price.shape)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        intrinsic = np.where(is_call, np.maximum(forward - strike, 0.0), np.maximum(strike - forward, 0.0))
+        upper = np.where(is_call, forward, strike)
+    solvable = (forward > 0) & (strike > 0) & (years > 0) & (price > intrinsic) & (price < upper)
+
+    lo = np.full(price.shape, IV_MIN)
+    hi = np.full(price.shape, IV_MAX)
+    sigma = np.full(price.shape, 0.5)
+    done = ~solvable
+
+    for _ in range(max_iter):
+        if done.all():
+            break
+
+        greeks = black76_greeks(forward, strike, years, sigma, is_call)
+        diff = greeks["price"] - price
+        done |= (np.abs(diff) < tol) | (hi - lo < 1e-12)
+
+        hi = np.where(diff > 0, sigma, hi)
+        lo = np.where(diff < 0, sigma, lo)
+
+        vega = greeks["vega"] * 100.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = sigma - diff / vega
+        bisect = 0.5 * (lo + hi)
+        step = np.where((newton > lo) & (newton < hi) & np.isfinite(newton), newton, bisect)
+        sigma = np.where(done, sigma, step)
+
+    return np.where(solvable & done, sigma, np.nan)
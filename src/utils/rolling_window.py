@@ -0,0 +1,90 @@
+"""
+Time-windowed samples with order statistics
+
+Samples are kept twice: in time order (deque, for eviction) and in value order
+(SortedList, for percentiles). Adding an in-order sample or evicting one is
+O(log n), the count below a value is O(log n) and min/max are O(1), so IV can
+be sampled from a stream without rescanning the window on every update. A late
+(out-of-order) sample costs O(n): it is inserted into the deque by a scan from
+the newest end, which stays cheap when it is only slightly late.
+"""
+
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Deque, Iterable, List, Optional, Tuple
+
+from sortedcontainers import SortedList
+
+
+class RollingWindow:
+    """Samples younger than max_age, ordered by time and by value"""
+
+    def __init__(self, max_age: timedelta):
+        """
+        Initialize rolling window
+
+        Args:
+            max_age: Samples with timestamp <= now - max_age are evicted
+        """
+        self.max_age = max_age
+        self._samples: Deque[Tuple[datetime, float]] = deque()
+        self._sorted = SortedList()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def values(self) -> List[float]:
+        """Sample values, oldest first"""
+        return [value for _, value in self._samples]
+
+    def add(self, timestamp: datetime, value: float, now: Optional[datetime] = None):
+        """
+        Add a sample and evict expired ones (relative to now, default: current time)
+
+        O(log n) for a sample not older than the newest one, O(n) for a late sample.
+        """
+        if self._samples and timestamp < self._samples[-1][0]:
+            # Out of order (e.g. a late backfill sample): keep the deque sorted by time
+            i = len(self._samples)
+            while i > 0 and self._samples[i - 1][0] > timestamp:
+                i -= 1
+            self._samples.insert(i, (timestamp, value))
+        else:
+            self._samples.append((timestamp, value))
+        self._sorted.add(value)
+        self.evict(now)
+
+    def extend(self, samples: Iterable[Tuple[datetime, float]], now: Optional[datetime] = None):
+        """Add samples already sorted by time (and not older than the window's newest)"""
+        samples = list(samples)
+        self._samples.extend(samples)
+        self._sorted.update(value for _, value in samples)
+        self.evict(now)
+
+    def evict(self, now: Optional[datetime] = None) -> int:
+        """Drop samples outside the window, returns how many were dropped"""
+        cutoff = (now or datetime.now()) - self.max_age
+        dropped = 0
+        while self._samples and self._samples[0][0] <= cutoff:
+            _, value = self._samples.popleft()
+            self._sorted.remove(value)
+            dropped += 1
+        return dropped
+
+    def newest(self) -> Optional[datetime]:
+        """Timestamp of the newest sample, None if empty"""
+        return self._samples[-1][0] if self._samples else None
+
+    def min(self) -> float:
+        return self._sorted[0]
+
+    def max(self) -> float:
+        return self._sorted[-1]
+
+    def count_below(self, value: float) -> int:
+        """Number of samples strictly below value"""
+        return self._sorted.bisect_left(value)
+
+    def percentile(self, value: float) -> float:
+        """Percentage of samples strictly below value (0-100, not rounded)"""
+        return self.count_below(value) / len(self._samples) * 100
@@ -0,0 +1,244 @@
+"""
+Implied volatility surface built from options chain snapshots
+
+Each expiry gets a smile: a monotone cubic (PCHIP) interpolation of IV over
+log-moneyness ln(K/F), using the out-of-the-money side at each strike and flat
+extrapolation past the outermost strikes. Between expiries the surface
+interpolates total variance (iv^2 * T) linearly in time at the same
+log-moneyness, which keeps the term structure free of calendar arbitrage for
+well-behaved inputs.
+
+IVs are fractions (0.55 = 55%); Deribit's mark_iv is in percent.
+"""
+
+import time
+import threading
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+from scipy.special import ndtri
+
+from src.core.options_chain import OptionsChain
+from src.utils.pricing import SECONDS_PER_YEAR
+
+
+class ExpirySmile:
+    """IV smile of one expiry over log-moneyness"""
+
+    def __init__(self, expiration_timestamp: int, forward: float, strikes: np.ndarray, ivs: np.ndarray):
+        """
+        Args:
+            expiration_timestamp: Expiry in ms
+            forward: Underlying (forward) price of the expiry
+            strikes: Sorted unique strikes
+            ivs: IV per strike as a fraction
+        """
+        self.expiration_timestamp = expiration_timestamp
+        self.forward = forward
+        self.strikes = strikes
+        self.ivs = ivs
+        self.log_moneyness = np.log(strikes / forward)
+        self._spline = PchipInterpolator(self.log_moneyness, ivs, extrapolate=False) if len(ivs) > 1 else None
+        self.atm_iv = float(self.iv_at_moneyness(0.0))
+
+    def iv_at_moneyness(self, log_moneyness):
+        """IV at log-moneyness ln(K/F) (scalar or array), flat beyond the outer strikes"""
+        k = np.clip(log_moneyness, self.log_moneyness[0], self.log_moneyness[-1])
+        if self._spline is None:
+            return np.full(np.shape(k), self.ivs[0]) if np.ndim(k) else float(self.ivs[0])
+        iv = self._spline(k)
+        return iv if np.ndim(k) else float(iv)
+
+    def iv(self, strike):
+        """IV at a strike (scalar or array)"""
+        return self.iv_at_moneyness(np.log(np.asarray(strike, dtype=np.float64) / self.forward))
+
+
+class VolSurface:
+    """
+    Cached IV surface of one currency
+
+    update() groups a chain snapshot by expiry and refits only the expiries
+    whose strikes, IVs or forward changed, so feeding the surface the same
+    chain every scan is cheap. Queries read precomputed smiles.
+    """
+
+    def __init__(self, currency: str, clock: Callable[[], float] = time.time):
+        """
+        Initialize vol surface
+
+        Args:
+            currency: BTC or ETH
+            clock: Wall clock returning epoch seconds (injectable for tests)
+        """
+        self.currency = currency
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._smiles: Dict[int, ExpirySmile] = {}
+        self._fingerprints: Dict[int, int] = {}
+        self.refits = 0
+
+    @staticmethod
+    def _smile_inputs(chain: OptionsChain, spot_price: Optional[float]
+                      ) -> Optional[Tuple[float, np.ndarray, np.ndarray]]:
+        """Forward and OTM (strike, IV) points of one expiry's chain"""
+        forwards = chain.underlying[chain.underlying > 0]
+        forward = float(np.median(forwards)) if len(forwards) else spot_price
+        if not forward:
+            return None
+
+        usable = (chain.strikes > 0) & (chain.ivs > 0)
+        if not usable.any():
+            return None
+
+        strikes = chain.strikes[usable]
+        ivs = chain.ivs[usable] / 100
+        # Out-of-the-money side: puts below the forward, calls at or above it
+        otm = (chain.option_types[usable] == "put") == (strikes < forward)
+
+        # One point per strike: the OTM option if listed, else the first one
+        order = np.lexsort((np.arange(len(strikes)), ~otm, strikes))
+        strikes, ivs = strikes[order], ivs[order]
+        first = np.concatenate(([True], strikes[1:] != strikes[:-1]))
+        return forward, strikes[first], ivs[first]
+
+    def update(self, options: Union[List[Dict], OptionsChain], spot_price: Optional[float] = None) -> int:
+        """
+        Update the surface from a chain snapshot (one or more expiries)
+
+        Args:
+            options: OptionsChain (ivs in percent, underlying per row); a list of
+                     option dicts is converted with OptionsChain.from_dicts
+            spot_price: Fallback forward when underlying_price is missing
+
+        Returns:
+            Number of expiries refitted
+        """
+        chain = options if isinstance(options, OptionsChain) else OptionsChain.from_dicts(options)
+        now_ms = self._clock() * 1000
+        refitted = 0
+
+        with self._lock:
+            for ts in [ts for ts in self._smiles if ts <= now_ms]:
+                del self._smiles[ts]
+                self._fingerprints.pop(ts, None)
+
+            for ts in chain.expiration_timestamps:
+                ts = int(ts)
+                if ts <= now_ms:
+                    continue
+                inputs = self._smile_inputs(chain.view(ts), spot_price)
+                if inputs is None:
+                    continue
+
+                forward, strikes, ivs = inputs
+                fingerprint = hash((f"{forward:.4g}", strikes.tobytes(), ivs.tobytes()))
+                if self._fingerprints.get(ts) == fingerprint:
+                    continue
+
+                self._smiles[ts] = ExpirySmile(ts, forward, strikes, ivs)
+                self._fingerprints[ts] = fingerprint
+                refitted += 1
+
+            self.refits += refitted
+
+        return refitted
+
+    @property
+    def expiries(self) -> List[int]:
+        """Fitted expiration timestamps (ms), nearest first"""
+        return sorted(self._smiles)
+
+    def smile(self, expiration_timestamp: int) -> Optional[ExpirySmile]:
+        return self._smiles.get(int(expiration_timestamp))
+
+    def _years(self, expiration_timestamp: int) -> float:
+        return (expiration_timestamp / 1000 - self._clock()) / SECONDS_PER_YEAR
+
+    def _term_interpolate(self, smile_iv: Callable[[ExpirySmile], float],
+                          expiration_timestamp: Optional[int], years: Optional[float]) -> Optional[float]:
+        """
+        Evaluate smile_iv on a fitted expiry, or interpolate it at a time to expiry
+
+        Between fitted expiries total variance is interpolated linearly in time;
+        before the first or after the last expiry the nearest smile is used.
+        """
+        if expiration_timestamp is not None:
+            smile = self.smile(expiration_timestamp)
+            if smile is not None:
+                return smile_iv(smile)
+            years = self._years(expiration_timestamp)
+        if years is None:
+            return None
+
+        smiles = [self._smiles[ts] for ts in self.expiries]
+        if not smiles:
+            return None
+
+        times = np.array([self._years(s.expiration_timestamp) for s in smiles])
+        i = int(np.searchsorted(times, years))
+        if i == 0:
+            return smile_iv(smiles[0])
+        if i == len(smiles):
+            return smile_iv(smiles[-1])
+
+        t0, t1 = times[i - 1], times[i]
+        w0, w1 = smile_iv(smiles[i - 1]) ** 2 * t0, smile_iv(smiles[i]) ** 2 * t1
+        w = w0 + (w1 - w0) * (years - t0) / (t1 - t0)
+        return float(np.sqrt(max(w, 0.0) / years))
+
+    def iv(self, strike: float, expiration_timestamp: Optional[int] = None,
+           years: Optional[float] = None) -> Optional[float]:
+        """IV at a strike for a fitted expiry, or at any time to expiry"""
+        return self._term_interpolate(lambda smile: smile.iv(strike), expiration_timestamp, years)
+
+    def atm_iv(self, expiration_timestamp: Optional[int] = None,
+               years: Optional[float] = None) -> Optional[float]:
+        """ATM (forward) IV of a fitted expiry, or at any time to expiry"""
+        return self._term_interpolate(lambda smile: smile.atm_iv, expiration_timestamp, years)
+
+    def iv_at_delta(self, delta: float, expiration_timestamp: int,
+                    iterations: int = 8) -> Optional[Tuple[float, float]]:
+        """
+        Strike and IV where the Black-76 delta equals `delta` on a fitted expiry
+
+        Args:
+            delta: Call delta (0..1) or put delta (-1..0)
+            expiration_timestamp: Fitted expiry in ms
+            iterations: Fixed-point iterations of strike vs smile IV
+
+        Returns:
+            (strike, iv) or None if the expiry is not fitted
+        """
+        smile = self.smile(expiration_timestamp)
+        years = self._years(expiration_timestamp)
+        if smile is None or years <= 0 or not -1 < delta < 1 or delta == 0:
+            return None
+
+        # Put delta = call delta - 1
+        d1 = float(ndtri(delta if delta > 0 else delta + 1.0))
+        sqrt_t = np.sqrt(years)
+        iv = smile.atm_iv
+        for _ in range(iterations):
+            log_moneyness = -d1 * iv * sqrt_t + 0.5 * iv * iv * years
+            iv = smile.iv_at_moneyness(log_moneyness)
+
+        log_moneyness = -d1 * iv * sqrt_t + 0.5 * iv * iv * years
+        return float(smile.forward * np.exp(log_moneyness)), iv
+
+    def skew(self, expiration_timestamp: int, delta: float = 0.25) -> Optional[float]:
+        """Risk reversal: IV of the `delta` put minus IV of the `delta` call (vol points)"""
+        put = self.iv_at_delta(-abs(delta), expiration_timestamp)
+        call = self.iv_at_delta(abs(delta), expiration_timestamp)
+        if put is None or call is None:
+            return None
+        return round((put[1] - call[1]) * 100, 4)
+
+    def stats(self) -> Dict:
+        """Fitted expiries and refit count"""
+        return {
+            "currency": self.currency,
+            "expiries": len(self._smiles),
+            "refits": self.refits
+        }
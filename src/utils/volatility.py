@@ -1,26 +1,36 @@
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Optional, Tuple
+from collections import deque
+from typing import List, Dict, Optional, Tuple, Union
 from datetime import datetime, timedelta
 import logging
 
+from src.core.options_chain import OptionsChain
+from src.utils.iv_store import IVHistoryStore
+from src.utils.rolling_window import RollingWindow
+from src.utils.vol_surface import VolSurface
+
 logger = logging.getLogger(__name__)
 
 
 class VolatilityAnalyzer:
     """Analyze implied and historical volatility for trading decisions"""
 
-    def __init__(self, lookback_days: int = 30):
+    def __init__(self, lookback_days: int = 30, store: Optional[IVHistoryStore] = None):
         """
         Initialize volatility analyzer
 
         Args:
             lookback_days: Number of days to look back for IV rank calculation
+            store: On-disk IV history (history survives restarts if provided)
         """
         self.lookback_days = lookback_days
-        self.iv_history = {}  # Store IV history per currency
+        self.store = store
+        self.iv_history: Dict[str, RollingWindow] = {}  # Rolling IV window per currency
+        self.surfaces: Dict[str, VolSurface] = {}  # Cached IV surface per currency
 
-    def calculate_iv_rank(self, currency: str, current_iv: float, iv_history: List[float]) -> float:
+    def calculate_iv_rank(self, currency: str, current_iv: float,
+                          iv_history: Union[List[float], RollingWindow]) -> float:
         """
         Calculate IV Rank (percentile of current IV in historical range)
 
@@ -29,7 +39,7 @@ class VolatilityAnalyzer:
         Args:
             currency: BTC or ETH
             current_iv: Current implied volatility
-            iv_history: Historical IV values
+            iv_history: Historical IV values (a RollingWindow gives O(1) min/max)
 
         Returns:
             IV rank as percentage (0-100)
@@ -38,8 +48,10 @@ class VolatilityAnalyzer:
             logger.warning(f"Insufficient IV history for {currency}, returning 50%")
             return 50.0
 
-        min_iv = min(iv_history)
-        max_iv = max(iv_history)
+        if isinstance(iv_history, RollingWindow):
+            min_iv, max_iv = iv_history.min(), iv_history.max()
+        else:
+            min_iv, max_iv = min(iv_history), max(iv_history)
 
         if max_iv == min_iv:
             return 50.0
@@ -47,13 +59,14 @@ class VolatilityAnalyzer:
         iv_rank = ((current_iv - min_iv) / (max_iv - min_iv)) * 100
         return round(iv_rank, 2)
 
-    def calculate_iv_percentile(self, current_iv: float, iv_history: List[float]) -> float:
+    def calculate_iv_percentile(self, current_iv: float,
+                                iv_history: Union[List[float], RollingWindow]) -> float:
         """
         Calculate IV Percentile (percentage of time IV was below current level)
 
         Args:
             current_iv: Current implied volatility
-            iv_history: Historical IV values
+            iv_history: Historical IV values (a RollingWindow counts in O(log n))
 
         Returns:
             Percentile as percentage (0-100)
@@ -61,49 +74,78 @@ class VolatilityAnalyzer:
         if not iv_history:
             return 50.0
 
+        if isinstance(iv_history, RollingWindow):
+            return round(iv_history.percentile(current_iv), 2)
+
         below_count = sum(1 for iv in iv_history if iv < current_iv)
         percentile = (below_count / len(iv_history)) * 100
         return round(percentile, 2)
 
-    def get_atm_iv(self, options_chain: List[Dict], spot_price: float) -> Optional[float]:
+    def get_surface(self, currency: str) -> VolSurface:
+        """Cached IV surface of a currency (created empty on first use)"""
+        if currency not in self.surfaces:
+            self.surfaces[currency] = VolSurface(currency)
+        return self.surfaces[currency]
+
+    def get_atm_iv(self, options_chain: Union[List[Dict], OptionsChain], spot_price: float,
+                   currency: Optional[str] = None) -> Optional[float]:
         """
         Get ATM (At-The-Money) implied volatility
 
+        With a currency the chain refreshes that currency's cached surface and
+        the ATM IV is read from the smile of the chain's nearest expiry;
+        otherwise the IVs of the 3 strikes closest to spot are averaged.
+
         Args:
-            options_chain: List of option instruments with greeks
+            options_chain: OptionsChain (or list of option dicts with mark_iv)
             spot_price: Current spot price
+            currency: BTC or ETH, to use the cached IV surface
 
         Returns:
-            ATM implied volatility
+            ATM implied volatility (same units as mark_iv)
         """
-        if not options_chain:
+        if not len(options_chain):
             return None
 
+        chain = options_chain
+        if not isinstance(chain, OptionsChain):
+            chain = OptionsChain.from_dicts(options_chain)
+
+        if currency:
+            surface = self.get_surface(currency)
+            surface.update(chain, spot_price)
+            expiries = chain.expiries[chain.expiries > 0]
+            atm_iv = surface.atm_iv(int(expiries.min())) if len(expiries) else None
+            if atm_iv:
+                return round(atm_iv * 100, 4)
+
         # Find options closest to ATM
-        atm_options = []
-        for option in options_chain:
-            strike = option.get("strike")
-            iv = option.get("mark_iv")
-
-            if strike and iv:
-                distance = abs(strike - spot_price)
-                atm_options.append({
-                    "strike": strike,
-                    "iv": iv,
-                    "distance": distance
-                })
-
-        if not atm_options:
+        usable = np.flatnonzero((chain.strikes != 0) & (chain.ivs != 0) & np.isfinite(chain.ivs))
+        if not len(usable):
             return None
 
-        # Sort by distance and get closest strikes
-        atm_options.sort(key=lambda x: x["distance"])
-        closest = atm_options[:3]  # Take 3 closest
-
-        # Average their IVs
-        avg_iv = sum(opt["iv"] for opt in closest) / len(closest)
+        # Stable sort by distance and average the IVs of the 3 closest strikes
+        closest = usable[np.argsort(np.abs(chain.strikes[usable] - spot_price), kind="stable")[:3]]
+        avg_iv = sum(float(iv) for iv in chain.ivs[closest]) / len(closest)
         return round(avg_iv, 4)
 
+    def get_iv_window(self, currency: str) -> RollingWindow:
+        """Rolling IV window of a currency, loaded from the store on first use"""
+        if currency not in self.iv_history:
+            window = RollingWindow(timedelta(days=self.lookback_days))
+            self.iv_history[currency] = window
+
+            if self.store is not None:
+                records = self.store.load(currency, since=datetime.now() - window.max_age)
+                window.extend(
+                    (datetime.fromtimestamp(ts / 1000), iv)
+                    for ts, iv in zip(records["timestamp"].tolist(), records["iv"].tolist())
+                )
+                if len(window):
+                    logger.info(f"Loaded {len(window)} IV samples for {currency} from {self.store.path(currency)}")
+
+        return self.iv_history[currency]
+
     def update_iv_history(self, currency: str, iv: float, timestamp: datetime = None):
         """
         Update IV history for a currency
@@ -113,30 +155,40 @@ class VolatilityAnalyzer:
             iv: Implied volatility value
             timestamp: Timestamp (default: now)
         """
-        if currency not in self.iv_history:
-            self.iv_history[currency] = []
+        window = self.get_iv_window(currency)
 
         if timestamp is None:
             timestamp = datetime.now()
 
-        self.iv_history[currency].append({
-            "timestamp": timestamp,
-            "iv": iv
-        })
+        # Adds the sample and drops the ones older than lookback_days
+        window.add(timestamp, iv)
+        if self.store is not None:
+            self.store.append(currency, iv, timestamp)
+
+    def add_iv_samples(self, currency: str, samples: List[Tuple[datetime, float]]) -> int:
+        """
+        Add many samples at once (e.g. a backfill), oldest first
+
+        Only samples newer than the newest one in the window are added; they
+        are persisted to the store with a single write.
+
+        Returns:
+            Number of samples added
+        """
+        window = self.get_iv_window(currency)
+        newest = window.newest()
+        samples = [(ts, iv) for ts, iv in samples if newest is None or ts > newest]
+        if not samples:
+            return 0
 
-        # Keep only recent history
-        cutoff = datetime.now() - timedelta(days=self.lookback_days)
-        self.iv_history[currency] = [
-            item for item in self.iv_history[currency]
-            if item["timestamp"] > cutoff
-        ]
+        window.extend(samples)
+        if self.store is not None:
+            self.store.extend(currency, samples)
+        return len(samples)
 
     def get_iv_history(self, currency: str) -> List[float]:
         """Get historical IV values for a currency"""
-        if currency not in self.iv_history:
-            return []
-
-        return [item["iv"] for item in self.iv_history[currency]]
+        return self.get_iv_window(currency).values()
 
     def should_enter_position(self, currency: str, current_iv: float,
                              min_iv_threshold: float = None,
@@ -155,7 +207,7 @@ class VolatilityAnalyzer:
         Returns:
             Tuple of (should_enter, reason)
         """
-        iv_history = self.get_iv_history(currency)
+        iv_history = self.get_iv_window(currency)
 
         # Check absolute IV threshold
         if min_iv_threshold and current_iv < min_iv_threshold:
@@ -206,3 +258,199 @@ class VolatilityAnalyzer:
             "max": round(max(iv_history), 4),
             "count": len(iv_history)
         }
+
+    def iv_rv_spread(self, current_iv: float, realized_vol: float) -> float:
+        """
+        Implied minus realized volatility in vol points
+
+        Args:
+            current_iv: Implied volatility in percent (as returned by get_atm_iv)
+            realized_vol: Annualized realized volatility as a fraction
+                          (as returned by realized_volatility / StreamingRealizedVol)
+
+        Returns:
+            IV - RV in vol points (positive = options priced above realized moves)
+        """
+        return round(current_iv - realized_vol * 100, 4)
+
+
+# Realized volatility
+#
+# Per-bar log terms (bar t needs the previous close):
+#   r  = ln(C / C_prev)                          close-to-close return
+#   o  = ln(O / C_prev)                          overnight (gap) return
+#   c  = ln(C / O)                               open-to-close return
+#   hl = ln(H / L)^2
+#   gk = 0.5 hl - (2 ln 2 - 1) c^2
+#   rs = ln(H / C) ln(H / O) + ln(L / C) ln(L / O)   (Rogers-Satchell)
+#
+# Per-bar variance over a window of n bars (var with n - 1 degrees of freedom):
+#   close_to_close = var(r)
+#   parkinson      = mean(hl) / (4 ln 2)
+#   garman_klass   = mean(gk)
+#   yang_zhang     = var(o) + k var(c) + (1 - k) mean(rs),  k = 0.34 / (1.34 + (n + 1) / (n - 1))
+#
+# Every estimator only needs window sums of the terms and their squares, so a
+# whole series is one cumulative sum and a live update is O(1) per bar.
+
+RV_ESTIMATORS = ("close_to_close", "parkinson", "garman_klass", "yang_zhang")
+
+_R, _O, _C, _HL, _GK, _RS = range(6)
+_LN2 = float(np.log(2.0))
+
+
+def bars_per_year(timeframe: str) -> float:
+    """Bars per year of an OHLCV timeframe (minutes or "1D"); crypto trades 24/7"""
+    if timeframe.upper() == "1D":
+        return 365.0
+    return 365.0 * 24 * 60 / float(timeframe)
+
+
+def _bar_terms(prev_close, open_, high, low, close) -> np.ndarray:
+    """Per-bar log terms (scalars or arrays), stacked in _R.._RS order"""
+    prev_close, o, h, l, c = (np.log(np.asarray(x, dtype=np.float64)) for x in (prev_close, open_, high, low, close))
+    co = c - o
+    hl = (h - l) ** 2
+    return np.stack([
+        c - prev_close,
+        o - prev_close,
+        co,
+        hl,
+        0.5 * hl - (2 * _LN2 - 1) * co ** 2,
+        (h - c) * (h - o) + (l - c) * (l - o),
+    ])
+
+
+def _variances(n: int, mean: np.ndarray, var: np.ndarray) -> Dict[str, np.ndarray]:
+    """Per-bar variance of each estimator from window means/variances of the terms"""
+    k = 0.34 / (1.34 + (n + 1) / (n - 1))
+    return {
+        "close_to_close": var[_R],
+        "parkinson": mean[_HL] / (4 * _LN2),
+        "garman_klass": mean[_GK],
+        "yang_zhang": var[_O] + k * var[_C] + (1 - k) * mean[_RS],
+    }
+
+
+def _ohlc_columns(ohlcv):
+    """open/high/low/close arrays from rows [ts, o, h, l, c, v] or columnar/structured OHLCV"""
+    if isinstance(ohlcv, (list, tuple)):
+        rows = np.asarray(ohlcv, dtype=np.float64).reshape(-1, 6)
+        return rows[:, 1], rows[:, 2], rows[:, 3], rows[:, 4]
+    return tuple(np.asarray(ohlcv[name], dtype=np.float64) for name in ("open", "high", "low", "close"))
+
+
+def realized_volatility(ohlcv, window: int = 20, periods_per_year: float = 365.0) -> Dict[str, np.ndarray]:
+    """
+    Rolling realized volatility of an OHLCV series with every estimator
+
+    Args:
+        ohlcv: Rows of [ts, o, h, l, c, v] or the columnar/structured output of
+               DeribitClient.get_ohlcv
+        window: Bars per estimate (at least 2)
+        periods_per_year: Bars per year for annualization (see bars_per_year)
+
+    Returns:
+        Dict of estimator name -> annualized volatility (fraction) per bar, same
+        length as the input; NaN until window + 1 bars are available
+    """
+    if window < 2:
+        raise ValueError("window must be at least 2")
+
+    open_, high, low, close = _ohlc_columns(ohlcv)
+    nan = np.full(len(close), np.nan)
+    if len(close) <= window:
+        return {name: nan.copy() for name in RV_ESTIMATORS}
+
+    terms = _bar_terms(close[:-1], open_[1:], high[1:], low[1:], close[1:])
+
+    # Window sums via cumulative sums; centering keeps the variances accurate
+    center = terms.mean(axis=1, keepdims=True)
+    centered = terms - center
+    zero = np.zeros((len(terms), 1))
+    s1 = np.concatenate((zero, np.cumsum(centered, axis=1)), axis=1)
+    s2 = np.concatenate((zero, np.cumsum(centered ** 2, axis=1)), axis=1)
+    s1 = s1[:, window:] - s1[:, :-window]
+    s2 = s2[:, window:] - s2[:, :-window]
+
+    mean = s1 / window + center
+    var = (s2 - s1 ** 2 / window) / (window - 1)
+
+    result = {}
+    for name, variance in _variances(window, mean, var).items():
+        vol = nan.copy()
+        vol[window:] = np.sqrt(np.maximum(variance, 0.0) * periods_per_year)
+        result[name] = vol
+    return result
+
+
+class StreamingRealizedVol:
+    """
+    Rolling realized volatility updated one completed bar at a time
+
+    Keeps the last `window` bar terms and their running sums, so each update
+    and each estimate is O(1) regardless of the window length. Estimates match
+    realized_volatility() on the same bars.
+    """
+
+    def __init__(self, window: int = 20, periods_per_year: float = 365.0):
+        """
+        Initialize streaming estimator
+
+        Args:
+            window: Bars per estimate (at least 2)
+            periods_per_year: Bars per year for annualization (see bars_per_year)
+        """
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        self.window = window
+        self.periods_per_year = periods_per_year
+        self._terms = deque()
+        self._sum = np.zeros(6)
+        self._sum_sq = np.zeros(6)
+        self._prev_close: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    @property
+    def ready(self) -> bool:
+        """True once the window is full"""
+        return len(self._terms) == self.window
+
+    def update(self, open_: float, high: float, low: float, close: float):
+        """Add a completed bar (the first bar only provides the previous close)"""
+        if self._prev_close is not None:
+            terms = _bar_terms(self._prev_close, open_, high, low, close)
+            self._terms.append(terms)
+            self._sum += terms
+            self._sum_sq += terms ** 2
+            if len(self._terms) > self.window:
+                old = self._terms.popleft()
+                self._sum -= old
+                self._sum_sq -= old ** 2
+        self._prev_close = close
+
+    def seed(self, ohlcv):
+        """Feed historical bars (rows or columnar OHLCV), oldest first"""
+        for bar in zip(*_ohlc_columns(ohlcv)):
+            self.update(*bar)
+
+    def values(self) -> Dict[str, Optional[float]]:
+        """Annualized volatility (fraction) per estimator, None until the window is full"""
+        if not self.ready:
+            return {name: None for name in RV_ESTIMATORS}
+
+        n = self.window
+        mean = self._sum / n
+        var = (self._sum_sq - self._sum ** 2 / n) / (n - 1)
+        return {
+            name: float(np.sqrt(max(variance, 0.0) * self.periods_per_year))
+            for name, variance in _variances(n, mean, var).items()
+        }
+
+    def value(self, estimator: str = "yang_zhang") -> Optional[float]:
+        """Annualized volatility (fraction) of one estimator, None until the window is full"""
+        if estimator not in RV_ESTIMATORS:
+            raise ValueError(f"Unknown estimator: {estimator}")
+        return self.values()[estimator]
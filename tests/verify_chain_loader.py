@@ -0,0 +1,78 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+import time
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.chain_loader import OptionsChainLoader
+from src.core.instrument_registry import InstrumentRegistry, expiry_label
+from src.strategies.iron_condor import IronCondorBuilder
+from src.utils.pricing import SECONDS_PER_YEAR, black76_greeks
+
+SPOT = 50000.0
+
+
+class TestDeltaBandChain(unittest.TestCase):
+
+    def setUp(self):
+        self.expiry_ms = int((time.time() + 7 * 86400) * 1000)
+        self.expiration = expiry_label(self.expiry_ms)
+        self.instruments = [
+            {
+                "instrument_name": f"BTC-{self.expiration}-{strike}-{option_type[0].upper()}",
+                "expiration_timestamp": self.expiry_ms,
+                "strike": float(strike),
+                "option_type": option_type,
+                "tick_size": 0.0005,
+                "contract_size": 1.0
+            }
+            for strike in range(20000, 80001, 500) for option_type in ("put", "call")
+        ]
+        self.by_name = {inst["instrument_name"]: inst for inst in self.instruments}
+
+        self.client = MagicMock()
+        self.client.get_instruments.return_value = self.instruments
+        self.client.get_ticker.side_effect = self.ticker
+        self.loader = OptionsChainLoader(self.client, InstrumentRegistry(self.client))
+
+    def ticker(self, instrument_name):
+        """Exchange view: skewed smile the ATM-only estimate does not know about"""
+        inst = self.by_name[instrument_name]
+        years = (self.expiry_ms / 1000 - time.time()) / SECONDS_PER_YEAR
+        iv = 0.6 - 0.5 * np.log(inst["strike"] / SPOT)
+        greeks = black76_greeks(SPOT, inst["strike"], years, iv, inst["option_type"] == "call")
+        return {
+            "mark_price": float(greeks["price"]) / SPOT,
+            "mark_iv": iv * 100,
+            "underlying_price": SPOT,
+            "greeks": {"delta": float(greeks["delta"])}
+        }
+
+    def full_chain(self):
+        return [dict(inst, **self.ticker(inst["instrument_name"])) for inst in self.instruments]
+
+    def test_band_builds_same_condor_with_few_requests(self):
+        options = self.loader.get_band_chain("BTC", self.expiration, SPOT, 0.6,
+                                             short_deltas=[0.12], wing_widths=[0.05], delta_band=0.05)
+        self.assertTrue(options)
+        self.assertLessEqual(self.client.get_ticker.call_count, 30)
+
+        builder = IronCondorBuilder(short_delta_target=0.12, wing_width_percent=0.05)
+        banded = builder.build_condor("BTC", options, SPOT, self.expiration, risk_per_condor=100)
+        full = builder.build_condor("BTC", self.full_chain(), SPOT, self.expiration, risk_per_condor=100)
+        for leg in ("short_put", "long_put", "short_call", "long_call"):
+            self.assertEqual(getattr(banded, leg).instrument_name, getattr(full, leg).instrument_name)
+
+    def test_missed_estimate_returns_empty(self):
+        options = self.loader.get_band_chain("BTC", self.expiration, SPOT, 3.0,
+                                             short_deltas=[0.12], wing_widths=[0.05], delta_band=0.02)
+        self.assertEqual(len(options), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
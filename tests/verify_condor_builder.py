@@ -0,0 +1,92 @@
+import unittest
+import random
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.options_chain import OptionsChain
+from src.strategies.iron_condor import IronCondorBuilder
+from src.strategies.condor_grid import CondorGridEngine
+
+
+def synthetic_chain(rng: random.Random, n_strikes: int, spot: float = 50000.0):
+    """Calls and puts with noisy deltas, shuffled, with some duplicate strikes and missing greeks"""
+    options = []
+    for i in range(n_strikes):
+        strike = spot * 0.5 + i * rng.choice([100, 250, 500])
+        moneyness = (strike - spot) / spot
+        call_delta = max(0.001, min(0.999, 0.5 - moneyness * 2 + rng.uniform(-0.02, 0.02)))
+        for option_type, delta in (("call", call_delta), ("put", call_delta - 1.0)):
+            option = {
+                "instrument_name": f"BTC-TEST-{strike:.0f}-{option_type[0].upper()}-{i}",
+                "strike": strike,
+                "option_type": option_type,
+                "mark_price": round(abs(delta) * 0.1, 4),
+                "greeks": {"delta": round(delta, 2)}
+            }
+            if rng.random() < 0.05:
+                option["greeks"] = {}
+            options.append(option)
+    rng.shuffle(options)
+    return options
+
+
+class TestVectorizedStrikeSelection(unittest.TestCase):
+
+    def assert_same_option(self, chain, row, expected):
+        if expected is None:
+            self.assertIsNone(row)
+        else:
+            self.assertEqual(chain.names[row], expected["instrument_name"])
+
+    def test_matches_list_builder(self):
+        rng = random.Random(7)
+        for trial in range(50):
+            options = synthetic_chain(rng, rng.randint(5, 300))
+            chain = OptionsChain.from_dicts(options)
+            builder = IronCondorBuilder(short_delta_target=rng.choice([0.08, 0.12, 0.2]),
+                                        wing_width_percent=rng.choice([0.0, 0.01, 0.05]))
+
+            for option_type, sign in (("put", -1), ("call", 1)):
+                target = sign * builder.short_delta_target
+                expected = builder.find_strike_by_delta(options, target, option_type)
+                self.assert_same_option(chain, builder.select_short_strike(chain, target, option_type), expected)
+
+                for short in rng.sample(options, 5):
+                    expected = builder.find_protective_strike(options, short["strike"], option_type, 50000.0)
+                    row = builder.select_wing_strike(chain, short["strike"], option_type, 50000.0)
+                    self.assert_same_option(chain, row, expected)
+
+    def test_build_condor_identical(self):
+        rng = random.Random(11)
+        options = synthetic_chain(rng, 2000)
+        builder = IronCondorBuilder()
+        condor = builder.build_condor("BTC", options, 50000.0, "TEST", risk_per_condor=100)
+        self.assertIsNotNone(condor)
+
+        short_put = builder.find_strike_by_delta(options, -0.12, "put")
+        long_put = builder.find_protective_strike(options, short_put["strike"], "put", 50000.0)
+        self.assertEqual(condor.short_put.instrument_name, short_put["instrument_name"])
+        self.assertEqual(condor.long_put.instrument_name, long_put["instrument_name"])
+
+
+    def test_grid_matches_builder(self):
+        rng = random.Random(3)
+        options = synthetic_chain(rng, 400)
+        engine = CondorGridEngine([0.08, 0.12, 0.2], [0.03, 0.05])
+        candidates = engine.rank({"TEST": (7, options)}, 50000.0)
+        self.assertTrue(candidates)
+        self.assertEqual([c.score for c in candidates], sorted((c.score for c in candidates), reverse=True))
+
+        for candidate in candidates:
+            builder = IronCondorBuilder(candidate.short_delta, candidate.wing_width_percent)
+            condor = builder.build_condor("BTC", options, 50000.0, "TEST", risk_per_condor=100)
+            self.assertEqual(condor.short_put.instrument_name, candidate.short_put["instrument_name"])
+            self.assertEqual(condor.long_call.instrument_name, candidate.long_call["instrument_name"])
+            self.assertAlmostEqual(condor.credit_received / condor.size, candidate.credit)
+
+
+if __name__ == '__main__':
+    unittest.main()
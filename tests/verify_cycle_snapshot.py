@@ -0,0 +1,89 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.cycle_snapshot import CycleSnapshotProvider
+from src.core.position_monitor import PositionMonitor
+from src.core.risk_manager import RiskManager
+from src.strategies.iron_condor import IronCondor, OptionLeg
+
+EXPIRY = (datetime.now() + timedelta(days=7)).strftime("%d%b%y").upper()
+
+
+def condor(condor_id, short_put, short_call):
+    legs = [OptionLeg(f"BTC-{EXPIRY}-{strike}-{t[0].upper()}", float(strike), t, d, 0.1, 0.002, 50.0)
+            for strike, t, d in ((40000, "put", "buy"), (short_put, "put", "sell"),
+                                 (short_call, "call", "sell"), (60000, "call", "buy"))]
+    return IronCondor(condor_id, "BTC", EXPIRY, 50000.0, datetime.now(), *legs,
+                      credit_received=400.0, max_loss=600.0, max_profit=400.0, size=1.0,
+                      take_profit_target=220.0, stop_loss_target=-480.0)
+
+
+class TestCycleSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 1000.0
+        self.client = MagicMock()
+        self.client.get_index_price.side_effect = lambda currency: {"BTC": 50000.0, "ETH": 2500.0}[currency]
+        self.client.get_account_summary.return_value = {"equity": 1.0}
+        self.client.get_order_book.side_effect = lambda name, depth=5: {"mark_price": 0.002}
+
+        self.monitor = PositionMonitor(self.client, MagicMock())
+        self.monitor.add_condor(condor("c0", 45000, 55000))
+        self.risk_manager = RiskManager(self.client, self.monitor, initial_equity=10000.0)
+        self.provider = CycleSnapshotProvider(self.client, self.monitor, self.risk_manager,
+                                              max_age=10.0, clock=lambda: self.now)
+        self.risk_manager.cycle_snapshots = self.provider
+        self.monitor.cycle_snapshots = self.provider
+
+    def api_calls(self):
+        return (self.client.get_index_price.call_count + self.client.get_account_summary.call_count
+                + self.client.get_order_book.call_count)
+
+    def test_components_share_one_fetch_per_cycle(self):
+        snapshot = self.provider.build()
+        # 2 index prices, 2 account summaries, 4 legs
+        self.assertEqual(self.api_calls(), 8)
+        self.assertEqual(snapshot.equity, 52500.0)
+        self.assertEqual(snapshot.exposure, 600.0)
+
+        summary = self.risk_manager.get_risk_summary()
+        self.assertTrue(self.risk_manager.can_open_new_position()[0])
+        self.risk_manager.validate_trade(500.0)
+        self.monitor.get_portfolio_summary()
+        self.assertEqual(self.api_calls(), 8)
+        self.assertEqual(summary["equity"], 52500.0)
+        self.assertEqual(summary["total_pnl"], snapshot.total_pnl)
+
+    def test_manage_cycle_fetches_only_marks(self):
+        snapshot = self.provider.build(include_equity=False)
+        # 1 index price, 4 legs: no account requests
+        self.assertEqual(self.api_calls(), 5)
+        self.assertIsNone(snapshot.equity)
+        self.monitor.monitor_positions()
+        self.assertEqual(self.api_calls(), 5)
+
+        self.monitor.open_condors.clear()
+        self.provider.build(include_equity=False)
+        self.assertEqual(self.api_calls(), 5)
+
+    def test_stale_snapshot_falls_back_to_live_requests(self):
+        self.provider.build()
+        self.now += 11.0
+        self.assertIsNone(self.provider.current())
+        self.risk_manager.get_total_equity()
+        self.assertEqual(self.client.get_account_summary.call_count, 4)
+
+        # A new position invalidates exposure and P&L
+        self.provider.build()
+        self.monitor.add_condor(condor("c1", 44000, 56000))
+        self.assertIsNone(self.provider.current())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+import time
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.instrument_registry import InstrumentRegistry, expiry_label
+
+DAY_MS = 24 * 3600 * 1000
+
+
+def make_instruments(expiry_ms, strikes):
+    instruments = []
+    for strike in strikes:
+        for option_type in ("put", "call"):
+            instruments.append({
+                "instrument_name": f"BTC-{expiry_ms}-{strike}-{option_type[0].upper()}",
+                "expiration_timestamp": expiry_ms,
+                "strike": strike,
+                "option_type": option_type,
+                "tick_size": 0.0005,
+                "contract_size": 1.0
+            })
+    return instruments
+
+
+class TestInstrumentRegistry(unittest.TestCase):
+
+    def setUp(self):
+        now_ms = int(time.time() * 1000)
+        self.near = now_ms + 3 * DAY_MS + 3600 * 1000
+        self.far = now_ms + 8 * DAY_MS + 3600 * 1000
+        self.instruments = (make_instruments(self.far, [60000, 40000, 50000])
+                            + make_instruments(self.near, [45000, 55000]))
+        self.client = MagicMock()
+        self.client.get_instruments.return_value = self.instruments
+        self.registry = InstrumentRegistry(self.client)
+        self.registry.refresh("BTC")
+
+    def test_expiries_in_dte(self):
+        self.assertEqual(self.registry.expiries_in_dte("BTC", 7, 10), [(expiry_label(self.far), 8)])
+        self.assertEqual(len(self.registry.expiries_in_dte("BTC", 0, 30)), 2)
+
+    def test_strikes_sorted_per_expiry(self):
+        label = expiry_label(self.far)
+        self.assertEqual(list(self.registry.strikes("BTC", label)), [40000, 50000, 60000])
+        self.assertEqual(list(self.registry.strikes_around("BTC", label, 52000, count=1)), [50000, 60000])
+
+        puts = self.registry.instruments_for_expiry("BTC", label, "put")
+        self.assertEqual([p["strike"] for p in puts], [40000, 50000, 60000])
+        self.assertTrue(all(p["option_type"] == "put" for p in puts))
+
+    def test_incremental_refresh(self):
+        # Same list again: nothing is re-parsed
+        table = self.registry._tables["BTC"]
+        self.registry.refresh("BTC")
+        self.assertIs(self.registry._tables["BTC"], table)
+
+        # A newly listed strike is picked up
+        self.client.get_instruments.return_value = self.instruments + make_instruments(self.near, [65000])
+        self.registry.refresh("BTC")
+        self.assertIn(65000, list(self.registry.strikes("BTC", expiry_label(self.near))))
+
+    def test_expired_instruments_are_dropped(self):
+        expired = make_instruments(int(time.time() * 1000) - DAY_MS, [50000])
+        self.registry.refresh("BTC", self.instruments + expired)
+        self.assertIsNone(self.registry.get(expired[0]["instrument_name"]))
+        self.assertEqual(self.registry.stats()["BTC"]["expiries"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
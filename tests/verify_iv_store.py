@@ -0,0 +1,86 @@
+import unittest
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.iv_backfill import backfill_iv_history
+from src.utils.iv_store import IVHistoryStore, RECORD_DTYPE
+from src.utils.volatility import VolatilityAnalyzer
+
+
+class TestIVHistoryStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = IVHistoryStore(self.tmp.name)
+        self.now = datetime.now().replace(microsecond=0)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_append_and_load_window(self):
+        for days in (40, 20, 10, 1):
+            self.assertTrue(self.store.append("BTC", 50.0 + days, self.now - timedelta(days=days)))
+        # Not newer than the last sample: skipped
+        self.assertFalse(self.store.append("BTC", 99.0, self.now - timedelta(days=5)))
+
+        self.assertEqual(os.path.getsize(self.store.path("BTC")), 4 * RECORD_DTYPE.itemsize)
+        records = self.store.load("BTC", since=self.now - timedelta(days=30))
+        self.assertEqual(records["iv"].tolist(), [70.0, 60.0, 51.0])
+        self.assertEqual(self.store.last_timestamp("BTC"), self.now - timedelta(days=1))
+        self.assertEqual(len(self.store.load("ETH")), 0)
+
+    def test_partial_record_is_truncated(self):
+        self.store.append("BTC", 55.0, self.now)
+        with open(self.store.path("BTC"), "ab") as f:
+            f.write(b"\x01\x02\x03")
+
+        store = IVHistoryStore(self.tmp.name)
+        self.assertEqual(store.load("BTC")["iv"].tolist(), [55.0])
+        self.assertTrue(store.append("BTC", 56.0, self.now + timedelta(seconds=1)))
+        self.assertEqual(store.load("BTC")["iv"].tolist(), [55.0, 56.0])
+
+    def test_analyzer_history_survives_restart(self):
+        analyzer = VolatilityAnalyzer(lookback_days=30, store=self.store)
+        for i in range(6):
+            analyzer.update_iv_history("ETH", 60.0 + i, self.now - timedelta(hours=6 - i))
+
+        restarted = VolatilityAnalyzer(lookback_days=30, store=IVHistoryStore(self.tmp.name))
+        self.assertEqual(restarted.get_iv_history("ETH"), [60.0, 61.0, 62.0, 63.0, 64.0, 65.0])
+
+    def test_backfill_fills_window_and_store_once(self):
+        hour_ms = 3_600_000
+        end_ms = int(self.now.timestamp() * 1000)
+        candles = [[end_ms - h * hour_ms, 0, 0, 0, 50.0 + h % 10] for h in range(48, 0, -1)]
+        client = MagicMock()
+        client.get_volatility_index_data.side_effect = lambda currency, **kwargs: (
+            [c for c in candles if c[0] > kwargs["start_timestamp"]] if currency == "BTC" else [])
+        client.get_historical_volatility.return_value = [[end_ms - hour_ms, 40.0]]
+
+        analyzer = VolatilityAnalyzer(lookback_days=30, store=self.store)
+        self.assertEqual(backfill_iv_history(client, analyzer, ["BTC", "ETH"]), {"BTC": 48, "ETH": 1})
+        self.assertEqual(len(analyzer.get_iv_history("BTC")), 48)
+        self.assertEqual(analyzer.get_iv_history("ETH"), [40.0])
+
+        # Already filled: nothing new to add, nothing written twice
+        restarted = VolatilityAnalyzer(lookback_days=30, store=IVHistoryStore(self.tmp.name))
+        self.assertEqual(backfill_iv_history(client, restarted, ["BTC"]), {"BTC": 0})
+        self.assertEqual(len(self.store.load("BTC")), 48)
+
+
+    def test_backfill_falls_back_when_dvol_raises(self):
+        client = MagicMock()
+        client.get_volatility_index_data.side_effect = ConnectionError("DVOL unavailable")
+        client.get_historical_volatility.return_value = [[int(self.now.timestamp() * 1000) - 3_600_000, 40.0]]
+
+        analyzer = VolatilityAnalyzer(lookback_days=30, store=self.store)
+        self.assertEqual(backfill_iv_history(client, analyzer, ["BTC"]), {"BTC": 1})
+        self.assertEqual(analyzer.get_iv_history("BTC"), [40.0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.options_chain import OptionsChain
+
+NEAR = 1_800_000_000_000
+FAR = 1_800_600_000_000
+
+
+def instruments():
+    """Sorted like InstrumentRegistry: expiry, option type, strike"""
+    return [
+        {"instrument_name": f"BTC-{ts}-{strike}-{option_type[0].upper()}",
+         "expiration_timestamp": ts, "strike": float(strike), "option_type": option_type}
+        for ts in (NEAR, FAR) for option_type in ("call", "put") for strike in (40000, 50000, 60000)
+    ]
+
+
+class TestOptionsChain(unittest.TestCase):
+
+    def setUp(self):
+        self.chain = OptionsChain.from_instruments(instruments())
+
+    def test_views_are_slices_of_the_chain(self):
+        puts = self.chain.view(FAR, "put")
+        self.assertEqual(list(puts.strikes), [40000, 50000, 60000])
+        self.assertTrue(np.shares_memory(puts.marks, self.chain.marks))
+
+        tick = {"instrument_name": f"BTC-{FAR}-50000-P", "mark_price": 0.02, "mark_iv": 55.0,
+                "best_bid_price": 0.019, "greeks": {"delta": -0.4, "vega": 12.0}}
+        self.assertTrue(puts.update_tick(tick))
+        row = self.chain.row(f"BTC-{FAR}-50000-P")
+        self.assertEqual(self.chain.marks[row], 0.02)
+        self.assertEqual(self.chain.deltas[row], -0.4)
+        self.assertTrue(np.isnan(self.chain.gammas[row]))
+        self.assertFalse(self.chain.update_tick({"instrument_name": "ETH-X"}))
+
+    def test_round_trip_through_dicts(self):
+        self.chain.update_tick({"instrument_name": f"BTC-{NEAR}-60000-C", "mark_price": 0.01,
+                                "mark_iv": 60.0, "underlying_price": 50100.0, "greeks": {"delta": 0.2}})
+        options = self.chain.to_dicts()
+        again = OptionsChain.from_dicts(options)
+        self.assertEqual(again.to_dicts(), options)
+        self.assertEqual(options[2]["greeks"], {"delta": 0.2})
+        self.assertIsNone(options[0]["underlying_price"])
+
+    def test_unsorted_chain_view_is_a_copy(self):
+        chain = OptionsChain.from_dicts(list(reversed(instruments())))
+        calls = chain.view(option_type="call")
+        self.assertEqual(len(calls), 6)
+        self.assertFalse(np.shares_memory(calls.marks, chain.marks))
+
+
+if __name__ == '__main__':
+    unittest.main()
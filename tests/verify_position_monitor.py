@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.position_monitor import PositionMonitor
+from src.strategies.iron_condor import IronCondor, OptionLeg
+
+EXPIRY = (datetime.now() + timedelta(days=7)).strftime("%d%b%y").upper()
+
+
+def leg(strike, option_type, direction, mark_price):
+    name = f"BTC-{EXPIRY}-{strike}-{option_type[0].upper()}"
+    return OptionLeg(name, float(strike), option_type, direction, 0.1, mark_price, 50.0)
+
+
+def condor(condor_id, short_put, short_call):
+    """Condors share their wings so instruments repeat across positions"""
+    return IronCondor(
+        id=condor_id, currency="BTC", expiration_date=EXPIRY, spot_price=50000.0,
+        entry_time=datetime.now(),
+        long_put=leg(40000, "put", "buy", 0.001), short_put=leg(short_put, "put", "sell", 0.005),
+        short_call=leg(short_call, "call", "sell", 0.005), long_call=leg(60000, "call", "buy", 0.001),
+        credit_received=400.0, max_loss=600.0, max_profit=400.0, size=1.0,
+        take_profit_target=220.0, stop_loss_target=-480.0
+    )
+
+
+class TestPositionMonitor(unittest.TestCase):
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.get_index_price.return_value = 50000.0
+        self.client.get_order_book.side_effect = lambda name, depth=5: {"mark_price": 0.002}
+        self.monitor = PositionMonitor(self.client, MagicMock())
+        for i, (short_put, short_call) in enumerate([(45000, 55000), (45000, 56000), (44000, 55000)]):
+            self.monitor.add_condor(condor(f"c{i}", short_put, short_call))
+
+    def test_snapshot_fetches_each_instrument_once(self):
+        snapshot = self.monitor.get_valuation_snapshot()
+        # 2 wings + 2 short puts + 2 short calls, one index price
+        self.assertEqual(self.client.get_order_book.call_count, 6)
+        self.assertEqual(self.client.get_index_price.call_count, 1)
+
+        pnls = [self.monitor.get_condor_pnl(c, snapshot) for c in self.monitor.open_condors.values()]
+        self.assertEqual(self.client.get_order_book.call_count, 6)
+        # All legs marked at 0.002: long and short legs cancel out
+        self.assertEqual(pnls, [400.0, 400.0, 400.0])
+
+    def test_monitor_cycle_fetches_once(self):
+        # Legs worth nothing: every condor is at its take profit
+        self.client.get_order_book.side_effect = lambda name, depth=5: {"mark_price": 0.0}
+        stats = self.monitor.monitor_positions(close_before_expiry_hours=24)
+        self.assertEqual(stats["closed_tp"], 3)
+        self.assertEqual(self.client.get_order_book.call_count, 6)
+        self.assertEqual(self.monitor.get_open_condor_count(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.pricing import black76_price, black76_greeks, implied_volatility
+
+
+class TestPricing(unittest.TestCase):
+
+    def setUp(self):
+        self.forward = 50000.0
+        self.strikes = np.linspace(30000, 70000, 41)
+        self.years = 7 / 365
+        self.iv = np.linspace(0.9, 0.5, 41)
+
+    def test_put_call_parity(self):
+        calls = black76_price(self.forward, self.strikes, self.years, self.iv, True)
+        puts = black76_price(self.forward, self.strikes, self.years, self.iv, False)
+        np.testing.assert_allclose(calls - puts, self.forward - self.strikes, atol=1e-6)
+
+    def test_greeks_match_finite_differences(self):
+        greeks = black76_greeks(self.forward, self.strikes, self.years, self.iv, True)
+        h = 0.01
+        up = black76_price(self.forward + h, self.strikes, self.years, self.iv, True)
+        down = black76_price(self.forward - h, self.strikes, self.years, self.iv, True)
+        np.testing.assert_allclose(greeks["delta"], (up - down) / (2 * h), atol=1e-6)
+
+        vol_up = black76_price(self.forward, self.strikes, self.years, self.iv + 0.0001, True)
+        vol_down = black76_price(self.forward, self.strikes, self.years, self.iv - 0.0001, True)
+        np.testing.assert_allclose(greeks["vega"], (vol_up - vol_down) / 0.0002 / 100, rtol=1e-5, atol=1e-8)
+
+    def test_implied_volatility_round_trip(self):
+        is_call = self.strikes >= self.forward
+        prices = black76_price(self.forward, self.strikes, self.years, self.iv, is_call)
+        solved = implied_volatility(prices, self.forward, self.strikes, self.years, is_call)
+        np.testing.assert_allclose(solved, self.iv, atol=1e-6)
+
+    def test_unusable_inputs_give_nan(self):
+        self.assertTrue(np.isnan(implied_volatility(0.0, self.forward, 50000.0, self.years, True)))
+        self.assertTrue(np.isnan(black76_greeks(self.forward, 50000.0, 0.0, 0.5, True)["delta"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
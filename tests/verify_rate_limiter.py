@@ -0,0 +1,67 @@
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.rate_limiter import CreditRateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCreditRateLimiter(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        # Burst of 4 requests, refill 2 requests/s in both pools
+        self.limiter = CreditRateLimiter(
+            non_matching_max=2000, non_matching_refill=1000,
+            matching_max=2000, matching_refill=1000,
+            cost=500, clock=self.clock
+        )
+
+    def test_burst_is_not_delayed(self):
+        waits = [self.limiter.reserve("/public/get_order_book") for _ in range(4)]
+        self.assertEqual(waits, [0.0, 0.0, 0.0, 0.0])
+
+    def test_delays_only_when_credits_exhausted(self):
+        for _ in range(4):
+            self.limiter.reserve("/public/get_order_book")
+        self.assertAlmostEqual(self.limiter.reserve("/public/get_order_book"), 0.5)
+        self.assertAlmostEqual(self.limiter.reserve("/public/get_order_book"), 1.0)
+
+        # After the refill catches up, requests go straight through again
+        self.clock.now = 10.0
+        self.assertEqual(self.limiter.reserve("/public/get_order_book"), 0.0)
+
+    def test_pools_are_independent(self):
+        for _ in range(4):
+            self.limiter.reserve("/public/get_order_book")
+        self.assertEqual(self.limiter.reserve("/private/buy"), 0.0)
+
+    def test_rate_limited_backs_off_exponentially(self):
+        first = self.limiter.on_rate_limited("/private/buy")
+        second = self.limiter.on_rate_limited("/private/buy")
+        self.assertEqual(second, first * 2)
+        self.assertGreaterEqual(self.limiter.reserve("/private/buy"), second)
+
+        self.limiter.on_success("/private/buy")
+        self.assertEqual(self.limiter.on_rate_limited("/private/buy"), first)
+
+    def test_headroom(self):
+        self.limiter.reserve("/public/get_order_book")
+        headroom = self.limiter.headroom()
+        self.assertEqual(headroom["non_matching"]["requests"], 3)
+        self.assertEqual(headroom["non_matching"]["pct"], 75.0)
+        self.assertEqual(headroom["matching"]["pct"], 100.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
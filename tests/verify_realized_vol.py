@@ -0,0 +1,68 @@
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.volatility import (
+    RV_ESTIMATORS, StreamingRealizedVol, bars_per_year, realized_volatility
+)
+
+SIGMA = 0.6  # Annualized
+BARS_PER_YEAR = bars_per_year("60")
+
+
+def hourly_bars(n=500, seed=7):
+    """OHLCV rows of a driftless GBM sampled every minute, aggregated to hours"""
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(0.0, SIGMA / np.sqrt(BARS_PER_YEAR * 60), n * 60)
+    path = 50000.0 * np.exp(np.cumsum(steps)).reshape(n, 60)
+    opens = np.concatenate(([50000.0], path[:-1, -1]))
+    highs = np.maximum(path.max(axis=1), opens)
+    lows = np.minimum(path.min(axis=1), opens)
+    return [[i * 3_600_000, o, h, l, c, 1.0] for i, (o, h, l, c) in enumerate(zip(opens, highs, lows, path[:, -1]))]
+
+
+class TestRealizedVol(unittest.TestCase):
+
+    def setUp(self):
+        self.bars = hourly_bars()
+        self.window = 48
+
+    def test_estimators_track_true_volatility(self):
+        rv = realized_volatility(self.bars, self.window, BARS_PER_YEAR)
+        for name in RV_ESTIMATORS:
+            self.assertEqual(len(rv[name]), len(self.bars))
+            self.assertTrue(np.isnan(rv[name][self.window - 1]))
+            self.assertAlmostEqual(float(np.nanmean(rv[name])), SIGMA, delta=0.1, msg=name)
+
+    def test_yang_zhang_matches_direct_formula(self):
+        rows = np.asarray(self.bars)[-(self.window + 1):]
+        o, h, l, c = (np.log(rows[:, i]) for i in (1, 2, 3, 4))
+        overnight = o[1:] - c[:-1]
+        open_close = c[1:] - o[1:]
+        rs = (h[1:] - c[1:]) * (h[1:] - o[1:]) + (l[1:] - c[1:]) * (l[1:] - o[1:])
+        n = self.window
+        k = 0.34 / (1.34 + (n + 1) / (n - 1))
+        expected = np.sqrt((overnight.var(ddof=1) + k * open_close.var(ddof=1) + (1 - k) * rs.mean()) * BARS_PER_YEAR)
+
+        rv = realized_volatility(self.bars, self.window, BARS_PER_YEAR)
+        self.assertAlmostEqual(rv["yang_zhang"][-1], expected, places=10)
+
+    def test_streaming_matches_vectorized(self):
+        stream = StreamingRealizedVol(self.window, BARS_PER_YEAR)
+        stream.seed(self.bars[:self.window])
+        self.assertIsNone(stream.value())
+
+        rv = realized_volatility(self.bars, self.window, BARS_PER_YEAR)
+        for bar in self.bars[self.window:]:
+            stream.update(*bar[1:5])
+        for name in RV_ESTIMATORS:
+            self.assertAlmostEqual(stream.value(name), rv[name][-1], places=8, msg=name)
+
+
+if __name__ == '__main__':
+    unittest.main()
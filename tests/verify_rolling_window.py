@@ -0,0 +1,52 @@
+import unittest
+import random
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.rolling_window import RollingWindow
+
+
+class TestRollingWindow(unittest.TestCase):
+
+    def test_matches_list_rebuild(self):
+        """Same samples, min/max and percentiles as the rebuild-and-scan implementation"""
+        rng = random.Random(5)
+        lookback = timedelta(hours=1)
+        window = RollingWindow(lookback)
+        history = []
+        now = datetime(2025, 1, 1)
+
+        for _ in range(3000):
+            now += timedelta(seconds=rng.randint(1, 30))
+            # Some late samples arrive out of order
+            timestamp = now - timedelta(seconds=rng.randint(0, 120)) if rng.random() < 0.05 else now
+            iv = round(rng.uniform(40, 90), 1)
+
+            history.append({"timestamp": timestamp, "iv": iv})
+            history = [item for item in history if item["timestamp"] > now - lookback]
+            window.add(timestamp, iv, now=now)
+
+            values = [item["iv"] for item in history]
+            self.assertEqual(len(window), len(values))
+            self.assertEqual(sorted(window.values()), sorted(values))
+            self.assertEqual((window.min(), window.max()), (min(values), max(values)))
+
+            probe = round(rng.uniform(40, 90), 1)
+            below = sum(1 for v in values if v < probe)
+            self.assertEqual(window.percentile(probe), (below / len(values)) * 100)
+
+    def test_evict_drops_expired_samples(self):
+        start = datetime(2025, 1, 1)
+        window = RollingWindow(timedelta(days=30))
+        window.extend([(start, 50.0), (start + timedelta(days=10), 60.0)], now=start + timedelta(days=11))
+        self.assertEqual(window.evict(now=start + timedelta(days=35)), 1)
+        self.assertEqual(window.values(), [60.0])
+        self.assertEqual(window.count_below(70.0), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,13 +2,15 @@ import unittest
 from unittest.mock import MagicMock, patch
 import sys
 import os
+import time
 from datetime import datetime
 
 # Add src to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from config import IronCondorConfig, SmartMoneyConfig
-from src.strategies.iron_condor import IronCondorStrategy
+from src.core.options_chain import OptionsChain
+from src.strategies.iron_condor import IronCondor, IronCondorStrategy, OptionLeg
 from src.strategies.smart_money import SmartMoneyStrategy
 
 class TestStrategies(unittest.TestCase):
@@ -46,7 +48,80 @@ class TestStrategies(unittest.TestCase):
         
         signals = strategy.scan()
         print(f"Signals found: {len(signals)}")
-        self.assertEqual(len(signals), 0) 
+        self.assertEqual(len(signals), 0)
+
+    def test_iron_condor_scan_merges_in_config_order(self):
+        config = IronCondorConfig(name="Iron Condor Test", currencies=["BTC", "ETH", "SOL"])
+        strategy = IronCondorStrategy(self.mock_client, config, self.dependencies)
+
+        def scan_currency(currency):
+            # First currency finishes last
+            time.sleep({"BTC": 0.05, "ETH": 0.0, "SOL": 0.02}[currency])
+            return None if currency == "ETH" else {"type": "iron_condor", "currency": currency}
+
+        with patch.object(strategy, "_scan_currency", side_effect=scan_currency):
+            signals = strategy.scan()
+
+        self.assertEqual([s["currency"] for s in signals], ["BTC", "SOL"])
+
+    def test_iron_condor_confirms_estimated_legs(self):
+        config = IronCondorConfig(name="Iron Condor Test")
+        strategy = IronCondorStrategy(self.mock_client, config, self.dependencies)
+        strategy.chain_loader = MagicMock()
+
+        legs = [OptionLeg(f"BTC-27DEC24-{strike}-{t[0].upper()}", float(strike), t, d, delta, 0.01, 50.0)
+                for strike, t, d, delta in ((40000, "put", "buy", -0.05), (45000, "put", "sell", -0.12),
+                                            (55000, "call", "sell", 0.12), (60000, "call", "buy", 0.05))]
+        condor = IronCondor("c", "BTC", "27DEC24", 50000.0, datetime.now(), *legs,
+                            credit_received=400.0, max_loss=600.0, max_profit=400.0, size=1.0,
+                            take_profit_target=220.0, stop_loss_target=-480.0)
+        estimated = OptionsChain.from_dicts([
+            {"instrument_name": leg.instrument_name, "strike": leg.strike, "option_type": leg.option_type,
+             "greeks": {"delta": leg.delta}, "greeks_estimated": True} for leg in legs
+        ])
+
+        # Exchange greeks unavailable: no trade
+        strategy.chain_loader.confirm_legs.return_value = False
+        self.assertFalse(strategy._confirm_condor(condor, estimated))
+
+        # Confirmed short delta drifted away from the target: no trade
+        def drift(c):
+            c.short_call.delta = 0.25
+            return True
+        strategy.chain_loader.confirm_legs.side_effect = drift
+        self.assertFalse(strategy._confirm_condor(condor, estimated))
+
+        # Band chain already carries exchange greeks: no confirmation requests
+        condor.short_call.delta = 0.12
+        strategy.chain_loader.confirm_legs.reset_mock()
+        exchange = OptionsChain.from_dicts(estimated.to_dicts())
+        exchange.greeks_estimated[:] = False
+        self.assertTrue(strategy._confirm_condor(condor, exchange))
+        strategy.chain_loader.confirm_legs.assert_not_called()
+
+    def test_iron_condor_grid_scan_fetches_chains_once(self):
+        config = IronCondorConfig(name="Iron Condor Test", short_delta_grid=[0.1, 0.15])
+        strategy = IronCondorStrategy(self.mock_client, config, self.dependencies)
+        self.mock_client.get_index_price.return_value = 50000.0
+        strategy.instrument_registry = MagicMock()
+        strategy.instrument_registry.expiries_in_dte.return_value = [("27DEC24", 7.0), ("03JAN25", 14.0)]
+        chain = OptionsChain.from_dicts([{"instrument_name": "BTC-27DEC24-50000-C", "strike": 50000.0,
+                                          "option_type": "call", "greeks": {"delta": 0.5}}])
+        strategy.chain_loader = MagicMock()
+        strategy.chain_loader.get_chains.return_value = {"27DEC24": chain, "03JAN25": chain}
+        strategy.volatility_analyzer = MagicMock()
+        strategy.volatility_analyzer.get_atm_iv.return_value = 60.0
+        strategy.volatility_analyzer.should_enter_position.return_value = (True, "IV rank high")
+        strategy.grid_engine = MagicMock()
+        strategy.grid_engine.best.return_value = None
+
+        self.assertIsNone(strategy._scan_currency("BTC"))
+        strategy.chain_loader.get_chains.assert_called_once_with("BTC", ["27DEC24", "03JAN25"])
+        strategy.chain_loader.get_chain.assert_not_called()
+        self.assertIs(strategy.volatility_analyzer.get_atm_iv.call_args[0][0], chain)
+        strategy.grid_engine.best.assert_called_once_with(
+            {"27DEC24": (7.0, chain), "03JAN25": (14.0, chain)}, 50000.0
+        )
 
     @patch('src.strategies.smart_money.BinanceWhaleClient')
     def test_smart_money_scan(self, MockWhaleClient):
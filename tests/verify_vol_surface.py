@@ -0,0 +1,71 @@
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.pricing import SECONDS_PER_YEAR, black76_greeks
+from src.utils.vol_surface import VolSurface
+
+NOW = 1_700_000_000.0
+FORWARD = 50000.0
+
+
+def chain(expiration_timestamp, skew=-0.4, atm_iv=0.6):
+    """Calls and puts with a linear smile in log-moneyness (mark_iv in percent)"""
+    options = []
+    for strike in np.arange(30000, 70001, 1000, dtype=float):
+        iv = atm_iv + skew * np.log(strike / FORWARD)
+        for option_type in ("call", "put"):
+            options.append({
+                "strike": strike,
+                "option_type": option_type,
+                "expiration_timestamp": expiration_timestamp,
+                "underlying_price": FORWARD,
+                "mark_iv": iv * 100
+            })
+    return options
+
+
+class TestVolSurface(unittest.TestCase):
+
+    def setUp(self):
+        self.week = int((NOW + 7 * 86400) * 1000)
+        self.month = int((NOW + 28 * 86400) * 1000)
+        self.surface = VolSurface("BTC", clock=lambda: NOW)
+        self.surface.update(chain(self.week) + chain(self.month, atm_iv=0.5))
+
+    def test_smile_reproduces_marks(self):
+        self.assertAlmostEqual(self.surface.atm_iv(self.week), 0.6, places=10)
+        self.assertAlmostEqual(self.surface.iv(40000.0, self.week), 0.6 - 0.4 * np.log(0.8), places=10)
+        # Flat beyond the outer strikes
+        self.assertAlmostEqual(self.surface.iv(10000.0, self.week), self.surface.iv(30000.0, self.week))
+
+    def test_refits_only_changed_expiry(self):
+        self.assertEqual(self.surface.update(chain(self.week) + chain(self.month, atm_iv=0.5)), 0)
+        self.assertEqual(self.surface.update(chain(self.week, atm_iv=0.65) + chain(self.month, atm_iv=0.5)), 1)
+        self.assertAlmostEqual(self.surface.atm_iv(self.week), 0.65, places=10)
+        self.assertEqual(self.surface.stats()["refits"], 3)
+
+    def test_term_structure_interpolates_total_variance(self):
+        t1, t2 = 7 / 365, 28 / 365
+        years = 14 / 365
+        variance = 0.6 ** 2 * t1 + (0.5 ** 2 * t2 - 0.6 ** 2 * t1) * (years - t1) / (t2 - t1)
+        self.assertAlmostEqual(self.surface.atm_iv(years=years), np.sqrt(variance / years), places=8)
+
+    def test_iv_at_delta_matches_black76(self):
+        years = (self.week / 1000 - NOW) / SECONDS_PER_YEAR
+        for delta in (0.25, -0.25, 0.1):
+            strike, iv = self.surface.iv_at_delta(delta, self.week)
+            self.assertAlmostEqual(iv, self.surface.iv(strike, self.week), places=6)
+            greeks = black76_greeks(FORWARD, strike, years, iv, delta > 0)
+            self.assertAlmostEqual(float(greeks["delta"]), delta, places=4)
+
+        self.assertGreater(self.surface.skew(self.week), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()